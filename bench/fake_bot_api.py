@@ -0,0 +1,151 @@
+"""
+Local stand-in for the Telegram Bot API, for load-testing delivery.
+
+Point the bot at it with TELEGRAM_API_BASE=<server.base> (or
+Application.builder().base_url(f"{base}/bot")). Supports getMe,
+sendMessage, editMessageText, getChatMember and the webhook calls, and
+injects failures at configurable rates:
+
+    kick_rate    fraction of chats that answer 403 "bot was kicked" (sticky per chat)
+    flood_rate   fraction of sends that answer 429 with retry_after
+    member_rate  fraction of users getChatMember reports as channel members
+
+    python -m bench.fake_bot_api --port 8081 --kick-rate 0.05
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class FakeBotAPI:
+    def __init__(self, kick_rate: float = 0.0, flood_rate: float = 0.0, retry_after: int = 1,
+                 member_rate: float = 1.0, latency: float = 0.0, seed: int = 1, port: int = 0):
+        self.kick_rate = kick_rate
+        self.flood_rate = flood_rate
+        self.retry_after = retry_after
+        self.member_rate = member_rate
+        self.latency = latency  # seconds added to every call
+        self.seed = seed
+        self.port = port
+        self.calls = Counter()         # method -> count
+        self.sent = Counter()          # chat_id -> delivered messages
+        self.kicked_hits = Counter()   # chat_id -> 403s returned
+        self.floods = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._message_id = 0
+        self._server = None
+
+    @property
+    def base(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _sticky(self, key, rate: float) -> bool:
+        # Same answer for the same chat/user on every call, like the real thing
+        return random.Random(f"{self.seed}:{key}").random() < rate
+
+    def is_kicked(self, chat_id) -> bool:
+        return self._sticky(f"kick:{chat_id}", self.kick_rate)
+
+    def _next_message(self, chat_id, text) -> dict:
+        self._message_id += 1
+        return {"message_id": self._message_id, "date": int(time.time()),
+                "chat": {"id": int(chat_id), "type": "group", "title": f"chat {chat_id}"}, "text": text}
+
+    def handle(self, method: str, params: dict):
+        """(status, payload) for one Bot API call."""
+        with self._lock:
+            self.calls[method] += 1
+            if method == "getMe":
+                return 200, {"id": 1, "is_bot": True, "first_name": "FakeBot", "username": "fake_bot"}
+            if method in ("sendMessage", "editMessageText"):
+                chat_id = str(params.get("chat_id"))
+                if self.is_kicked(chat_id):
+                    self.kicked_hits[chat_id] += 1
+                    return 403, "Forbidden: bot was kicked from the group chat"
+                if self.flood_rate and self._rng.random() < self.flood_rate:
+                    self.floods += 1
+                    return 429, f"Too Many Requests: retry after {self.retry_after}"
+                self.sent[chat_id] += 1
+                return 200, self._next_message(chat_id, params.get("text", ""))
+            if method == "getChatMember":
+                uid = int(params.get("user_id", 0))
+                status = "member" if self._sticky(f"member:{uid}", self.member_rate) else "left"
+                return 200, {"status": status, "user": {"id": uid, "is_bot": False, "first_name": "user"}}
+            if method in ("setWebhook", "deleteWebhook", "answerCallbackQuery", "close", "logOut"):
+                return 200, True
+            if method == "getUpdates":
+                return 200, []
+            return 404, f"Not Found: method {method} not supported by fake"
+
+    def start(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                # /bot<token>/<method>
+                parts = self.path.split('?')[0].strip('/').split('/')
+                method = parts[-1] if len(parts) >= 2 and parts[0].startswith('bot') else ''
+                raw = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if 'json' in (self.headers.get('Content-Type') or ''):
+                    params = json.loads(raw or b'{}')
+                else:
+                    params = {k: v[0] for k, v in parse_qs(raw.decode()).items()}
+                if api.latency:
+                    time.sleep(api.latency)
+                status, result = api.handle(method, params)
+                if status == 200:
+                    body = {"ok": True, "result": result}
+                else:
+                    body = {"ok": False, "error_code": status, "description": result}
+                    if status == 429:
+                        body["parameters"] = {"retry_after": api.retry_after}
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="FakeBotAPI").start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--port", type=int, default=8081)
+    ap.add_argument("--kick-rate", type=float, default=0.0)
+    ap.add_argument("--flood-rate", type=float, default=0.0)
+    ap.add_argument("--retry-after", type=int, default=1)
+    ap.add_argument("--member-rate", type=float, default=1.0)
+    ap.add_argument("--latency", type=float, default=0.0)
+    args = ap.parse_args()
+    api = FakeBotAPI(args.kick_rate, args.flood_rate, args.retry_after, args.member_rate,
+                     args.latency, port=args.port).start()
+    print(f"🤖 Fake Bot API on {api.base} — TELEGRAM_API_BASE={api.base}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        api.stop()
+
+
+if __name__ == "__main__":
+    main()
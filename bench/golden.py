@@ -0,0 +1,181 @@
+"""
+Golden corpus for extract_details: correctness diffs + worst-case timing.
+
+    python -m bench.golden              # diff every case, time every pattern
+    python -m bench.golden --update     # accept current output as expected
+    python -m bench.golden --budget-ms 20
+
+Cases live in bench/golden/cases.json (title, summary, expected fields)
+with the saved page at bench/golden/<name>.html. "expected" holds the
+correct values; fields the extractor still gets wrong are listed under
+"known_failures" with the output it currently gives, so they are reported
+but only fail the run if that output changes. Every pattern in
+extractor.FIELD_PATTERNS (plus the institute pattern) is timed against
+adversarial inputs sized like a real page; anything over the budget is
+flagged. Exit code is 1 on any diff or flagged pattern.
+"""
+import argparse
+import json
+import os
+import re
+import signal
+import sys
+import time
+
+import extractor
+
+GOLDEN = os.path.join(os.path.dirname(__file__), "golden")
+CASES = os.path.join(GOLDEN, "cases.json")
+PAGE_CHARS = 8000  # clean_page() output cap
+
+
+class _Overrun(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise _Overrun()
+
+
+def adversarial_inputs() -> dict:
+    """Inputs built to hit the backtracking-prone shapes in the patterns."""
+    keywords = []
+    for patterns, _ in extractor.FIELD_PATTERNS.values():
+        for pat in patterns:
+            keywords += re.findall(r'[a-z]{3,}', pat)
+    keywords = sorted(set(keywords))
+    mixed = " ".join(f"{kw}: -" if i % 3 else kw for i, kw in enumerate(keywords * 50))
+
+    def fill(unit: str) -> str:
+        return (unit * (PAGE_CHARS // len(unit) + 1))[:PAGE_CHARS]
+
+    return {
+        "capitalised_run": fill("Abcdef Ghijk & (Lmn) "),
+        "single_line": fill("x"),
+        "keyword_colon_spam": fill("last date: fee: age: salary: "),
+        "keyword_no_separator": fill("qualification eligibility syllabus pattern "),
+        "digit_commas": fill("1, 2,3 "),
+        "whitespace": fill(" \t  "),
+        "separators": fill(":–- "),
+        "age_ranges": fill("age: 18 - to - "),
+        "rupees": fill("Rs 1,00,000 - ₹ "),
+        "mixed_keywords": fill(mixed),
+    }
+
+
+def time_patterns(budget_ms: float, hard_limit: float) -> list:
+    """[(seconds, field, index, input_name, pattern)] sorted slowest first."""
+    inputs = adversarial_inputs()
+    targets = []
+    for field, patterns in extractor._COMPILED.items():
+        for idx, pat in enumerate(patterns):
+            targets.append((field, idx, pat))
+    targets.append(("institute", 0, extractor._INSTITUTE_RE))
+
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+    results = []
+    for field, idx, pat in targets:
+        worst = (0.0, "")
+        for name, text in inputs.items():
+            t = time.perf_counter()
+            try:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, hard_limit)
+                pat.search(text)
+            except _Overrun:
+                pass
+            finally:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            took = time.perf_counter() - t
+            if took > worst[0]:
+                worst = (took, name)
+        results.append((worst[0], field, idx, worst[1], pat.pattern))
+    results.sort(reverse=True)
+    return results
+
+
+def load_cases() -> list:
+    with open(CASES, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run_case(case: dict) -> dict:
+    with open(os.path.join(GOLDEN, case["name"] + ".html"), encoding="utf-8") as f:
+        html = f.read()
+    _, details, _ = extractor.process_page(html, case["title"], case["summary"])
+    return details
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--update", action="store_true", help="rewrite expected values from current output")
+    ap.add_argument("--budget-ms", type=float, default=25.0, help="per-pattern worst-case budget")
+    ap.add_argument("--hard-limit", type=float, default=2.0, help="abort a single search after N seconds")
+    ap.add_argument("--top", type=int, default=10, help="slowest patterns to list")
+    args = ap.parse_args()
+
+    cases = load_cases()
+    failed = False
+
+    print("── Correctness ──")
+    for case in cases:
+        got = run_case(case)
+        known = case.setdefault("known_failures", {})
+        if args.update:
+            # Known failures keep their correct expected value; only the recorded output moves
+            for k, v in got.items():
+                if k in known and v != case["expected"].get(k):
+                    known[k] = v
+                else:
+                    known.pop(k, None)
+                    case["expected"][k] = v
+            print(f"📝 {case['name']}: updated")
+            continue
+        diffs, fixed = [], []
+        for k, want in case["expected"].items():
+            have = got.get(k)
+            if k in known:
+                if have == want:
+                    fixed.append(k)
+                elif have != known[k]:
+                    diffs.append((k, want, have))
+            elif have != want:
+                diffs.append((k, want, have))
+        diffs += [(k, None, got[k]) for k in got if k not in case["expected"]]
+        if diffs:
+            failed = True
+            print(f"❌ {case['name']}:")
+            for field, want, have in diffs:
+                print(f"   {field}\n     expected: {want!r}\n     got:      {have!r}")
+        else:
+            print(f"{'⚠️' if set(known) - set(fixed) else '✅'} {case['name']}")
+        for field in fixed:
+            print(f"   🎉 {field} now correct — drop it from known_failures")
+        for field in known:
+            if field not in fixed:
+                print(f"   ⚠️ known failure {field}: {known[field]!r} (want {case['expected'][field]!r})")
+
+    if args.update:
+        with open(CASES, "w", encoding="utf-8") as f:
+            json.dump(cases, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    print(f"\n── Worst-case pattern timing (budget {args.budget_ms:.0f} ms) ──")
+    results = time_patterns(args.budget_ms, args.hard_limit)
+    for took, field, idx, inp, pattern in results[:args.top]:
+        flag = "🔥" if took * 1000 > args.budget_ms else "  "
+        print(f"{flag} {took * 1000:8.2f} ms  {field}[{idx}] on {inp}")
+    flagged = [r for r in results if r[0] * 1000 > args.budget_ms]
+    for took, field, idx, inp, pattern in flagged:
+        failed = True
+        print(f"🔥 over budget: {field}[{idx}] {took * 1000:.1f} ms on {inp}\n   {pattern}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
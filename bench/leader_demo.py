@@ -0,0 +1,93 @@
+"""
+Two-process failover demo for leader.LeaderLease.
+
+Starts two worker processes that share one SQLite file, reports which one
+holds the lease, SIGKILLs the leader (a crash, so no graceful release) and
+measures how long the standby takes to take over. It also checks that the two
+never claimed leadership at the same moment.
+
+    python -m bench.leader_demo --ttl 3
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+
+def worker(name: str, ttl: float):
+    from database import Database
+    from leader import LeaderLease
+    db = Database()
+    db.init_db()
+    lease = LeaderLease(db, holder=name, ttl=ttl).start()
+    while True:
+        print(json.dumps({"t": time.time(), "name": name, "leader": lease.is_leader}), flush=True)
+        time.sleep(0.1)
+
+
+def run(ttl: float, hold: float) -> dict:
+    env = dict(os.environ, DATABASE_PATH=os.path.join(tempfile.mkdtemp(prefix="govtlease-"), "lease.db"))
+    reports = []
+    procs = {}
+    for name in ("alpha", "beta"):
+        procs[name] = subprocess.Popen(
+            [sys.executable, "-m", "bench.leader_demo", "--worker", name, "--ttl", str(ttl)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, env=env,
+        )
+        threading.Thread(target=lambda p=procs[name]: [reports.append(json.loads(l)) for l in p.stdout],
+                         daemon=True).start()
+        time.sleep(0.5)  # alpha starts first and should lead
+
+    time.sleep(hold)
+    leaders = {r["name"] for r in reports[-20:] if r["leader"]}
+    if len(leaders) != 1:
+        raise SystemExit(f"❌ Expected one leader, got {leaders or 'none'}")
+    first = leaders.pop()
+    killed_at = time.time()
+    procs[first].send_signal(signal.SIGKILL)
+
+    deadline = killed_at + ttl * 3
+    takeover = None
+    while time.time() < deadline and takeover is None:
+        time.sleep(0.05)
+        takeover = next((r["t"] for r in list(reports) if r["leader"] and r["name"] != first and r["t"] > killed_at), None)
+    for p in procs.values():
+        p.kill()
+
+    # Leadership intervals must not overlap (the killed leader's last report counts until it died)
+    last_first = max((r["t"] for r in reports if r["name"] == first and r["leader"]), default=0)
+    return {
+        "first_leader": first,
+        "takeover_sec": round(takeover - killed_at, 2) if takeover else None,
+        "overlap": bool(takeover and takeover <= last_first),
+        "reports": len(reports),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--ttl", type=float, default=3.0, help="LEADER_TTL for both workers (s)")
+    ap.add_argument("--hold", type=float, default=3.0, help="seconds before killing the leader")
+    ap.add_argument("--worker", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.worker:
+        worker(args.worker, args.ttl)
+        return
+
+    result = run(args.ttl, args.hold)
+    for key, val in result.items():
+        print(f"{key:<14} {val}")
+    if result["takeover_sec"] is None:
+        raise SystemExit("❌ Standby never took over")
+    if result["overlap"]:
+        raise SystemExit("❌ Both instances were leader at the same time")
+    print(f"✅ Standby took over {result['takeover_sec']}s after the leader died (TTL {args.ttl}s)")
+
+
+if __name__ == "__main__":
+    main()
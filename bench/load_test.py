@@ -0,0 +1,147 @@
+"""
+Delivery load test: one full do_fetch_and_post cycle against the fixture
+feeds (stub_server) and a fake Bot API (fake_bot_api) with N registered chats.
+
+Reports end-to-end messages/sec, 429 handling, and whether chats that
+kicked the bot were removed after their first 403 (so later items and
+later cycles don't keep hitting them).
+
+    python -m bench.load_test --chats 1000 --items 5 --kick-rate 0.05 --flood-rate 0.001
+    python -m bench.load_test --workers 4          # sharded outbox delivery
+    python -m bench.load_test --items 30 --digest 1.0   # digest mode in every chat
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+def run(args) -> dict:
+    # Isolated DB / log file and no pacing before bot reads config
+    workdir = tempfile.mkdtemp(prefix="govtload-")
+    os.chdir(workdir)
+    os.environ["DATABASE_PATH"] = os.path.join(workdir, "load.db")
+    os.environ["SEND_DELAY"] = str(args.send_delay)
+    os.environ["ITEM_DELAY"] = "0"
+    os.environ["DELIVERY_WORKERS"] = str(args.workers)
+    os.environ["GLOBAL_RATE"] = str(args.global_rate)
+    os.environ["GLOBAL_BURST"] = str(args.global_rate)
+    os.environ["CHAT_MIN_INTERVAL"] = str(args.chat_interval)
+    os.environ["DIGEST_THRESHOLD"] = str(args.digest_threshold)
+
+    from bench.fake_bot_api import FakeBotAPI
+    from bench.stub_server import StubServer
+    api = FakeBotAPI(args.kick_rate, args.flood_rate, args.retry_after, latency=args.latency).start()
+    stub = StubServer().start()
+    os.environ["TELEGRAM_API_BASE"] = api.base
+
+    import logging
+    import bot as app
+    from telegram import Bot
+    app.init()
+    logging.getLogger().setLevel(logging.ERROR)
+
+    app.db.init_db()
+    stub.register_feeds(app.db)
+    app.registry.load()
+    for i in range(args.chats):
+        app.registry.add(-1000000000000 - i, f"Load chat {i}", "supergroup")
+        if i < args.chats * args.digest:
+            app.registry.set_digest(-1000000000000 - i, True)
+    app.reload_router()
+    if app.outbox:
+        app.outbox.start()
+    dead = {str(c.chat_id) for c in app.registry.chats if api.is_kicked(c.chat_id)}
+
+    fetch = app.rss.fetch_new_items
+    fetched = []
+
+    def limited(timer=None, cycle=None):
+        items = fetch(timer, cycle)[:args.items]
+        fetched.append(len(items))
+        return items
+    app.rss.fetch_new_items = limited
+
+    async def drain() -> int:
+        # Sharded mode: do_fetch_and_post only queued; wait for the workers
+        while True:
+            counts = app.db.get_outbox_counts()
+            if not counts.get('pending') and not counts.get('sending'):
+                break
+            await asyncio.sleep(0.1)
+        sent = counts.get('sent', 0) - drain.sent_before
+        drain.sent_before = counts.get('sent', 0)
+        return sent
+    drain.sent_before = 0
+
+    async def cycles():
+        bot = Bot(app.BOT_TOKEN, base_url=f"{api.base}/bot")
+        async with bot:
+            totals = []
+            for _ in range(args.cycles):
+                app.db.clear_posted()
+                t = time.perf_counter()
+                sent = await app.do_fetch_and_post(bot)
+                if app.outbox:
+                    sent = await drain()
+                totals.append((sent, time.perf_counter() - t))
+            return totals
+
+    totals = asyncio.run(cycles())
+    if app.outbox:
+        app.outbox.stop()
+        app.registry.load()  # workers removed dead chats from the DB
+    api.stop()
+    stub.stop()
+
+    sent, secs = totals[0]
+    send = app.perf.percentiles().get("send", {})
+    result = {
+        "workers": args.workers,
+        "chats": args.chats,
+        "items": fetched[0],
+        "digest_chats": sum(1 for c in app.registry.chats if c.digest),
+        "messages": sent,
+        "seconds": secs,
+        "messages_per_sec": sent / secs if secs else 0.0,
+        "send_p50_ms": send.get(0.5, 0) * 1000,
+        "send_p99_ms": send.get(0.99, 0) * 1000,
+        "flood_429s": api.floods,
+        "dead_chats": len(dead),
+        "dead_chats_removed": sum(1 for c in dead if int(c) not in app.registry),
+        "dead_chats_left_in_db": sum(1 for row in app.db.get_all_chats() if str(row['chat_id']) in dead),
+        "403s_per_dead_chat": sum(api.kicked_hits.values()) / len(dead) if dead else 0.0,
+    }
+    for n, (s, secs) in enumerate(totals[1:], 2):
+        result[f"cycle{n}_messages_per_sec"] = s / secs if secs else 0.0
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--chats", type=int, default=1000)
+    ap.add_argument("--items", type=int, default=5, help="items posted per cycle")
+    ap.add_argument("--cycles", type=int, default=2, help="later cycles show dead chats are gone")
+    ap.add_argument("--kick-rate", type=float, default=0.05, help="fraction of chats that kicked the bot")
+    ap.add_argument("--flood-rate", type=float, default=0.001, help="fraction of sends answered with 429")
+    ap.add_argument("--retry-after", type=int, default=1)
+    ap.add_argument("--latency", type=float, default=0.0, help="fake API latency per call (s)")
+    ap.add_argument("--send-delay", type=float, default=0.0, help="SEND_DELAY for the run (prod default 0.5)")
+    ap.add_argument("--workers", type=int, default=0, help="DELIVERY_WORKERS (0 = in-process delivery)")
+    ap.add_argument("--global-rate", type=float, default=1000, help="GLOBAL_RATE msg/s for sharded mode")
+    ap.add_argument("--chat-interval", type=float, default=0.0, help="CHAT_MIN_INTERVAL for sharded mode")
+    ap.add_argument("--digest", type=float, default=0.0, help="fraction of chats in digest mode")
+    ap.add_argument("--digest-threshold", type=int, default=5, help="DIGEST_THRESHOLD for the run")
+    args = ap.parse_args()
+
+    result = run(args)
+    width = max(len(k) for k in result)
+    for key, val in result.items():
+        print(f"{key:<{width}}  {val:10.2f}" if isinstance(val, float) else f"{key:<{width}}  {val:10}")
+    if result["dead_chats_removed"] != result["dead_chats"] or result["dead_chats_left_in_db"]:
+        raise SystemExit("❌ Some chats that kicked the bot were not cleaned up")
+
+
+if __name__ == "__main__":
+    main()
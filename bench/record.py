@@ -0,0 +1,63 @@
+"""
+Re-record bench fixtures from the live default sources (feed_registry.DEFAULT_FEEDS).
+
+    python -m bench.record [--pages 3]
+
+Saves each feed as fixtures/feeds/<slug>.xml with the first N article
+links rewritten to {BASE}/pages/<slug>-<n>.html, and saves those pages.
+"""
+import argparse
+import os
+import re
+import sys
+import urllib.request
+
+from bench.stub_server import FIXTURES, slug
+
+
+def _get(url: str) -> bytes:
+    from rss_fetcher import HEADERS
+    req = urllib.request.Request(url, headers=HEADERS)
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        return resp.read()
+
+
+def main():
+    import feedparser
+    from feed_registry import DEFAULT_FEEDS
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=3)
+    args = ap.parse_args()
+
+    os.makedirs(os.path.join(FIXTURES, "feeds"), exist_ok=True)
+    os.makedirs(os.path.join(FIXTURES, "pages"), exist_ok=True)
+    failed = 0
+
+    for feed_url, source_name in DEFAULT_FEEDS:
+        s = slug(source_name)
+        try:
+            raw = _get(feed_url)
+            xml = raw.decode('utf-8', errors='ignore')
+            feed = feedparser.parse(raw)
+            for n, entry in enumerate(feed.entries[:args.pages]):
+                link = entry.get('link', '')
+                if not link:
+                    continue
+                html = _get(link)
+                with open(os.path.join(FIXTURES, "pages", f"{s}-{n}.html"), 'wb') as f:
+                    f.write(html)
+                local = f"{{BASE}}/pages/{s}-{n}.html"
+                xml = re.sub(re.escape(link) + r'(?=[<"\s])', local, xml)
+            with open(os.path.join(FIXTURES, "feeds", f"{s}.xml"), 'w', encoding='utf-8') as f:
+                f.write(xml)
+            print(f"✅ {source_name}: {min(len(feed.entries), args.pages)} pages")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {source_name}: {e}")
+
+    sys.exit(1 if failed == len(DEFAULT_FEEDS) else 0)
+
+
+if __name__ == "__main__":
+    main()
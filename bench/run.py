@@ -0,0 +1,148 @@
+"""
+Offline benchmark for the fetch → extract → classify → format pipeline.
+
+Serves bench/fixtures (synthetic, generated by bench/synth.py) from a local
+stub HTTP server, fills the feeds table with the default sources pointed at
+it, and measures throughput, per-stage latency and peak memory without
+touching live sites.
+
+    python -m bench.run                  # print report
+    python -m bench.run --save           # store results as bench/baseline.json
+    python -m bench.run --check          # exit 1 on regression vs baseline
+
+Run --save once on the deploy machine, then --check before each deploy.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Throughput metrics must not drop, latency/memory metrics must not grow,
+# by more than --tolerance.
+HIGHER_IS_BETTER = ("fetch_items_per_sec", "extract_per_sec", "classify_per_sec", "format_per_sec")
+
+
+def _rate(fn, args_list, repeat: int) -> float:
+    t = time.perf_counter()
+    n = 0
+    for _ in range(repeat):
+        for args in args_list:
+            fn(*args)
+            n += 1
+    return n / (time.perf_counter() - t)
+
+
+def run(iterations: int, repeat: int, delay: float) -> dict:
+    # Isolated DB before any project module reads config
+    os.environ["DATABASE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="govtbench-"), "bench.db")
+
+    import rss_fetcher
+    from bench.stub_server import StubServer, FIXTURES
+    from classifier import classify_update
+    from extractor import process_page
+    from perf import PerfRecorder
+    from templates import format_message
+
+    stub = StubServer(delay=delay).start()
+    fetcher = rss_fetcher.RSSFetcher()
+    fetcher.db.init_db()
+    stub.register_feeds(fetcher.db)
+    recorder = PerfRecorder(history=iterations)
+
+    tracemalloc.start()
+    items = []
+    t = time.perf_counter()
+    for _ in range(iterations):
+        fetcher.db.clear_posted()
+        timer = recorder.start_cycle()
+        items = fetcher.fetch_new_items(timer)
+        fetcher.release(items)
+        recorder.finish_cycle(timer)
+    fetch_secs = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stub.stop()
+
+    if not items:
+        raise SystemExit("❌ Pipeline produced 0 items — fixtures or stub server broken")
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "pages", "*.html"))):
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            pages.append((f.read(), os.path.basename(path), ""))
+    texts = [(i.title + " " + i.summary,) for i in items]
+    categories = [(i, classify_update(i.title + " " + i.summary)) for i in items]
+
+    result = {
+        "items": len(items),
+        "fetch_items_per_sec": len(items) * iterations / fetch_secs,
+        "extract_per_sec": _rate(process_page, pages, repeat),
+        "classify_per_sec": _rate(classify_update, texts, repeat * 50),
+        "format_per_sec": _rate(format_message, categories, repeat * 10),
+        "peak_mem_mb": peak / 1024 / 1024,
+    }
+    for stage, p in recorder.percentiles().items():
+        result[f"{stage}_p50_ms"] = p[0.5] * 1000
+        result[f"{stage}_p90_ms"] = p[0.9] * 1000
+    return result
+
+
+def check(result: dict, baseline: dict, tolerance: float) -> list:
+    failures = []
+    for key, base in baseline.items():
+        if key == "items" or key not in result or not base:
+            continue
+        cur = result[key]
+        if key in HIGHER_IS_BETTER:
+            if cur < base * (1 - tolerance):
+                failures.append(f"{key}: {cur:.2f} < {base:.2f} (-{(1 - cur / base) * 100:.0f}%)")
+        elif key.endswith("_ms") or key == "peak_mem_mb":
+            # Sub-millisecond stages are too noisy to gate on
+            if base >= 1.0 and cur > base * (1 + tolerance):
+                failures.append(f"{key}: {cur:.2f} > {base:.2f} (+{(cur / base - 1) * 100:.0f}%)")
+    if result["items"] != baseline.get("items", result["items"]):
+        failures.append(f"items: {result['items']} != {baseline['items']} (extraction/dedup changed)")
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--iterations", type=int, default=3, help="full fetch cycles to run")
+    ap.add_argument("--repeat", type=int, default=5, help="repeats for the micro benchmarks")
+    ap.add_argument("--delay", type=float, default=0.0, help="simulated latency per HTTP request (s)")
+    ap.add_argument("--save", action="store_true", help=f"write results to {BASELINE}")
+    ap.add_argument("--check", action="store_true", help="compare against the saved baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed regression (0.25 = 25%%)")
+    args = ap.parse_args()
+
+    result = run(args.iterations, args.repeat, args.delay)
+    width = max(len(k) for k in result)
+    for key, val in result.items():
+        print(f"{key:<{width}}  {val:10.2f}" if isinstance(val, float) else f"{key:<{width}}  {val:10}")
+
+    if args.save:
+        with open(BASELINE, "w") as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+        print(f"💾 Baseline saved to {BASELINE}")
+
+    if args.check:
+        if not os.path.exists(BASELINE):
+            raise SystemExit(f"❌ No baseline at {BASELINE} — run with --save first")
+        with open(BASELINE) as f:
+            failures = check(result, json.load(f), args.tolerance)
+        if failures:
+            print("❌ Performance regression:")
+            for line in failures:
+                print(f"   {line}")
+            sys.exit(1)
+        print("✅ Within tolerance of baseline")
+
+
+if __name__ == "__main__":
+    main()
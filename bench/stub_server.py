@@ -0,0 +1,76 @@
+"""
+Local stand-in for the RSS sources: serves bench/fixtures over HTTP.
+
+Feeds are served from fixtures/feeds/<slug>.xml with {BASE} replaced by
+the server's own address, so article links resolve to fixtures/pages/.
+"""
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def slug(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '', name.lower())
+
+
+class StubServer:
+    def __init__(self, root: str = FIXTURES, delay: float = 0.0):
+        self.root = root
+        self.delay = delay  # simulated network latency per request (seconds)
+        self.requests = 0
+        self._server = None
+
+    @property
+    def base(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def feed_url(self, source_name: str) -> str:
+        return f"{self.base}/feeds/{slug(source_name)}.xml"
+
+    def register_feeds(self, db):
+        """Fill an empty feeds table with the default sources, pointed at this server."""
+        from feed_registry import DEFAULT_FEEDS
+        db.seed_feeds([(self.feed_url(name), name) for _, name in DEFAULT_FEEDS])
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests += 1
+                path = os.path.normpath(self.path.split('?')[0]).lstrip('/')
+                full = os.path.join(stub.root, path)
+                if not full.startswith(stub.root) or not os.path.isfile(full):
+                    self.send_error(404)
+                    return
+                with open(full, 'rb') as f:
+                    body = f.read()
+                if full.endswith('.xml'):
+                    body = body.replace(b'{BASE}', stub.base.encode())
+                    ctype = 'application/rss+xml; charset=utf-8'
+                else:
+                    ctype = 'text/html; charset=utf-8'
+                if stub.delay:
+                    time.sleep(stub.delay)
+                self.send_response(200)
+                self.send_header('Content-Type', ctype)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="StubServer").start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
@@ -0,0 +1,238 @@
+"""
+Generate the synthetic bench fixtures: one feed per default source
+(feed_registry.DEFAULT_FEEDS) plus article pages for its first N items.
+
+    python -m bench.synth [--pages 3]
+
+Nothing here is recorded from a live site. Each feed only carries posts
+of the kind its source publishes (SSCAdda → SSC, IBPS → IBPS, SarkariResult
+→ results and admit cards, ...), and pages are padded with the nav, script,
+style and footer chrome real article pages have so cleanup costs are
+realistic. Output is deterministic; python -m bench.record replaces it with
+real recordings.
+"""
+import argparse
+import os
+import random
+import re
+
+from bench.stub_server import FIXTURES, slug
+
+# key -> (title, organisation, qualification, selection, pay)
+JOBS = {
+    "ssc_cgl": ("SSC CGL 2025 Notification Out for 14582 Posts", "Staff Selection Commission",
+                "Graduate from a recognised university", "Tier 1 CBT, Tier 2 CBT", "Level 4 to Level 8 (Rs 25,500 – 1,42,400)"),
+    "ssc_chsl": ("SSC CHSL 2025 Apply Online for 3131 LDC and DEO Posts", "Staff Selection Commission",
+                 "12th pass from a recognised board", "Tier 1 CBT, Tier 2 CBT, Typing Test", "Level 2 to Level 5 (Rs 19,900 – 81,100)"),
+    "ssc_mts": ("SSC MTS Admit Card 2025 Released for 8021 Posts", "Staff Selection Commission",
+                "10th pass (Matriculation)", "CBT, PET/PST for Havaldar", "Level 1 (Rs 18,000 – 56,900)"),
+    "ssc_gd": ("SSC GD Constable Result 2025 Declared for 39481 Posts", "Staff Selection Commission",
+               "10th pass (Matriculation)", "CBT, PET/PST, Medical", "Level 3 (Rs 21,700 – 69,100)"),
+    "ssc_cpo": ("SSC CPO SI 2025 Notification for 3712 Sub-Inspector Posts", "Staff Selection Commission",
+                "Graduate from a recognised university", "Paper 1, PET/PST, Paper 2, Medical", "Level 6 (Rs 35,400 – 1,12,400)"),
+    "ssc_je": ("SSC JE 2025 Recruitment for 1340 Junior Engineer Posts", "Staff Selection Commission",
+               "Diploma / B.E. in Civil, Electrical or Mechanical", "Paper 1 CBT, Paper 2 CBT", "Level 6 (Rs 35,400 – 1,12,400)"),
+    "ssc_steno": ("SSC Stenographer 2025 Last Date Extended for 2006 Posts", "Staff Selection Commission",
+                  "12th pass from a recognised board", "CBT, Skill Test", "Level 4 and Level 6 of 7th CPC"),
+    "ibps_po": ("IBPS PO 2025 Recruitment for 5208 Probationary Officers", "Institute of Banking Personnel Selection",
+                "Graduation in any discipline", "Prelims, Mains and Interview", "Rs 48,480 – 85,920 per month"),
+    "ibps_clerk": ("IBPS Clerk 2025 Notification Out for 10277 Posts", "Institute of Banking Personnel Selection",
+                   "Graduation in any discipline", "Prelims and Mains", "Rs 24,050 – 64,480 per month"),
+    "ibps_rrb": ("IBPS RRB 2025 Apply Online for 13217 Officer Scale and Office Assistant Posts",
+                 "Institute of Banking Personnel Selection", "Graduation in any discipline",
+                 "Prelims, Mains and Interview", "Rs 35,000 – 80,000 per month"),
+    "ibps_so": ("IBPS SO 2025 Recruitment for 1007 Specialist Officer Posts", "Institute of Banking Personnel Selection",
+                "Graduate / PG in the relevant field", "Prelims, Mains and Interview", "Rs 48,480 – 85,920 per month"),
+    "ibps_po_result": ("IBPS PO Prelims Result 2025 Declared", "Institute of Banking Personnel Selection",
+                       "Graduation in any discipline", "Prelims, Mains and Interview", "Rs 48,480 – 85,920 per month"),
+    "ibps_clerk_admit": ("IBPS Clerk Prelims Admit Card 2025 Released", "Institute of Banking Personnel Selection",
+                         "Graduation in any discipline", "Prelims and Mains", "Rs 24,050 – 64,480 per month"),
+    "sbi_clerk": ("SBI Clerk Last Date Extended for 13735 Junior Associates", "State Bank of India",
+                  "Graduation in any discipline", "Prelims, Mains, Local Language Test", "Rs 26,730 – 64,480 per month"),
+    "sbi_po": ("SBI PO 2025 Notification Out for 600 Probationary Officers", "State Bank of India",
+               "Graduation in any discipline", "Prelims, Mains, Psychometric Test, Interview", "Rs 48,480 – 85,920 per month"),
+    "rbi_grade_b": ("RBI Grade B 2025 Apply Online for 94 Officer Posts", "Reserve Bank of India",
+                    "Graduation with 60% marks", "Phase 1, Phase 2 and Interview", "Rs 55,200 basic plus allowances"),
+    "nabard": ("NABARD Grade A 2025 Recruitment for 102 Assistant Manager Posts",
+               "National Bank for Agriculture and Rural Development", "Graduation with 60% marks",
+               "Prelims, Mains and Interview", "Rs 44,500 basic plus allowances"),
+    "lic_aao": ("LIC AAO 2025 Notification for 841 Assistant Administrative Officer Posts",
+                "Life Insurance Corporation of India", "Graduation in any discipline",
+                "Prelims, Mains and Interview", "Rs 53,600 basic plus allowances"),
+    "rrb_ntpc": ("RRB NTPC Admit Card 2025 Released for CBT 1", "Railway Recruitment Board",
+                 "12th pass / Graduate", "CBT 1, CBT 2, Typing Skill Test", "Level 2 to Level 6 of 7th CPC"),
+    "rrb_alp": ("RRB ALP 2025 Recruitment for 9970 Assistant Loco Pilot Posts", "Railway Recruitment Board",
+                "10th pass with ITI / Diploma", "CBT 1, CBT 2, CBAT", "Level 2 (Rs 19,900 – 63,200)"),
+    "rrb_group_d": ("RRB Group D Result 2025 Declared for 32438 Posts", "Railway Recruitment Board",
+                    "10th pass or ITI", "CBT, PET, Document Verification", "Level 1 (Rs 18,000 – 56,900)"),
+    "upsc_cse": ("UPSC Civil Services Prelims Result 2025 Declared", "Union Public Service Commission",
+                 "Bachelor's degree from any university", "Prelims, Mains, Personality Test", "Level 10 (Rs 56,100)"),
+    "upsc_nda": ("UPSC NDA 2 2025 Notification for 406 Posts", "Union Public Service Commission",
+                 "12th pass (Physics and Maths for Air Force and Navy)", "Written exam, SSB Interview",
+                 "Rs 56,100 stipend during training"),
+    "upsc_cds": ("UPSC CDS 2 2025 Admit Card Released", "Union Public Service Commission",
+                 "Graduate from a recognised university", "Written exam, SSB Interview", "Level 10 (Rs 56,100)"),
+    "upsc_epfo": ("UPSC EPFO 2025 Recruitment for 230 Enforcement Officer Posts", "Union Public Service Commission",
+                  "Graduate from a recognised university", "Recruitment Test, Interview", "Level 8 of 7th CPC"),
+    "drdo_ceptam": ("DRDO CEPTAM 11 Notification 2025 for 1901 Technician Posts",
+                    "Defence Research and Development Organisation", "Diploma / B.Sc in relevant field",
+                    "Tier 1 CBT, Tier 2 Trade Test", "Level 6 (Rs 35,400 – 1,12,400)"),
+    "isro": ("ISRO Scientist Engineer 2025 Recruitment for 63 Posts", "Indian Space Research Organisation",
+             "B.E./B.Tech with 65% marks", "Written test, Interview", "Level 10 (Rs 56,100)"),
+    "aiims_sr": ("AIIMS Delhi Walk-in Interview for Senior Resident 2025", "All India Institute of Medical Sciences",
+                 "MD/MS/DNB in concerned speciality", "Walk-in interview", "Rs 67,700 plus allowances"),
+    "esic": ("ESIC 2025 Recruitment for 558 Specialist Posts", "Employees' State Insurance Corporation",
+             "PG degree / diploma in concerned speciality", "Interview", "Rs 78,800 basic plus allowances"),
+    "bihar_police": ("Bihar Police Constable Recruitment 2025 Apply Online 19838 Posts",
+                     "Central Selection Board of Constable", "12th pass (Intermediate)", "Written exam, PET, Medical",
+                     "Pay Level 3 (Rs 21,700 – 69,100)"),
+    "up_police": ("UP Police Constable 2025 Notification for 19220 Posts",
+                  "Uttar Pradesh Police Recruitment and Promotion Board", "12th pass (Intermediate)",
+                  "Written exam, Document Verification, PST, PET", "Pay Level 3 (Rs 21,700 – 69,100)"),
+    "rajasthan_patwari": ("Rajasthan Patwari 2025 Recruitment for 3705 Posts", "Rajasthan Staff Selection Board",
+                          "Graduate with computer certificate", "Written exam", "Pay Level 5 of Rajasthan pay matrix"),
+    "mpesb_teacher": ("MP Primary Teacher 2025 Apply Online for 13089 Posts", "Madhya Pradesh Employees Selection Board",
+                      "12th pass with D.El.Ed / B.Ed", "Written exam, Document Verification", "Rs 32,800 per month"),
+    "bpsc_tre": ("BPSC TRE 4.0 2025 Notification for 87774 Teacher Posts", "Bihar Public Service Commission",
+                 "Graduation with B.Ed / D.El.Ed and STET/CTET", "Written exam, Document Verification",
+                 "Rs 25,000 – 32,000 per month"),
+    "ctet": ("CTET December 2025 Notification Out", "Central Board of Secondary Education",
+             "D.El.Ed / B.Ed as per NCTE norms", "Paper 1 and Paper 2", "Not applicable (eligibility test)"),
+    "ugc_net": ("UGC NET December 2025 Apply Online", "National Testing Agency",
+                "Master's degree with 55% marks", "CBT Paper 1 and Paper 2", "JRF Rs 37,000 per month"),
+    "cuet_ug": ("CUET UG 2025 Result Declared", "National Testing Agency",
+                "12th pass from a recognised board", "CBT", "Not applicable (admission test)"),
+    "jee_main": ("JEE Main 2025 Session 2 Admit Card Released", "National Testing Agency",
+                 "12th pass with Physics, Chemistry and Maths", "CBT Paper 1 and Paper 2", "Not applicable (admission test)"),
+    "neet_pg": ("NEET PG 2025 Result Declared", "National Board of Examinations in Medical Sciences",
+                "MBBS with completed internship", "CBT", "Not applicable (admission test)"),
+}
+
+# Source name -> the posts it runs (first N get article pages)
+SOURCE_JOBS = {
+    "SarkariNaukri": ["bihar_police", "rrb_alp", "drdo_ceptam", "aiims_sr", "up_police", "esic"],
+    "AglaSem": ["jee_main", "cuet_ug", "ugc_net", "neet_pg", "ctet", "upsc_nda"],
+    "Testbook": ["ssc_cgl", "rrb_ntpc", "ibps_po", "ssc_je", "rrb_alp", "sbi_po"],
+    "Adda247": ["ssc_chsl", "sbi_clerk", "rrb_group_d", "ibps_clerk", "ssc_gd", "rbi_grade_b"],
+    "BankersAdda": ["sbi_clerk", "ibps_po", "rbi_grade_b", "ibps_rrb", "nabard", "lic_aao"],
+    "SSCAdda": ["ssc_cgl", "ssc_chsl", "ssc_mts", "ssc_gd", "ssc_cpo", "ssc_steno"],
+    "IBPS": ["ibps_po", "ibps_clerk", "ibps_rrb", "ibps_so", "ibps_po_result", "ibps_clerk_admit"],
+    "Jagran Josh": ["upsc_cse", "bpsc_tre", "ctet", "upsc_cds", "ssc_cgl", "up_police"],
+    "Employment News": ["upsc_epfo", "drdo_ceptam", "isro", "esic", "upsc_nda", "aiims_sr"],
+    "ExamPundit": ["ibps_clerk", "sbi_po", "ibps_so", "nabard", "rbi_grade_b", "ibps_po_result"],
+    "OliveBoard": ["rbi_grade_b", "ssc_cgl", "lic_aao", "ibps_rrb", "sbi_po", "ssc_chsl"],
+    "SarkariJobFind": ["rajasthan_patwari", "mpesb_teacher", "bpsc_tre", "up_police", "bihar_police", "rrb_alp"],
+    "FreeJobAlert": ["up_police", "rrb_group_d", "rajasthan_patwari", "ssc_mts", "esic", "mpesb_teacher"],
+    "SarkariResult": ["upsc_cse", "rrb_ntpc", "ssc_gd", "cuet_ug", "neet_pg", "upsc_cds"],
+}
+
+MONTHS = "January February March April May June July August September October November December".split()
+DAYS = ["Sat", "Fri", "Thu", "Wed", "Tue", "Mon"]
+
+
+def page(job, source: str, rng: random.Random) -> str:
+    title, org, qual, sel, pay = job
+    seats = re.search(r'(\d{3,5})', title)
+    seats = seats.group(1) if seats else str(rng.randint(50, 5000))
+    d1 = f"{rng.randint(1, 28)} {rng.choice(MONTHS)} 2025"
+    d2 = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2025"
+    nav = "".join(f'<li><a href="/cat/{i}">Category {i}</a></li>' for i in range(40))
+    script = "var x = {" + ",".join(f'"k{i}": {i}' for i in range(300)) + "};"
+    paras = "\n".join(
+        f"<p>{org} has released an official update regarding {title}. Candidates are advised to read the "
+        f"notification carefully before applying. Paragraph {i} contains general guidance about documents, "
+        f"photographs, signatures and category certificates required at the time of verification.</p>"
+        for i in range(12))
+    return f"""<!DOCTYPE html>
+<!-- Synthetic bench fixture (bench/synth.py), not a recording of {source} -->
+<html lang="en"><head><meta charset="utf-8"><title>{title} | {source}</title>
+<style>body{{font-family:sans-serif}} .t td{{padding:4px}} {' '.join(f'.c{i}{{margin:{i}px}}' for i in range(120))}</style>
+<script>{script}</script>
+</head><body>
+<header><div class="logo">{source}</div><nav><ul>{nav}</ul></nav></header>
+<main><article>
+<h1>{title}</h1>
+<p>{org} has published the notification for {title}. Eligible candidates can apply online through the official website.</p>
+<h2>Important Dates</h2>
+<table class="t">
+<tr><td>Application Start Date: {d1}</td></tr>
+<tr><td>Last Date to Apply: {d2}</td></tr>
+<tr><td>Exam Date: To be notified soon</td></tr>
+</table>
+<h2>Vacancy Details</h2>
+<p>Total Vacancies: {seats}</p>
+<h2>Application Fee</h2>
+<p>Application Fee: Rs 100 for General/OBC/EWS; SC/ST/PwBD and Women candidates are exempted</p>
+<h2>Age Limit</h2>
+<p>Minimum Age: 18 years</p>
+<p>Maximum Age: 32 years as on 01 August 2025, relaxation as per rules</p>
+<h2>Eligibility</h2>
+<p>Educational Qualification: {qual} or equivalent as on the closing date</p>
+<h2>Salary</h2>
+<p>Pay Scale: {pay}</p>
+<h2>Selection Process</h2>
+<p>Selection Process: {sel} followed by document verification</p>
+<p>Exam Pattern: Objective type multiple choice questions with negative marking of 0.25</p>
+<p>Syllabus: General Intelligence, Quantitative Aptitude, English Language and General Awareness</p>
+<p>Previous year cutoff: General 145.2, OBC 139.8, SC 121.3, ST 110.6 marks</p>
+{paras}
+</article></main>
+<aside>{nav}</aside>
+<footer><p>&copy; 2025 {source} (synthetic sample).</p>{nav}</footer>
+<script>{script}</script>
+</body></html>
+"""
+
+
+def feed(feed_url: str, source: str, pages: int, rng: random.Random) -> tuple:
+    """(feed xml, [page html]) for one source."""
+    s = slug(source)
+    items, htmls = [], []
+    for n, key in enumerate(SOURCE_JOBS[source]):
+        title, org = JOBS[key][:2]
+        items.append(f"""  <item>
+    <title>{title}</title>
+    <link>{{BASE}}/pages/{s}-{n}.html</link>
+    <guid isPermaLink="false">{s}-{n}</guid>
+    <pubDate>{DAYS[n]}, {18 - n:02d} Oct 2025 0{n}:30:00 +0530</pubDate>
+    <description><![CDATA[<p>{org} has released {title}. Check eligibility, dates and how to apply.</p>]]></description>
+  </item>""")
+        if n < pages:
+            htmls.append(page(JOBS[key], source, rng))
+    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+<channel>
+  <title>{source}</title>
+  <link>{feed_url}</link>
+  <description>Synthetic sample feed modelled on {source} (generated by bench/synth.py, not recorded)</description>
+{chr(10).join(items)}
+</channel>
+</rss>
+"""
+    return xml, htmls
+
+
+def main():
+    from feed_registry import DEFAULT_FEEDS
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=3)
+    args = ap.parse_args()
+
+    os.makedirs(os.path.join(FIXTURES, "feeds"), exist_ok=True)
+    os.makedirs(os.path.join(FIXTURES, "pages"), exist_ok=True)
+    rng = random.Random(26)
+
+    for feed_url, source_name in DEFAULT_FEEDS:
+        s = slug(source_name)
+        xml, htmls = feed(feed_url, source_name, args.pages, rng)
+        with open(os.path.join(FIXTURES, "feeds", f"{s}.xml"), 'w', encoding='utf-8') as f:
+            f.write(xml)
+        for n, html in enumerate(htmls):
+            with open(os.path.join(FIXTURES, "pages", f"{s}-{n}.html"), 'w', encoding='utf-8') as f:
+                f.write(html)
+        print(f"✅ {source_name}: {len(SOURCE_JOBS[source_name])} items, {len(htmls)} pages")
+
+
+if __name__ == "__main__":
+    main()
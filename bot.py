@@ -1,41 +1,163 @@
 import os
 import logging
 import asyncio
+import concurrent.futures
+import signal
 import threading
 import time
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from datetime import date
+from urllib.parse import urlparse
+from perf import perf, startup  # first, so startup timing includes the imports below
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import Forbidden, RetryAfter
 from telegram.ext import (
     Application, CommandHandler, CallbackQueryHandler,
     ContextTypes, ChatMemberHandler
 )
 from database import Database
-from rss_fetcher import RSSFetcher
+from rss_fetcher import RSSFetcher, get_feedparser
 from classifier import classify_update
-from templates import format_message
-from config import BOT_TOKEN, ADMIN_ID, CHANNEL_USERNAME, BOT_USERNAME, OWNER_USERNAME, FETCH_INTERVAL_MINUTES
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(), logging.FileHandler('bot.log')]
+from templates import (
+    format_message, format_digest, template_reminder, template_update, mark_updated, DIGEST_MAX_ITEMS,
+)
+from models import JobItem
+from search import parse_query, PAGE_SIZE
+from reminders import DeadlineQueue
+from chat_registry import ChatRegistry
+from logbuffer import setup_logging
+from membership import MembershipCache
+from leader import LeaderLease
+from delivery import DeliveryWorkers, send_one
+from cycles import CycleManager, CycleCancelled
+from normalize import job_key, title_similarity
+from routing import Router, KINDS, CATEGORIES, validate as validate_filter
+from extractor import AUTHORITY_KEYS
+from feed_registry import PARSERS, DEFAULT_TIMEOUT, describe as describe_feed
+from config import (
+    BOT_TOKEN, ADMIN_ID, CHANNEL_USERNAME, BOT_USERNAME, OWNER_USERNAME, FETCH_INTERVAL_MINUTES, REMINDERS_ENABLED,
+    BOT_MODE, TELEGRAM_API_BASE, SEND_DELAY, ITEM_DELAY, SEND_RETRIES, FIRST_FETCH_DELAY, DELIVERY_WORKERS,
+    DIGEST_THRESHOLD, UPDATE_MODE, UPDATE_WINDOW_DAYS, UPDATE_MIN_SIMILARITY,
 )
+
 logger = logging.getLogger(__name__)
 
-db = Database()
-rss = RSSFetcher()
+# Built by init(), not at import: spawn-started processes (extraction pool, delivery
+# workers) re-import this module as __mp_main__ and must not install their own
+# bot.log handler or open the bot's singletons
+log_ring = None
+db = rss = deadline_queue = registry = member_cache = leader = outbox = cycles = None
+router = Router()
+PROGRESS_EVERY = 5  # seconds between /forcefetch progress edits
 INTERVAL_SECONDS = FETCH_INTERVAL_MINUTES * 60
+CYCLE_REPORT_EVERY = 300  # seconds between "still running" logs while the scheduler waits
+# Only what we have handlers for — Telegram doesn't send (or bill us for) the rest
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY, Update.MY_CHAT_MEMBER]
 _bot_ref = None
+# Set by post_init once the bot is initialised (getMe done) — releases the first fetch
+bot_ready = threading.Event()
 
 # ─────────────────────────────────────────
 # CORE: FETCH & POST
 # ─────────────────────────────────────────
-async def do_fetch_and_post(bot):
+def _is_dead_chat(err: Exception) -> bool:
+    """Errors after which the chat will never accept our posts again."""
+    if isinstance(err, Forbidden):
+        return True
+    msg = str(err).lower()
+    return any(x in msg for x in ["kicked", "chat not found", "deactivated", "blocked"])
+
+async def deliver(bot, chats, text, buttons=None, timer=None, job_key=None, edit=None, reply_to=None) -> int:
+    """Send one message to each chat, honouring 429 retry_after; drops dead chats. Returns messages sent.
+
+    With job_key the posts are remembered for later updates; edit / reply_to map
+    chat_id -> message_id of an earlier post to edit in place or reply to.
+    """
+    if outbox:
+        return outbox.enqueue((chat.chat_id for chat in chats), text, buttons, job_key, edit, reply_to)
+    markup = InlineKeyboardMarkup(buttons) if buttons else None
+    edit, reply_to = edit or {}, reply_to or {}
+    sent = 0
+    posts = []
+    for chat in chats:
+        for attempt in range(SEND_RETRIES + 1):
+            try:
+                with timer.stage("send") if timer else nullcontext():
+                    message_id = await send_one(
+                        bot, chat.chat_id, text, markup, edit.get(chat.chat_id), reply_to.get(chat.chat_id)
+                    )
+                sent += 1
+                if job_key and chat.chat_id not in reply_to:
+                    posts.append((chat.chat_id, message_id))
+            except RetryAfter as e:
+                if attempt < SEND_RETRIES:
+                    logger.warning(f"⏳ Flood limit on {chat.chat_id} — retrying in {e.retry_after}s")
+                    await asyncio.sleep(e.retry_after)
+                    continue
+                logger.warning(f"Post failed {chat.chat_id}: still rate limited after {SEND_RETRIES} retries")
+            except Exception as e:
+                logger.warning(f"Post failed {chat.chat_id}: {e}")
+                if _is_dead_chat(e):
+                    drop_chat(chat.chat_id)
+            break
+        if SEND_DELAY:
+            await asyncio.sleep(SEND_DELAY)
+    if posts:
+        db.save_sent_messages(job_key, posts, UPDATE_WINDOW_DAYS)
+    return sent
+
+def _same_job(earlier: dict, item, host: str) -> bool:
+    """Same job key is not enough to edit someone's post: same feed or site, and a similar title."""
+    if earlier['source'] != item.source and earlier['host'] != host:
+        return False
+    return title_similarity(earlier['title'], item.title) >= UPDATE_MIN_SIMILARITY
+
+async def post_item(bot, item, category, chats, timer=None) -> int:
+    """Full post for chats new to this job; edit of / reply to the earlier post where there is one."""
+    with timer.stage("format") if timer else nullcontext():
+        text, buttons = format_message(item, category)
+    key = job_key(item.title) if UPDATE_MODE in ("edit", "reply") else None
+    earlier = {}
+    if key:
+        host = urlparse(item.link).hostname
+        previous = db.get_job_post(key, UPDATE_WINDOW_DAYS)
+        if previous and not _same_job(previous, item, host):
+            # A different job under the same key: post it fresh, and it becomes the key's target
+            logger.info(f"🆕 '{key}' matches an earlier post, but not as an update: {previous['title'][:50]}")
+        elif previous:
+            earlier = db.get_sent_messages(key, UPDATE_WINDOW_DAYS)
+        db.save_job_post(key, item.title, item.source, host, UPDATE_WINDOW_DAYS)
+    fresh = [c for c in chats if c.chat_id not in earlier]
+    again = [c for c in chats if c.chat_id in earlier]
+    sent = await deliver(bot, fresh, text, buttons, timer, job_key=key)
+    if again:
+        logger.info(f"🔄 Update of '{key}' — {UPDATE_MODE} in {len(again)} chats")
+        if UPDATE_MODE == "reply":
+            note, note_buttons = template_update(item)
+            sent += await deliver(bot, again, note, note_buttons, timer, job_key=key, reply_to=earlier)
+        else:
+            sent += await deliver(bot, again, mark_updated(text), buttons, timer, job_key=key, edit=earlier)
+    return sent
+
+async def do_fetch_and_post(bot, cycle=None):
+    """One fetch + post cycle; cycle (from CycleManager) gets progress and can cancel it between stages."""
     logger.info("⏰ Fetch cycle started!")
+    timer = perf.start_cycle()
+    new_items = []
     try:
-        new_items = rss.fetch_new_items()
+        # Runs in a worker thread so handlers keep responding during the cycle
+        new_items = await asyncio.to_thread(rss.fetch_new_items, timer, cycle)
         logger.info(f"📦 {len(new_items)} new items found")
+        if cycle:
+            cycle.stage, cycle.items_total = "posting", len(new_items)
+        # Chats, /filter rules and /digest settings may have been changed through another
+        # instance (or, with workers, dropped straight from the DB) — route with the DB's view
+        await asyncio.to_thread(reload_chats)
+        if outbox:
+            outbox.start()
 
-        chats = db.get_all_chats()
+        chats = registry.chats
         if not chats:
             logger.warning("⚠️ No chats registered!")
             return 0
@@ -43,38 +165,104 @@ async def do_fetch_and_post(bot):
             logger.info("No new items to post")
             return 0
 
-        posted_total = 0
+        routed = []  # (item, category, chats it goes to)
         for item in new_items:
+            with timer.stage("classify"):
+                category = classify_update(item.title + " " + item.summary)
+            routed.append((item, category, router.route(chats, item.title, item.summary, category)))
+        digest_chats = _digest_chats(routed)
+
+        posted_total = 0
+        posted_jobs = []
+        for item, category, targets in routed:
+            if cycle and cycle.cancelled:
+                logger.info(f"🛑 Cycle cancelled — {len(posted_jobs)}/{len(routed)} items posted")
+                break
             try:
-                category = classify_update(item['title'] + " " + item.get('summary', ''))
-                text, buttons = format_message(item, category)
-                for chat in chats:
-                    try:
-                        await bot.send_message(
-                            chat_id=chat['chat_id'],
-                            text=text,
-                            parse_mode="HTML",
-                            reply_markup=InlineKeyboardMarkup(buttons) if buttons else None,
-                            disable_web_page_preview=True
-                        )
-                        posted_total += 1
-                        await asyncio.sleep(0.5)
-                    except Exception as e:
-                        err = str(e).lower()
-                        logger.warning(f"Post failed {chat['chat_id']}: {e}")
-                        if any(x in err for x in ["kicked", "not found", "deactivated", "blocked", "forbidden"]):
-                            db.remove_chat(chat['chat_id'])
-                db.mark_posted(item['id'], item.get('title', ''), item.get('link', ''))
-                logger.info(f"✅ Posted: {item['title'][:60]}")
-                await asyncio.sleep(1)
+                # Chats dropped while posting the previous item are skipped
+                targets = [c for c in targets if c.chat_id in registry and c.chat_id not in digest_chats]
+                posted_total += await post_item(bot, item, category, targets, timer)
+                db.mark_posted(item.id, item.title, item.link)
+                posted_jobs.append((item, category))
+                logger.info(f"✅ Posted: {item.title[:60]}")
+                if cycle:
+                    cycle.items_posted, cycle.messages = len(posted_jobs), posted_total
+                if ITEM_DELAY and targets:
+                    await asyncio.sleep(ITEM_DELAY)
             except Exception as e:
                 logger.error(f"Item error: {e}")
+        # Even after a cancel: the items posted so far are marked posted, so digest chats
+        # would never get them otherwise
+        if digest_chats and posted_jobs:
+            if cycle:
+                cycle.stage = "digests"
+            posted_total += await post_digests(bot, routed, digest_chats, {item.id for item, _ in posted_jobs}, timer)
 
+        try:
+            for job_id, remind_at in db.save_jobs(posted_jobs):
+                deadline_queue.push(job_id, remind_at)
+        except Exception as e:
+            logger.error(f"save_jobs error: {e}")
+        timer.messages = posted_total
+        if cycle:
+            cycle.messages = posted_total
         logger.info(f"🎯 Done — {posted_total} messages to {len(chats)} chats")
         return posted_total
+    except CycleCancelled:
+        logger.info("🛑 Cycle cancelled before posting")
+        return 0
     except Exception as e:
         logger.error(f"fetch_and_post error: {e}")
         return 0
+    finally:
+        # Posted items are in posted_items now; failed ones may be retried next cycle
+        rss.release(new_items)
+        perf.finish_cycle(timer)
+        logger.info(f"⏱ Cycle #{timer.number} took {timer.total:.1f}s")
+
+def init():
+    """Logging + the process-wide singletons. Called once by main() (and by bench scripts)."""
+    global log_ring, db, rss, deadline_queue, registry, member_cache, leader, outbox, cycles
+    if db is not None:
+        return
+    log_ring = setup_logging()
+    db = Database()
+    rss = RSSFetcher()
+    deadline_queue = DeadlineQueue(db)
+    registry = ChatRegistry(db)
+    member_cache = MembershipCache()
+    leader = LeaderLease(db)
+    # DELIVERY_WORKERS > 0: deliver() queues to the outbox and worker processes send
+    outbox = DeliveryWorkers(db) if DELIVERY_WORKERS else None
+    # The scheduler and /forcefetch share it: one cycle at a time
+    cycles = CycleManager(do_fetch_and_post, leader)
+
+def _digest_chats(routed) -> set:
+    """Chats in digest mode with more than DIGEST_THRESHOLD items this cycle."""
+    pending = Counter(c.chat_id for _, _, targets in routed for c in targets if c.digest)
+    return {chat_id for chat_id, n in pending.items() if n > DIGEST_THRESHOLD}
+
+async def post_digests(bot, routed, digest_chats, posted_ids, timer=None) -> int:
+    """One message per category (per DIGEST_MAX_ITEMS) instead of one per item."""
+    # Chats with the same items in a category (e.g. all unfiltered ones) share one rendered digest
+    per_chat = defaultdict(lambda: defaultdict(list))  # chat -> category -> items
+    for item, category, targets in routed:
+        if item.id in posted_ids:
+            for c in targets:
+                if c.chat_id in digest_chats:
+                    per_chat[c][category].append(item)
+    groups = defaultdict(list)  # (category, items) -> chats
+    for chat, by_category in per_chat.items():
+        for category, items in by_category.items():
+            for i in range(0, len(items), DIGEST_MAX_ITEMS):
+                groups[(category, tuple(items[i:i + DIGEST_MAX_ITEMS]))].append(chat)
+    sent = 0
+    for (category, items), group_chats in groups.items():
+        with timer.stage("format") if timer else nullcontext():
+            text, buttons = format_digest(list(items), category)
+        sent += await deliver(bot, [c for c in group_chats if c.chat_id in registry], text, buttons, timer)
+    logger.info(f"🗞 Digest: {len(groups)} messages for {len(digest_chats)} chats")
+    return sent
 
 # ─────────────────────────────────────────
 # BACKGROUND SCHEDULER
@@ -82,34 +270,91 @@ async def do_fetch_and_post(bot):
 def scheduler_loop(loop):
     global _bot_ref
     logger.info("🕐 Scheduler thread started!")
-    time.sleep(20)
+    if not bot_ready.wait(timeout=120):
+        logger.warning("Bot not ready after 120s — starting fetch anyway")
+    if FIRST_FETCH_DELAY:
+        time.sleep(FIRST_FETCH_DELAY)
     cycle = 0
     while True:
+        # Only the lease holder fetches; standbys keep checking so they can take over
+        if not leader.is_leader:
+            time.sleep(leader.renew_every)
+            continue
+        # A fresh process fetches right away (FIRST_FETCH_DELAY=0) instead of waiting out
+        # the interval of the cycle its predecessor finished before the restart
+        due_in = leader.cycle_due_in(INTERVAL_SECONDS, first=cycle == 0 and not FIRST_FETCH_DELAY)
+        if due_in > 0:
+            time.sleep(min(due_in, leader.renew_every))
+            continue
+
         cycle += 1
         logger.info(f"🔄 Scheduler cycle #{cycle}")
         if _bot_ref:
-            try:
-                future = asyncio.run_coroutine_threadsafe(do_fetch_and_post(_bot_ref), loop)
-                result = future.result(timeout=300)
-                logger.info(f"✅ Cycle #{cycle} done: {result} posts")
-            except Exception as e:
-                logger.error(f"Scheduler error: {e}")
+            # Waits for an admin-started cycle instead of running a second one
+            future = asyncio.run_coroutine_threadsafe(cycles.run(_bot_ref, "scheduler"), loop)
+            waited = 0
+            while True:
+                # No time limit: SEND_DELAY x chats x items can legitimately take long, and
+                # only /cancel or a lost lease may cut delivery short
+                try:
+                    result = future.result(timeout=CYCLE_REPORT_EVERY)
+                    logger.info(f"✅ Cycle #{cycle} done: {result} posts")
+                    if cycle == 1:
+                        startup.mark("first_cycle")
+                        logger.info(f"⚡ {startup.summary()}")
+                    break
+                except concurrent.futures.TimeoutError:
+                    waited += CYCLE_REPORT_EVERY
+                    running = cycles.current
+                    logger.info(f"⏳ Cycle #{cycle} still running after {waited}s"
+                                + (f" — {running.stage}" if running else ""))
+                except Exception as e:
+                    logger.error(f"Scheduler error: {e}")
+                    break
         else:
             logger.warning("Bot ref not ready!")
-        logger.info(f"😴 Sleeping {FETCH_INTERVAL_MINUTES} min...")
-        time.sleep(INTERVAL_SECONDS)
+        if not leader.mark_cycle():
+            logger.warning("👑 Lease lost during the cycle — the new leader keeps the schedule")
+            time.sleep(leader.renew_every)
+            continue
+        logger.info(f"😴 Next cycle in {FETCH_INTERVAL_MINUTES} min")
+
+# ─────────────────────────────────────────
+# LAST DATE REMINDERS
+# ─────────────────────────────────────────
+async def send_reminder(bot, job: dict) -> int:
+    days_left = (date.fromisoformat(job['deadline']) - date.today()).days
+    text, buttons = template_reminder(job, days_left)
+    chats = router.route(registry.chats, job['title'], job.get('summary') or '', job.get('category') or 'last_date')
+    return await deliver(bot, chats, text, buttons)
+
+def reminder_loop(loop):
+    logger.info("⏳ Reminder thread started!")
+    bot_ready.wait()  # claimed reminders need a bot to send them
+    while True:
+        try:
+            if deadline_queue.needs_refill():
+                deadline_queue.refill()
+            for remind_at, job_id in deadline_queue.wait_due():
+                job = db.claim_reminder(job_id, remind_at)
+                if not job or not _bot_ref:
+                    continue
+                future = asyncio.run_coroutine_threadsafe(send_reminder(_bot_ref, job), loop)
+                logger.info(f"⏳ Reminder sent ({future.result(timeout=300)} chats): {job['title'][:60]}")
+        except Exception as e:
+            logger.error(f"Reminder error: {e}")
+            time.sleep(30)
 
 # ─────────────────────────────────────────
 # HELPERS
 # ─────────────────────────────────────────
 def is_admin(uid): return str(uid) == str(ADMIN_ID)
 
-async def check_member(bot, uid) -> bool:
-    try:
-        m = await bot.get_chat_member(CHANNEL_USERNAME, uid)
-        return m.status in ["member", "administrator", "creator"]
-    except Exception:
-        return False
+def _escape_html(text: str) -> str:
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+async def check_member(bot, uid, fresh=False) -> bool:
+    return await member_cache.check(bot, uid, fresh=fresh)
 
 async def send_welcome(target, context, edit=False):
     keyboard = [
@@ -179,7 +424,8 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def verify_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer("Checking...")
-    if await check_member(context.bot, query.from_user.id):
+    # Bypass a cached "not joined" — the user likely just joined
+    if await check_member(context.bot, query.from_user.id, fresh=True):
         await send_welcome(query, context, edit=True)
     else:
         keyboard = [
@@ -206,6 +452,11 @@ async def show_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "4️⃣ Channel/Group mein auto-post karta hai\n"
         "5️⃣ Duplicates kabhi nahi aate\n\n"
         "━━━━━━━━━━━━━━━━━━━━━━━\n"
+        "🙋 <b>Sabke Liye:</b>\n"
+        "━━━━━━━━━━━━━━━━━━━━━━━\n"
+        "🔎 /search &lt;query&gt; — Posted jobs dhundo (e.g. ssc this week)\n"
+        "🎯 /filter — Chat admin: sirf chosen category/authority/state posts\n\n"
+        "━━━━━━━━━━━━━━━━━━━━━━━\n"
         "👑 <b>Admin Commands:</b>\n"
         "━━━━━━━━━━━━━━━━━━━━━━━\n"
         "🔄 /forcefetch — Abhi turant fetch karo\n"
@@ -216,7 +467,8 @@ async def show_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "❌ /removechat &lt;id&gt; — Chat hatao\n"
         "📢 /broadcast &lt;msg&gt; — Sabko message\n"
         "🧪 /test — Live job preview dekho\n"
-        "📝 /logs — Recent logs dekho\n\n"
+        "📝 /logs [level] [module] — Recent logs dekho\n"
+        "⏱ /perf [n] — Last n cycles ka timing\n\n"
         "━━━━━━━━━━━━━━━━━━━━━━━\n"
         "🌟 <b>Features:</b>\n"
         "━━━━━━━━━━━━━━━━━━━━━━━\n"
@@ -251,7 +503,7 @@ async def handle_my_chat_member(update: Update, context: ContextTypes.DEFAULT_TY
     chat = result.chat
     status = result.new_chat_member.status
     if status in ["member", "administrator"]:
-        db.add_chat(chat.id, chat.title or "", chat.type)
+        registry.add(chat.id, chat.title or "", chat.type)
         logger.info(f"✅ Registered: {chat.title} ({chat.id})")
         try:
             await context.bot.send_message(
@@ -266,16 +518,262 @@ async def handle_my_chat_member(update: Update, context: ContextTypes.DEFAULT_TY
         except Exception as e:
             logger.error(f"Welcome msg failed: {e}")
     elif status in ["left", "kicked"]:
-        db.remove_chat(chat.id)
+        drop_chat(chat.id)
         logger.info(f"❌ Removed: {chat.title} ({chat.id})")
 
+# ─────────────────────────────────────────
+# /search
+# ─────────────────────────────────────────
+def _search_page(query: str, page: int) -> tuple:
+    match, since = parse_query(query)
+    rows = db.search_jobs(match, since, limit=PAGE_SIZE + 1, offset=page * PAGE_SIZE)
+    has_next = len(rows) > PAGE_SIZE
+    rows = rows[:PAGE_SIZE]
+    if not rows:
+        text = f"🔎 <b>{_escape_html(query)}</b>\n\n❌ Kuch nahi mila. Dusre words try karo."
+        return text, None
+    text = f"🔎 <b>{_escape_html(query)}</b> — page {page + 1}\n\n"
+    for n, r in enumerate(rows, page * PAGE_SIZE + 1):
+        last = f" | ⏳ Last: {r['last_date']}" if r['last_date'] else ""
+        text += (
+            f"{n}. <a href='{_escape_html(r['link'])}'>{_escape_html(r['title'][:90])}</a>\n"
+            f"   🏷 {r['category']} | 📅 {r['created_at'][:10]}{last}\n"
+        )
+    nav = []
+    if page > 0:
+        nav.append(InlineKeyboardButton("◀️ Prev", callback_data=f"search:{page - 1}"))
+    if has_next:
+        nav.append(InlineKeyboardButton("Next ▶️", callback_data=f"search:{page + 1}"))
+    return text, InlineKeyboardMarkup([nav]) if nav else None
+
+async def cmd_search(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if not context.args:
+        await update.message.reply_text(
+            "Usage: /search &lt;query&gt;\nExample: <code>/search ssc this week</code>", parse_mode="HTML"
+        )
+        return
+    query = " ".join(context.args)[:100]
+    text, markup = await asyncio.to_thread(_search_page, query, 0)
+    msg = await update.message.reply_text(
+        text, parse_mode="HTML", reply_markup=markup, disable_web_page_preview=True
+    )
+    # Remember the query per result message so any member can page through it
+    searches = context.chat_data.setdefault("searches", {})
+    searches[msg.message_id] = query
+    while len(searches) > 20:
+        searches.pop(next(iter(searches)))
+
+async def search_nav(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.callback_query
+    search = context.chat_data.get("searches", {}).get(query.message.message_id)
+    if not search:
+        await query.answer("Search expired — /search dobara chalao", show_alert=True)
+        return
+    await query.answer()
+    page = max(0, int(query.data.split(":", 1)[1]))
+    text, markup = await asyncio.to_thread(_search_page, search, page)
+    await query.edit_message_text(text, parse_mode="HTML", reply_markup=markup, disable_web_page_preview=True)
+
+# ─────────────────────────────────────────
+# /filter — per-chat subscriptions
+# ─────────────────────────────────────────
+FILTER_USAGE = (
+    "🎯 <b>Filters</b> — sirf matching posts is chat mein aayenge\n\n"
+    "/filter — current filters\n"
+    "/filter add &lt;kind&gt; &lt;value&gt;\n"
+    "/filter remove &lt;kind&gt; [value]\n"
+    "/filter clear\n\n"
+    f"<b>kind:</b> {', '.join(KINDS)}\n"
+    f"<b>category:</b> {', '.join(CATEGORIES)}\n"
+    f"<b>authority:</b> {', '.join(AUTHORITY_KEYS)}\n"
+    "<b>state:</b> e.g. bihar, uttar pradesh\n"
+    "<b>keyword:</b> 1-3 words, e.g. <code>bank po</code>\n\n"
+    "Same kind = OR, alag kinds = AND."
+)
+
+def reload_router():
+    global router
+    router = Router(db.get_chat_filters())
+
+def reload_chats():
+    """Re-read chats (with their digest setting) and filter rules from the DB."""
+    registry.load()
+    reload_router()
+
+def drop_chat(chat_id: int):
+    registry.remove(chat_id)  # also deletes the chat's filters
+    reload_router()
+
+async def is_chat_admin(bot, chat, user) -> bool:
+    if user and is_admin(user.id):
+        return True
+    if not user or chat.type == "private":
+        return False
+    try:
+        m = await bot.get_chat_member(chat.id, user.id)
+        return m.status in ["administrator", "creator"]
+    except Exception:
+        return False
+
+def _describe_filters(chat_id: int) -> str:
+    rules = db.get_chat_filters(chat_id).get(chat_id, {})
+    if not rules:
+        return "🎯 Koi filter nahi — is chat ko saare posts milte hain."
+    lines = [f"🎯 <b>Filters for</b> <code>{chat_id}</code>:"]
+    for kind in KINDS:
+        if rules.get(kind):
+            lines.append(f"• {kind}: {', '.join(sorted(rules[kind]))}")
+    return "\n".join(lines)
+
+async def cmd_filter(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    args = list(context.args or [])
+    chat_id = update.effective_chat.id
+    # Bot admin can manage any chat (e.g. channels) from private: /filter <chat_id> ...
+    if args and args[0].lstrip('-').isdigit() and is_admin(update.effective_user.id):
+        chat_id = int(args.pop(0))
+    elif not await is_chat_admin(context.bot, update.effective_chat, update.effective_user):
+        await update.message.reply_text("❌ Sirf chat admins filters set kar sakte hain.")
+        return
+
+    action = args.pop(0).lower() if args else "list"
+    if action == "list":
+        await update.message.reply_text(_describe_filters(chat_id), parse_mode="HTML")
+        return
+    if action == "clear":
+        db.remove_chat_filters(chat_id)
+        reload_router()
+        await update.message.reply_text("✅ Filters cleared — ab saare posts aayenge.")
+        return
+    if action not in ("add", "remove") or not args or args[0].lower() not in KINDS:
+        await update.message.reply_text(FILTER_USAGE, parse_mode="HTML")
+        return
+
+    kind = args.pop(0).lower()
+    value = validate_filter(kind, " ".join(args)) if args else None
+    if action == "add":
+        if not value:
+            await update.message.reply_text(f"❌ Invalid {kind} value.\n\n{FILTER_USAGE}", parse_mode="HTML")
+            return
+        db.add_chat_filter(chat_id, kind, value)
+    else:
+        db.remove_chat_filters(chat_id, kind, value)
+    reload_router()
+    await update.message.reply_text(_describe_filters(chat_id), parse_mode="HTML")
+
+async def cmd_digest(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    args = list(context.args or [])
+    chat_id = update.effective_chat.id
+    # Same as /filter: bot admin may pass a chat_id first
+    if args and args[0].lstrip('-').isdigit() and is_admin(update.effective_user.id):
+        chat_id = int(args.pop(0))
+    elif not await is_chat_admin(context.bot, update.effective_chat, update.effective_user):
+        await update.message.reply_text("❌ Sirf chat admins digest mode badal sakte hain.")
+        return
+    if chat_id not in registry:
+        await update.message.reply_text("❌ Chat registered nahi hai — pehle /addchat karo.")
+        return
+
+    action = args[0].lower() if args else ""
+    if action in ("on", "off"):
+        registry.set_digest(chat_id, action == "on")
+    on = any(c.digest for c in registry.chats if c.chat_id == chat_id)
+    await update.message.reply_text(
+        f"🗞 Digest mode: <b>{'ON' if on else 'OFF'}</b>\n\n"
+        f"ON = ek cycle mein {DIGEST_THRESHOLD} se zyada posts hon to har category ka ek compact message.\n"
+        "/digest on | /digest off",
+        parse_mode="HTML"
+    )
+
 # ─────────────────────────────────────────
 # ADMIN COMMANDS
 # ─────────────────────────────────────────
+FEEDS_USAGE = (
+    "📡 <b>Feeds</b>\n\n"
+    "/feeds — list\n"
+    "/feeds add &lt;url&gt; [name] [limit=N] [timeout=S] [scrape=on|off] [parser=stream|feedparser]\n"
+    "/feeds disable &lt;#id|name|url&gt;\n"
+    "/feeds enable &lt;#id|name|url&gt;\n\n"
+    "Existing URL par add = settings update. Changes agle cycle se lagte hain."
+)
+
+def _feed_options(args) -> tuple:
+    """(name, settings) from /feeds add arguments; ValueError on a bad option."""
+    name, settings = [], {}
+    for arg in args:
+        key, sep, value = arg.partition("=")
+        if not sep:
+            name.append(arg)
+            continue
+        key, value = key.lower(), value.lower()
+        try:
+            if key == "limit":
+                settings['entry_limit'] = int(value)
+                if settings['entry_limit'] < 1:
+                    raise ValueError
+            elif key == "timeout":
+                settings['timeout'] = float(value)
+                if not 0 < settings['timeout'] <= 120:
+                    raise ValueError
+            elif key == "scrape" and value in ("on", "off"):
+                settings['scrape'] = value == "on"
+            elif key == "parser" and value in PARSERS:
+                settings['parser'] = value
+            else:
+                raise ValueError
+        except ValueError:
+            raise ValueError(f"Invalid option: {arg}")
+    return " ".join(name), settings
+
+async def cmd_feeds(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if not is_admin(update.effective_user.id): return
+    args = list(context.args or [])
+    action = args.pop(0).lower() if args else "list"
+    feeds = rss.feeds
+
+    if action == "list":
+        await asyncio.to_thread(feeds.load)
+        lines = "\n".join(describe_feed(f) for f in feeds.all)
+        await update.message.reply_text(
+            f"📡 <b>Feeds</b> — {len(feeds.feeds)}/{len(feeds.all)} enabled\n\n{_escape_html(lines)}",
+            parse_mode="HTML", disable_web_page_preview=True
+        )
+        return
+
+    if action == "add" and args and args[0].startswith(("http://", "https://")):
+        url = args.pop(0)
+        try:
+            name, settings = _feed_options(args)
+        except ValueError as e:
+            await update.message.reply_text(f"❌ {_escape_html(str(e))}\n\n{FEEDS_USAGE}", parse_mode="HTML")
+            return
+        # Read it once so a typo shows up now rather than as "No entries" every cycle
+        try:
+            n = await asyncio.to_thread(rss.probe, url, settings.get("timeout") or DEFAULT_TIMEOUT)
+            check = f"✅ Test read: {n} entries"
+        except Exception as e:
+            check = f"⚠️ Test read failed: {e}"
+        feed = await asyncio.to_thread(feeds.add, url, name or None, **settings)
+        await update.message.reply_text(
+            f"➕ {_escape_html(describe_feed(feed))}\n{_escape_html(check)}", disable_web_page_preview=True,
+            parse_mode="HTML"
+        )
+        return
+
+    if action in ("enable", "disable") and args:
+        feed = feeds.find(" ".join(args))
+        if not feed:
+            await update.message.reply_text("❌ Feed nahi mila — /feeds se list dekho.")
+            return
+        await asyncio.to_thread(feeds.set_enabled, feed, action == "enable")
+        await update.message.reply_text(_escape_html(describe_feed(feeds.find(str(feed.id)))), parse_mode="HTML")
+        return
+
+    await update.message.reply_text(FEEDS_USAGE, parse_mode="HTML")
+
 async def cmd_addchat(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not is_admin(update.effective_user.id): return
     chat = update.effective_chat
-    db.add_chat(chat.id, chat.title or "Private", chat.type)
+    registry.add(chat.id, chat.title or "Private", chat.type)
     await update.message.reply_text(
         f"✅ <b>Registered!</b>\nName: <b>{chat.title or 'Private'}</b>\nID: <code>{chat.id}</code>",
         parse_mode="HTML"
@@ -291,45 +789,93 @@ async def cmd_cleardb(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def cmd_forcefetch(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not is_admin(update.effective_user.id): return
-    chats = db.get_all_chats()
+    chats = registry.chats
     if not chats:
         await update.message.reply_text(
             "❌ <b>Koi chat registered nahi!</b>\n\nBot ko channel mein Admin banao phir /addchat bhejo.",
             parse_mode="HTML"
         )
         return
-    msg = await update.message.reply_text(
-        f"🔄 <b>Fetching...</b>\n👥 Chats: {len(chats)}\n🔍 Page scraping ho raha hai...\n⏳ Wait karo...",
-        parse_mode="HTML"
-    )
-    count = await do_fetch_and_post(context.bot)
-    await msg.edit_text(
-        f"✅ <b>Done!</b>\n\n📨 Posted: <b>{count}</b>\n👥 Chats: <b>{len(chats)}</b>\n"
-        f"{'⚠️ 0 posts — try /cleardb then /forcefetch again' if count == 0 else '🎉 Check your channel!'}",
-        parse_mode="HTML"
+    # Only the lease holder fetches — a standby would run a second cycle next to the leader's
+    if not leader.is_leader:
+        await update.message.reply_text(
+            f"👑 <b>Ye instance standby hai</b> — fetch sirf leader karta hai.\n\n"
+            f"<code>{_escape_html(leader.status())}</code>",
+            parse_mode="HTML"
+        )
+        return
+    # Runs in the background: the handler returns right away and the message shows progress
+    cycle = cycles.start(context.bot, "admin")
+    if cycle is None:
+        cycle = cycles.current
+        header = f"⏳ <b>Cycle #{cycle.number} pehle se chal raha hai</b> ({cycle.trigger})"
+    else:
+        header = f"🔄 <b>Fetching...</b>\n👥 Chats: {len(chats)}"
+    msg = await update.message.reply_text(_progress_text(header, cycle), parse_mode="HTML")
+    context.application.create_task(watch_cycle(msg, cycle, header))
+
+def _progress_text(header: str, cycle) -> str:
+    return f"{header}\n\n<pre>{_escape_html(cycle.describe())}</pre>\n\n🛑 /cancel — cycle roko"
+
+async def watch_cycle(msg, cycle, header: str):
+    """Edit msg with the cycle's progress every PROGRESS_EVERY seconds, then with the result."""
+    while not cycle.done:
+        try:
+            await asyncio.wait_for(asyncio.shield(cycle.task), PROGRESS_EVERY)
+        except asyncio.TimeoutError:
+            try:
+                await msg.edit_text(_progress_text(header, cycle), parse_mode="HTML")
+            except Exception as e:
+                logger.warning(f"Progress edit failed: {e}")
+        except Exception:
+            break
+    count = cycle.result or 0
+    if cycle.lease_lost:
+        status = f"👑 <b>Stopped — instance lost the lease</b>\n\n📨 Posted: <b>{count}</b>"
+    elif cycle.cancelled:
+        status = f"🛑 <b>Cancelled</b>\n\n📨 Posted: <b>{count}</b>"
+    else:
+        status = (
+            f"✅ <b>Done!</b>\n\n📨 Posted: <b>{count}</b>\n"
+            f"{'⚠️ 0 posts — try /cleardb then /forcefetch again' if count == 0 else '🎉 Check your channel!'}"
+        )
+    await msg.edit_text(f"{status}\n\n<pre>{_escape_html(cycle.describe())}</pre>", parse_mode="HTML")
+
+async def cmd_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if not is_admin(update.effective_user.id): return
+    cycle = cycles.cancel()
+    if cycle is None:
+        await update.message.reply_text("😴 Koi cycle nahi chal raha.")
+        return
+    await update.message.reply_text(
+        f"🛑 Cycle #{cycle.number} ({cycle.trigger}) current stage ke baad ruk jayega."
     )
 
 async def cmd_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not is_admin(update.effective_user.id): return
-    chats = db.get_all_chats()
     await update.message.reply_text(
         f"📊 <b>Bot Stats</b>\n\n"
-        f"👥 Active Chats: <code>{len(chats)}</code>\n"
+        f"👥 Active Chats: <code>{len(registry)}</code>\n"
         f"📝 Total Posted: <code>{db.get_post_count()}</code>\n"
+        f"🗂 Jobs Stored: <code>{db.get_job_count()}</code>\n"
+        f"🔐 Member Cache: <code>{len(member_cache)}</code> (hits {member_cache.hits} / misses {member_cache.misses})\n"
+        f"📡 Feeds: <code>{len(rss.feeds.feeds)}/{len(rss.feeds.all)}</code> enabled\n"
         f"⏱ Interval: <b>{FETCH_INTERVAL_MINUTES} min</b>\n"
-        f"🔄 Scheduler: <b>✅ Running</b>",
+        f"🔄 Scheduler: <b>✅ Running</b>\n"
+        f"👑 Instance: <code>{_escape_html(leader.status())}</code>"
+        + (f"\n📮 Outbox: <code>{db.get_outbox_counts()}</code>" if outbox else ""),
         parse_mode="HTML"
     )
 
 async def cmd_listchats(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not is_admin(update.effective_user.id): return
-    chats = db.get_all_chats()
+    chats = registry.chats
     if not chats:
         await update.message.reply_text("⚠️ No chats. Bot ko channel mein Admin banao ya /addchat use karo.")
         return
     text = "📋 <b>Active Chats:</b>\n\n"
     for c in chats[:20]:
-        text += f"• <code>{c['chat_id']}</code> — {c['title']} ({c['chat_type']})\n"
+        text += f"• <code>{c.chat_id}</code> — {c.title} ({c.chat_type})\n"
     await update.message.reply_text(text, parse_mode="HTML")
 
 async def cmd_removechat(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -337,7 +883,7 @@ async def cmd_removechat(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not context.args:
         await update.message.reply_text("Usage: /removechat &lt;chat_id&gt;", parse_mode="HTML")
         return
-    db.remove_chat(int(context.args[0]))
+    drop_chat(int(context.args[0]))
     await update.message.reply_text("✅ Removed.")
 
 async def cmd_broadcast(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -346,14 +892,8 @@ async def cmd_broadcast(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Usage: /broadcast &lt;message&gt;", parse_mode="HTML")
         return
     msg = " ".join(context.args)
-    chats = db.get_all_chats()
-    ok = 0
-    for chat in chats:
-        try:
-            await context.bot.send_message(chat['chat_id'], f"📢 <b>Broadcast</b>\n\n{msg}", parse_mode="HTML")
-            ok += 1
-        except Exception:
-            pass
+    chats = registry.chats
+    ok = await deliver(context.bot, chats, f"📢 <b>Broadcast</b>\n\n{msg}")
     await update.message.reply_text(f"✅ Sent to {ok}/{len(chats)} chats.")
 
 async def cmd_test(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -361,7 +901,8 @@ async def cmd_test(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     await update.message.reply_text("🔍 <b>Live job fetch + page scrape ho rahi hai...</b>", parse_mode="HTML")
     try:
-        import feedparser, re as re2
+        import re as re2
+        feedparser = get_feedparser()
 
         item = None
         for feed_url, sname in [
@@ -370,7 +911,7 @@ async def cmd_test(update: Update, context: ContextTypes.DEFAULT_TYPE):
             ("https://aglasem.com/feed/", "AglaSem"),
         ]:
             try:
-                feed = feedparser.parse(feed_url)
+                feed = await asyncio.to_thread(feedparser.parse, feed_url)
                 if feed.entries:
                     e = feed.entries[0]
                     summary = re2.sub(r'<[^>]+>', ' ', e.get('summary', '') or '')[:400]
@@ -390,41 +931,14 @@ async def cmd_test(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         await update.message.reply_text(f"📌 Fetched: <b>{item['title'][:60]}</b>\n🔍 Page scraping...", parse_mode="HTML")
 
-        # Use rss_fetcher's scraper and extractor
-        page_text = rss.scrape_page(item['link']) if hasattr(rss, '_scrape_page') else rss._scrape_page(item['link'])
-        details = rss._extract_details(page_text, item['title'], item['summary'])
-
-        import hashlib
-        item_id = hashlib.md5((item['link'] + item['title']).encode()).hexdigest()
-        full_item = {
-            'id': 'test_' + item_id,
-            'title': details.get('exam_name', item['title']),
-            'link': item['link'],
-            'summary': item['summary'],
-            'published': None,
-            'source': item['source'],
-            'exam_date': details.get('exam_date', 'Not Announced Yet'),
-            'form_dates': f"Start: {details.get('form_start_date','N/A')} | Last: {details.get('form_last_date','N/A')}",
-            'authority': details.get('authority', item['source']),
-            'institute': details.get('institute', item['source']),
-            'eligibility': details.get('eligibility', 'Not Available'),
-            'pattern': details.get('pattern', 'Not Available'),
-            'syllabus': details.get('syllabus', 'Not Available'),
-            'strategy': details.get('strategy', 'Not Available'),
-            'insights': details.get('insights', 'Not Available'),
-            'selection': details.get('selection', 'Not Available'),
-            'seats': details.get('seats', 'Not Available'),
-            'salary': details.get('salary', 'Not Available'),
-            'why_exam': details.get('why_exam', 'Not Available'),
-            'admit_card_status': details.get('admit_card_status', 'Not Released Yet'),
-            'result_status': details.get('result_status', 'Not Declared Yet'),
-            'min_age': details.get('min_age', 'Not Available'),
-            'max_age': details.get('max_age', 'Not Available'),
-            'fee': details.get('fee', 'Not Available'),
-            'qualification': details.get('qualification', 'Not Available'),
-        }
-
-        cat = classify_update(full_item['title'] + ' ' + full_item.get('summary', ''))
+        # Use rss_fetcher's scraper and extractor — both off the event loop, like a cycle
+        page_text = await asyncio.to_thread(rss._scrape_page, item['link'])
+        details = await asyncio.to_thread(rss._extract_details, page_text, item['title'], item['summary'])
+
+        item['id'] = 'test_' + rss._generate_id(item)
+        full_item = JobItem.from_entry(item, details)
+
+        cat = classify_update(full_item.title + ' ' + full_item.summary)
         text, buttons = format_message(full_item, cat)
 
         await update.message.reply_text(
@@ -438,7 +952,7 @@ async def cmd_test(update: Update, context: ContextTypes.DEFAULT_TYPE):
             disable_web_page_preview=True
         )
         await update.message.reply_text(
-            f"📊 Chats: <b>{len(db.get_all_chats())}</b> | Posted: <b>{db.get_post_count()}</b>",
+            f"📊 Chats: <b>{len(registry)}</b> | Posted: <b>{db.get_post_count()}</b>",
             parse_mode="HTML"
         )
     except Exception as e:
@@ -447,19 +961,34 @@ async def cmd_test(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def cmd_logs(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not is_admin(update.effective_user.id): return
-    try:
-        with open("bot.log", "r") as f:
-            lines = f.readlines()[-40:]
-        await update.message.reply_text(f"<pre>{''.join(lines)[-3500:]}</pre>", parse_mode="HTML")
-    except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+    # /logs [level] [module] — e.g. /logs warning rss_fetcher
+    level, module = logging.NOTSET, None
+    for arg in context.args or []:
+        lvl = logging.getLevelName(arg.upper())
+        if isinstance(lvl, int):
+            level = lvl
+        else:
+            module = arg
+    lines = log_ring.tail(40, level, module)
+    if not lines:
+        await update.message.reply_text("📭 No matching log lines.")
+        return
+    text = "\n".join(lines)[-3500:]
+    await update.message.reply_text(f"<pre>{_escape_html(text)}</pre>", parse_mode="HTML")
+
+async def cmd_perf(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if not is_admin(update.effective_user.id): return
+    n = int(context.args[0]) if context.args and context.args[0].isdigit() else 5
+    text = _escape_html(f"{startup.summary()}\n\n{perf.summary(last_n=min(n, 20))}".strip())
+    await update.message.reply_text(f"⏱ <b>Last cycles</b>\n\n<pre>{text[-3500:]}</pre>", parse_mode="HTML")
 
 async def cmd_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(
         "📖 <b>Commands:</b>\n\n"
-        "🔄 /forcefetch\n🗑 /cleardb\n📊 /stats\n"
+        "🔎 /search &lt;query&gt;\n🎯 /filter\n🗞 /digest on|off\n\n"
+        "🔄 /forcefetch\n🛑 /cancel\n📡 /feeds\n🗑 /cleardb\n📊 /stats\n"
         "📋 /listchats\n➕ /addchat\n❌ /removechat &lt;id&gt;\n"
-        "📢 /broadcast &lt;msg&gt;\n🧪 /test\n📝 /logs\n\n"
+        "📢 /broadcast &lt;msg&gt;\n🧪 /test\n📝 /logs [level] [module]\n⏱ /perf\n\n"
         "⏱ Auto: Har <b>30 min</b> | 👑 @ethicalrobo",
         parse_mode="HTML"
     )
@@ -467,11 +996,31 @@ async def cmd_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # ─────────────────────────────────────────
 # MAIN
 # ─────────────────────────────────────────
+async def on_ready(app: Application):
+    startup.mark("bot_ready")
+    bot_ready.set()
+
 def main():
     global _bot_ref
+    startup.mark("imports")
+    init()
     db.init_db()
+    registry.load()
+    rss.feeds.load()
+    reload_router()
+    leader.start()
+    if outbox:
+        outbox.start()
+    startup.mark("db")
 
-    app = Application.builder().token(BOT_TOKEN).build()
+    builder = (
+        Application.builder().token(BOT_TOKEN)
+        .base_url(f"{TELEGRAM_API_BASE}/bot")
+        .base_file_url(f"{TELEGRAM_API_BASE}/file/bot")
+    )
+    if BOT_MODE == "webhook":
+        builder = builder.updater(None)
+    app = builder.post_init(on_ready).build()
     _bot_ref = app.bot
 
     app.add_handler(CommandHandler("start", start))
@@ -479,22 +1028,45 @@ def main():
     app.add_handler(CallbackQueryHandler(verify_start, pattern="^verify_start$"))
     app.add_handler(CallbackQueryHandler(show_help, pattern="^show_help$"))
     app.add_handler(CallbackQueryHandler(back_home, pattern="^back_home$"))
+    app.add_handler(CommandHandler("search", cmd_search))
+    app.add_handler(CommandHandler("filter", cmd_filter))
+    app.add_handler(CommandHandler("digest", cmd_digest))
+    app.add_handler(CallbackQueryHandler(search_nav, pattern=r"^search:\d+$"))
     app.add_handler(ChatMemberHandler(handle_my_chat_member, ChatMemberHandler.MY_CHAT_MEMBER))
     app.add_handler(CommandHandler("addchat", cmd_addchat))
     app.add_handler(CommandHandler("cleardb", cmd_cleardb))
     app.add_handler(CommandHandler("forcefetch", cmd_forcefetch))
+    app.add_handler(CommandHandler("cancel", cmd_cancel))
+    app.add_handler(CommandHandler("feeds", cmd_feeds))
     app.add_handler(CommandHandler("stats", cmd_stats))
     app.add_handler(CommandHandler("listchats", cmd_listchats))
     app.add_handler(CommandHandler("removechat", cmd_removechat))
     app.add_handler(CommandHandler("broadcast", cmd_broadcast))
     app.add_handler(CommandHandler("test", cmd_test))
     app.add_handler(CommandHandler("logs", cmd_logs))
+    app.add_handler(CommandHandler("perf", cmd_perf))
+
+    perf.serve()
 
     loop = asyncio.get_event_loop()
     t = threading.Thread(target=scheduler_loop, args=(loop,), daemon=True, name="Scheduler")
     t.start()
-    logger.info("✅ Bot + Scheduler started!")
-    app.run_polling(allowed_updates=Update.ALL_TYPES)
+    if REMINDERS_ENABLED:
+        threading.Thread(target=reminder_loop, args=(loop,), daemon=True, name="Reminders").start()
+    startup.mark("app_build")
+    logger.info(f"✅ Bot + Scheduler started! ({BOT_MODE})")
+    if BOT_MODE == "webhook":
+        from webhook import run_webhook
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        loop.run_until_complete(run_webhook(app, ALLOWED_UPDATES, stop))
+    else:
+        # Polling clears any webhook left over from a webhook deployment
+        app.run_polling(allowed_updates=ALLOWED_UPDATES)
+    leader.stop()  # let a standby take over without waiting for the lease to expire
+    if outbox:
+        outbox.stop()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,62 @@
+"""
+In-memory registry of active chats.
+
+Loaded from the chats table at startup and kept in sync by add()/remove(),
+which write through to SQLite. Delivery, reminders and admin commands read
+the cached snapshot; a fetch cycle reloads it once, to pick up changes made
+through another instance or by delivery workers.
+"""
+import logging
+import threading
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+Chat = namedtuple("Chat", ("chat_id", "title", "chat_type", "digest"), defaults=(False,))
+
+
+class ChatRegistry:
+    def __init__(self, db):
+        self.db = db
+        self._chats = {}        # chat_id -> Chat
+        self._snapshot = ()
+        self._lock = threading.Lock()
+
+    def load(self):
+        chats = {row['chat_id']: Chat(row['chat_id'], row['title'], row['chat_type'], bool(row['digest']))
+                 for row in self.db.get_all_chats()}
+        with self._lock:
+            self._chats = chats
+            self._snapshot = tuple(chats.values())
+        logger.info(f"👥 Chat registry: {len(chats)} active chats")
+
+    def add(self, chat_id: int, title: str, chat_type: str):
+        self.db.add_chat(chat_id, title, chat_type)
+        with self._lock:
+            old = self._chats.get(chat_id)
+            self._chats[chat_id] = Chat(chat_id, title, chat_type, old.digest if old else False)
+            self._snapshot = tuple(self._chats.values())
+
+    def set_digest(self, chat_id: int, on: bool):
+        self.db.set_chat_digest(chat_id, on)
+        with self._lock:
+            if chat_id in self._chats:
+                self._chats[chat_id] = self._chats[chat_id]._replace(digest=on)
+                self._snapshot = tuple(self._chats.values())
+
+    def remove(self, chat_id: int):
+        self.db.remove_chat(chat_id)
+        with self._lock:
+            if self._chats.pop(chat_id, None):
+                self._snapshot = tuple(self._chats.values())
+
+    @property
+    def chats(self) -> tuple:
+        """Immutable snapshot — safe to iterate while chats are added/removed."""
+        return self._snapshot
+
+    def __len__(self):
+        return len(self._snapshot)
+
+    def __contains__(self, chat_id):
+        return chat_id in self._chats
@@ -1,4 +1,5 @@
 import os
+import socket
 
 BOT_TOKEN = os.environ.get("BOT_TOKEN", "8155847480:AAHiRP1qzcK27SgIaY9kdSFN5QGMxct5sX0")
 ADMIN_ID = os.environ.get("ADMIN_ID", "6593860853")
@@ -9,3 +10,42 @@ GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "AIzaSyAxy2TxMHhJ0heyIhu9k5bt4
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY", "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")
 FETCH_INTERVAL_MINUTES = int(os.environ.get("FETCH_INTERVAL_MINUTES", "30"))
 DATABASE_PATH = os.environ.get("DATABASE_PATH", "govtjobs.db")
+EXTRACT_WORKERS = int(os.environ.get("EXTRACT_WORKERS", "0"))
+PERF_HISTORY = int(os.environ.get("PERF_HISTORY", "50"))
+PERF_PORT = int(os.environ.get("PERF_PORT", "0"))
+EXTRACT_GUARD = os.environ.get("EXTRACT_GUARD", "1") == "1"
+EXTRACT_FIELD_WINDOW = int(os.environ.get("EXTRACT_FIELD_WINDOW", "6000"))
+EXTRACT_ITEM_CPU_MS = int(os.environ.get("EXTRACT_ITEM_CPU_MS", "500"))
+REMINDERS_ENABLED = os.environ.get("REMINDERS_ENABLED", "1") == "1"
+REMINDER_DAYS_BEFORE = int(os.environ.get("REMINDER_DAYS_BEFORE", "2"))
+REMINDER_HOUR = int(os.environ.get("REMINDER_HOUR", "9"))
+REMINDER_HORIZON_HOURS = int(os.environ.get("REMINDER_HORIZON_HOURS", "24"))
+MEMBER_CACHE_SIZE = int(os.environ.get("MEMBER_CACHE_SIZE", "10000"))
+MEMBER_CACHE_TTL = int(os.environ.get("MEMBER_CACHE_TTL", "3600"))
+MEMBER_CACHE_NEG_TTL = int(os.environ.get("MEMBER_CACHE_NEG_TTL", "30"))
+MEMBER_CACHE_REFRESH = os.environ.get("MEMBER_CACHE_REFRESH", "1") == "1"
+BOT_MODE = os.environ.get("BOT_MODE", "polling").lower()
+WEBHOOK_URL = os.environ.get("WEBHOOK_URL", "")
+WEBHOOK_SECRET = os.environ.get("WEBHOOK_SECRET", "")
+PORT = int(os.environ.get("PORT", "8080"))
+TELEGRAM_API_BASE = os.environ.get("TELEGRAM_API_BASE", "https://api.telegram.org").rstrip("/")
+SEND_DELAY = float(os.environ.get("SEND_DELAY", "0.5"))
+ITEM_DELAY = float(os.environ.get("ITEM_DELAY", "1"))
+SEND_RETRIES = int(os.environ.get("SEND_RETRIES", "2"))
+LOG_FILE = os.environ.get("LOG_FILE", "bot.log")
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+LOG_BACKUPS = int(os.environ.get("LOG_BACKUPS", "3"))
+LOG_BUFFER = int(os.environ.get("LOG_BUFFER", "2000"))
+FIRST_FETCH_DELAY = float(os.environ.get("FIRST_FETCH_DELAY", "0"))
+FEED_PARSER = os.environ.get("FEED_PARSER", "stream").lower()
+FEED_ENTRY_LIMIT = int(os.environ.get("FEED_ENTRY_LIMIT", "3"))
+INSTANCE_ID = os.environ.get("INSTANCE_ID") or f"{socket.gethostname()}-{os.getpid()}"
+LEADER_TTL = float(os.environ.get("LEADER_TTL", "15"))
+DELIVERY_WORKERS = int(os.environ.get("DELIVERY_WORKERS", "0"))
+GLOBAL_RATE = float(os.environ.get("GLOBAL_RATE", "25"))
+GLOBAL_BURST = float(os.environ.get("GLOBAL_BURST", "30"))
+CHAT_MIN_INTERVAL = float(os.environ.get("CHAT_MIN_INTERVAL", "3"))
+DIGEST_THRESHOLD = int(os.environ.get("DIGEST_THRESHOLD", "5"))
+UPDATE_MODE = os.environ.get("UPDATE_MODE", "edit").lower()
+UPDATE_WINDOW_DAYS = float(os.environ.get("UPDATE_WINDOW_DAYS", "30"))
+UPDATE_MIN_SIMILARITY = float(os.environ.get("UPDATE_MIN_SIMILARITY", "0.5"))
@@ -0,0 +1,122 @@
+"""
+One fetch cycle at a time, whoever starts it.
+
+The scheduler thread and /forcefetch both go through CycleManager: start()
+returns a Cycle handle (or None while another cycle holds the lock), and
+run() waits for the running cycle instead of starting a second one. The
+handle carries live progress counters for the admin's status message and a
+cancel flag that the cycle checks between stages — between feeds while
+fetching, and between items while posting — so a cancelled cycle still
+marks what it posted, sends the digests for those items, and releases the rest. With a lease, the same checks
+stop the cycle once this instance is no longer the leader, so a cycle
+longer than LEADER_TTL doesn't keep posting next to the new leader's.
+"""
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CycleCancelled(Exception):
+    pass
+
+
+class Cycle:
+    def __init__(self, number: int, trigger: str, lease=None):
+        self.number = number
+        self.trigger = trigger  # "scheduler" or "admin"
+        self.started = time.monotonic()
+        self.stage = "starting"
+        self.feeds_done = 0
+        self.feeds_total = 0
+        self.items_scraped = 0
+        self.items_total = 0
+        self.items_posted = 0
+        self.messages = 0
+        self.result = None
+        self.task = None
+        self.lease = lease  # leader.LeaderLease, or None
+        self.lease_lost = False
+        self._cancel = threading.Event()  # set from the loop, read from the fetch thread
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._cancel.is_set() and self.lease is not None and not self.lease.is_leader:
+            logger.warning(f"👑 Lease lost — stopping cycle #{self.number}")
+            self.lease_lost = True
+            self._cancel.set()
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def check(self):
+        """Called between stages; raises CycleCancelled once /cancel was sent or the lease was lost."""
+        if self.cancelled:
+            raise CycleCancelled()
+
+    @property
+    def done(self) -> bool:
+        return self.task is not None and self.task.done()
+
+    def describe(self) -> str:
+        elapsed = int(time.monotonic() - self.started)
+        lines = [
+            f"Cycle #{self.number} ({self.trigger}) — {self.stage}, {elapsed}s",
+            f"Feeds: {self.feeds_done}/{self.feeds_total}",
+            f"Pages scraped: {self.items_scraped}",
+        ]
+        if self.items_total:
+            lines.append(f"Items posted: {self.items_posted}/{self.items_total}")
+        lines.append(f"Messages: {self.messages}")
+        return "\n".join(lines)
+
+
+class CycleManager:
+    def __init__(self, run_cycle, lease=None):
+        self._run_cycle = run_cycle  # async (bot, cycle) -> messages sent
+        self.lease = lease
+        self._lock = asyncio.Lock()
+        self._count = 0
+        self.current = None
+
+    @property
+    def busy(self) -> bool:
+        # Not the lock itself: a just-started task hasn't acquired it yet
+        return self.current is not None and not self.current.done
+
+    def start(self, bot, trigger: str):
+        """Start a cycle in the background (call from the event loop); None if one is running."""
+        if self.busy:
+            return None
+        self._count += 1
+        cycle = Cycle(self._count, trigger, self.lease)
+        self.current = cycle
+        cycle.task = asyncio.get_running_loop().create_task(self._run(bot, cycle))
+        return cycle
+
+    async def _run(self, bot, cycle: Cycle):
+        async with self._lock:
+            try:
+                cycle.result = await self._run_cycle(bot, cycle)
+            finally:
+                cycle.stage = ("lease lost" if cycle.lease_lost else "cancelled") if cycle.cancelled else "done"
+        return cycle.result
+
+    async def run(self, bot, trigger: str):
+        """Run a cycle and wait for it; if one is already running, wait for that one instead."""
+        cycle = self.start(bot, trigger) or self.current
+        if cycle.trigger != trigger:
+            logger.info(f"⏭ Cycle #{cycle.number} ({cycle.trigger}) already running — waiting for it")
+        return await asyncio.shield(cycle.task)
+
+    def cancel(self):
+        """Ask the running cycle to stop after its current stage; the Cycle, or None if idle."""
+        cycle = self.current
+        if cycle is None or cycle.done:
+            return None
+        cycle.cancel()
+        logger.info(f"🛑 Cancel requested for cycle #{cycle.number}")
+        return cycle
@@ -1,15 +1,26 @@
 import sqlite3
+import json
 import logging
+import time
 from config import DATABASE_PATH
+from models import DETAIL_DEFAULTS, NOT_AVAILABLE
+from normalize import parse_date, parse_seats
+from reminders import reminder_time
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Extracted fields that go into the full-text index (the rest is boilerplate)
+FTS_FIELDS = ('institute', 'qualification', 'eligibility', 'selection', 'syllabus', 'pattern', 'salary', 'fee')
+
 class Database:
     def __init__(self):
         self.db_path = DATABASE_PATH
 
     def init_db(self):
         with sqlite3.connect(self.db_path) as conn:
+            # Readers don't block the writer — delivery workers share this file
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS posted_items (
                     id TEXT PRIMARY KEY,
@@ -27,6 +38,138 @@ class Database:
                     active INTEGER DEFAULT 1
                 )
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    link TEXT,
+                    source TEXT,
+                    category TEXT,
+                    authority TEXT,
+                    institute TEXT,
+                    summary TEXT,
+                    seats INTEGER,
+                    last_date DATE,
+                    exam_date DATE,
+                    details TEXT,
+                    published_at TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_category ON jobs (category, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_authority ON jobs (authority, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs (source, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_last_date ON jobs (last_date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS chat_filters (
+                    chat_id INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (chat_id, kind, value)
+                )
+            """)
+            # Feed sources (see feed_registry.py); NULL settings = global defaults
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feeds (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL UNIQUE,
+                    name TEXT NOT NULL,
+                    enabled INTEGER NOT NULL DEFAULT 1,
+                    entry_limit INTEGER,
+                    timeout REAL,
+                    scrape INTEGER,
+                    parser TEXT,
+                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            # Per-chat delivery preferences; kept apart from chats, which add_chat replaces wholesale
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS chat_settings (
+                    chat_id INTEGER PRIMARY KEY,
+                    digest INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS deadlines (
+                    job_id TEXT PRIMARY KEY,
+                    last_date DATE NOT NULL,
+                    remind_at TIMESTAMP NOT NULL,
+                    sent INTEGER DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_deadlines_due ON deadlines (sent, remind_at)")
+            # Sharded delivery: one row per (message, chat); shard = chat_id % DELIVERY_WORKERS
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    chat_id INTEGER NOT NULL,
+                    shard INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    markup TEXT,
+                    job_key TEXT,
+                    edit_id INTEGER,
+                    reply_to INTEGER,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_at REAL NOT NULL,
+                    claimed_at REAL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_claim ON outbox (shard, status, next_at)")
+            # Our post of each job in each chat, so updates to the job edit it / reply to it
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sent_messages (
+                    job_key TEXT NOT NULL,
+                    chat_id INTEGER NOT NULL,
+                    message_id INTEGER NOT NULL,
+                    sent_at REAL NOT NULL,
+                    PRIMARY KEY (job_key, chat_id)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sent_messages_at ON sent_messages (sent_at)")
+            # The post each job key currently points at, to tell a real update from a key collision
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_posts (
+                    job_key TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    source TEXT,
+                    host TEXT,
+                    posted_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            # Leader election between instances sharing this file (times are unix seconds)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS leases (
+                    name TEXT PRIMARY KEY,
+                    holder TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_cycle_at REAL
+                )
+            """)
+            # Full-text index; rowid = jobs.rowid
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, summary, authority, fields,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """)
+            if conn.execute("SELECT COUNT(*) FROM jobs_fts").fetchone()[0] == 0:
+                conn.execute("""
+                    INSERT INTO jobs_fts (rowid, title, summary, authority, fields)
+                    SELECT j.rowid, j.title, j.summary, j.authority,
+                           (SELECT group_concat(value, ' ') FROM json_each(j.details)
+                            WHERE key IN ({}) AND value != ?)
+                    FROM jobs j
+                """.format(",".join("?" * len(FTS_FIELDS))), (*FTS_FIELDS, NOT_AVAILABLE))
             conn.commit()
         logger.info("Database initialized")
         self._cleanup_old_posts()
@@ -58,6 +201,287 @@ class Database:
             )
             conn.commit()
 
+    def save_jobs(self, jobs: list) -> list:
+        """Batch-insert (JobItem, category) pairs from one cycle in a single transaction.
+
+        Returns [(job_id, remind_at)] for every deadline reminder scheduled.
+        """
+        if not jobs:
+            return []
+        rows = []
+        fts_rows = []
+        deadlines = []
+        for item, category in jobs:
+            details = {k: getattr(item, k) for k in DETAIL_DEFAULTS}
+            last_date = parse_date(item.form_last_date, latest=True)
+            exam_date = parse_date(item.exam_date)
+            rows.append((
+                item.id, item.title, item.link, item.source, category,
+                item.authority, item.institute, item.summary,
+                parse_seats(item.seats),
+                last_date.isoformat() if last_date else None,
+                exam_date.isoformat() if exam_date else None,
+                json.dumps(details, ensure_ascii=False),
+                item.published.isoformat(sep=' ') if item.published else None,
+            ))
+            remind_at = reminder_time(last_date)
+            if remind_at:
+                deadlines.append((item.id, last_date.isoformat(), remind_at.isoformat(sep=' ')))
+            fts_rows.append((
+                item.id, item.title, item.summary, item.authority,
+                " ".join(details[k] for k in FTS_FIELDS if details[k] != NOT_AVAILABLE),
+            ))
+        with sqlite3.connect(self.db_path) as conn:
+            # Upsert keeps the rowid stable so the FTS row can be replaced in place
+            conn.executemany("""
+                INSERT INTO jobs (
+                    id, title, link, source, category, authority, institute, summary,
+                    seats, last_date, exam_date, details, published_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    title = excluded.title, link = excluded.link, source = excluded.source,
+                    category = excluded.category, authority = excluded.authority,
+                    institute = excluded.institute, summary = excluded.summary,
+                    seats = excluded.seats, last_date = excluded.last_date,
+                    exam_date = excluded.exam_date, details = excluded.details,
+                    published_at = excluded.published_at
+            """, rows)
+            conn.executemany("""
+                INSERT OR REPLACE INTO jobs_fts (rowid, title, summary, authority, fields)
+                VALUES ((SELECT rowid FROM jobs WHERE id = ?), ?, ?, ?, ?)
+            """, fts_rows)
+            # A changed last date (extension) re-arms an already sent reminder
+            conn.executemany("""
+                INSERT INTO deadlines (job_id, last_date, remind_at) VALUES (?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    remind_at = excluded.remind_at,
+                    sent = CASE WHEN deadlines.last_date = excluded.last_date THEN deadlines.sent ELSE 0 END,
+                    last_date = excluded.last_date
+            """, deadlines)
+            conn.commit()
+        logger.info(f"Saved {len(rows)} jobs, {len(deadlines)} deadlines")
+        return [(job_id, datetime.fromisoformat(at)) for job_id, _, at in deadlines]
+
+    def get_pending_deadlines(self, until: datetime) -> list:
+        """Unsent reminders due up to `until` whose last date hasn't passed."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("""
+                SELECT job_id, remind_at FROM deadlines
+                WHERE sent = 0 AND remind_at <= ? AND last_date >= date('now', 'localtime')
+                ORDER BY remind_at
+            """, (until.isoformat(sep=' '),)).fetchall()
+        return [(job_id, datetime.fromisoformat(at)) for job_id, at in rows]
+
+    def claim_reminder(self, job_id: str, remind_at: datetime):
+        """Mark a reminder sent; returns the job row, or None if it was rescheduled/sent already."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cur = conn.execute(
+                "UPDATE deadlines SET sent = 1 WHERE job_id = ? AND remind_at = ? AND sent = 0",
+                (job_id, remind_at.isoformat(sep=' '))
+            )
+            if cur.rowcount == 0:
+                return None
+            row = conn.execute("""
+                SELECT j.*, d.last_date AS deadline FROM jobs j
+                JOIN deadlines d ON d.job_id = j.id WHERE j.id = ?
+            """, (job_id,)).fetchone()
+            conn.commit()
+            return dict(row) if row else None
+
+    def search_jobs(self, match: str = None, since_days: int = None, limit: int = 5, offset: int = 0) -> list:
+        """Ranked full-text search over stored jobs. match=None returns newest first."""
+        where, params = [], []
+        if since_days:
+            where.append("j.created_at >= datetime('now', ?)")
+            params.append(f"-{int(since_days)} days")
+        if match:
+            # bm25 weights: title, summary, authority, extracted fields
+            sql = """
+                SELECT j.id, j.title, j.link, j.category, j.last_date, j.created_at
+                FROM jobs_fts JOIN jobs j ON j.rowid = jobs_fts.rowid
+                WHERE jobs_fts MATCH ?
+            """
+            params.insert(0, match)
+            order = "bm25(jobs_fts, 10.0, 2.0, 5.0, 1.0), j.created_at DESC"
+        else:
+            sql = "SELECT j.id, j.title, j.link, j.category, j.last_date, j.created_at FROM jobs j WHERE 1"
+            order = "j.created_at DESC"
+        for clause in where:
+            sql += f" AND {clause}"
+        sql += f" ORDER BY {order} LIMIT ? OFFSET ?"
+        params += [limit, offset]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            try:
+                return [dict(r) for r in conn.execute(sql, params).fetchall()]
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Search failed for {match!r}: {e}")
+                return []
+
+    def get_job_count(self) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+            return row[0] if row else 0
+
+    def acquire_lease(self, name: str, holder: str, ttl: float) -> bool:
+        """Take or renew the lease if it's ours or expired. One statement, so it's atomic across processes."""
+        now = time.time()
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            cur = conn.execute("""
+                INSERT INTO leases (name, holder, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at
+                WHERE leases.holder = excluded.holder OR leases.expires_at < ?
+            """, (name, holder, now + ttl, now))
+            conn.commit()
+            return cur.rowcount == 1
+
+    def release_lease(self, name: str, holder: str):
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            conn.execute("UPDATE leases SET expires_at = 0 WHERE name = ? AND holder = ?", (name, holder))
+            conn.commit()
+
+    def get_lease(self, name: str):
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM leases WHERE name = ?", (name,)).fetchone()
+            return dict(row) if row else None
+
+    def set_lease_cycle(self, name: str, holder: str) -> bool:
+        """Record a finished cycle — only while still holding the lease."""
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            cur = conn.execute(
+                "UPDATE leases SET last_cycle_at = ? WHERE name = ? AND holder = ?", (time.time(), name, holder)
+            )
+            conn.commit()
+            return cur.rowcount == 1
+
+    def enqueue_outbox(self, chat_ids, text: str, markup: str, shards: int,
+                       job_key: str = None, edit: dict = None, reply_to: dict = None) -> int:
+        """edit / reply_to: {chat_id: message_id} of the earlier post to edit or reply to."""
+        now = time.time()
+        edit, reply_to = edit or {}, reply_to or {}
+        rows = [(cid, cid % shards, text, markup, job_key, edit.get(cid), reply_to.get(cid), now, now)
+                for cid in chat_ids]
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            conn.executemany(
+                "INSERT INTO outbox (chat_id, shard, text, markup, job_key, edit_id, reply_to, next_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            # Finished rows are only kept for a day, for /stats
+            conn.execute("DELETE FROM outbox WHERE status IN ('sent', 'dead', 'failed') AND created_at < ?",
+                         (now - 86400,))
+            conn.commit()
+        return len(rows)
+
+    def claim_outbox(self, shard: int, limit: int, stale_after: float = 300) -> list:
+        """Atomically take due rows for a shard; rows stuck in 'sending' (dead worker) are retaken."""
+        now = time.time()
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("""
+                UPDATE outbox SET status = 'sending', claimed_at = ?, attempts = attempts + 1
+                WHERE id IN (
+                    SELECT id FROM outbox
+                    WHERE shard = ? AND next_at <= ?
+                      AND (status = 'pending' OR (status = 'sending' AND claimed_at < ?))
+                    ORDER BY id LIMIT ?
+                )
+                RETURNING id, chat_id, text, markup, edit_id, reply_to, attempts
+            """, (now, shard, now, now - stale_after, limit)).fetchall()
+            conn.commit()
+            return sorted((dict(r) for r in rows), key=lambda r: r['id'])
+
+    def finish_outbox(self, results):
+        """results: [(row_id, status, retry_at, message_id)] — sent / dead / failed, or pending again at retry_at."""
+        now = time.time()
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            conn.executemany(
+                "UPDATE outbox SET status = ?, next_at = COALESCE(?, next_at) WHERE id = ?",
+                [(status, retry_at, row_id) for row_id, status, retry_at, _ in results]
+            )
+            # Same bookkeeping as save_sent_messages for rows that carry a job key (replies don't)
+            conn.executemany("""
+                INSERT INTO sent_messages (job_key, chat_id, message_id, sent_at)
+                SELECT job_key, chat_id, ?, ? FROM outbox
+                WHERE id = ? AND job_key IS NOT NULL AND reply_to IS NULL
+                ON CONFLICT (job_key, chat_id) DO UPDATE SET message_id = excluded.message_id, sent_at = excluded.sent_at
+            """, [(message_id, now, row_id) for row_id, status, _, message_id in results if message_id])
+            conn.commit()
+
+    def drop_outbox_chat(self, chat_id: int):
+        """Chat kicked us: remove it and everything still queued for it."""
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            conn.execute("UPDATE outbox SET status = 'dead' WHERE chat_id = ? AND status IN ('pending', 'sending')",
+                         (chat_id,))
+            conn.commit()
+        self.remove_chat(chat_id)
+
+    def get_outbox_counts(self) -> dict:
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            return dict(conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+
+    def take_tokens(self, name: str, wanted: int, rate: float, burst: float) -> tuple:
+        """Global token bucket shared by all processes: (granted, seconds to wait if 0 granted)."""
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute("SELECT tokens, updated_at FROM rate_buckets WHERE name = ?", (name,)).fetchone()
+            tokens = burst if row is None else min(burst, row[0] + (now - row[1]) * rate)
+            granted = int(min(wanted, tokens))
+            tokens -= granted
+            conn.execute("""
+                INSERT INTO rate_buckets (name, tokens, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at
+            """, (name, tokens, now))
+            conn.execute("COMMIT")
+            return granted, 0.0 if granted else (1 - tokens) / rate
+        finally:
+            conn.close()
+
+    def get_sent_messages(self, job_key: str, max_age_days: float) -> dict:
+        """{chat_id: message_id} of our posts for job_key in the last max_age_days."""
+        with sqlite3.connect(self.db_path) as conn:
+            return dict(conn.execute(
+                "SELECT chat_id, message_id FROM sent_messages WHERE job_key = ? AND sent_at > ?",
+                (job_key, time.time() - max_age_days * 86400)
+            ).fetchall())
+
+    def save_sent_messages(self, job_key: str, sent: list, max_age_days: float):
+        """sent: [(chat_id, message_id)]; also forgets posts older than max_age_days."""
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT INTO sent_messages (job_key, chat_id, message_id, sent_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (job_key, chat_id) DO UPDATE SET message_id = excluded.message_id, sent_at = excluded.sent_at
+            """, [(job_key, chat_id, message_id, now) for chat_id, message_id in sent])
+            conn.execute("DELETE FROM sent_messages WHERE sent_at < ?", (now - max_age_days * 86400,))
+            conn.commit()
+
+    def get_job_post(self, job_key: str, max_age_days: float):
+        """{title, source, host} of the last post under job_key in the last max_age_days, or None."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT title, source, host FROM job_posts WHERE job_key = ? AND posted_at > ?",
+                (job_key, time.time() - max_age_days * 86400)
+            ).fetchone()
+            return dict(row) if row else None
+
+    def save_job_post(self, job_key: str, title: str, source: str, host: str, max_age_days: float):
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO job_posts (job_key, title, source, host, posted_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (job_key) DO UPDATE SET
+                    title = excluded.title, source = excluded.source, host = excluded.host,
+                    posted_at = excluded.posted_at
+            """, (job_key, title, source, host, now))
+            conn.execute("DELETE FROM job_posts WHERE posted_at < ?", (now - max_age_days * 86400,))
+            conn.commit()
+
     def clear_posted(self):
         """Clear all posted items — force repost everything"""
         with sqlite3.connect(self.db_path) as conn:
@@ -76,12 +500,94 @@ class Database:
     def remove_chat(self, chat_id: int):
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("DELETE FROM chats WHERE chat_id = ?", (chat_id,))
+            conn.execute("DELETE FROM chat_filters WHERE chat_id = ?", (chat_id,))
+            conn.execute("DELETE FROM chat_settings WHERE chat_id = ?", (chat_id,))
+            conn.execute("DELETE FROM sent_messages WHERE chat_id = ?", (chat_id,))
+            conn.commit()
+
+    def set_chat_digest(self, chat_id: int, on: bool):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT INTO chat_settings (chat_id, digest) VALUES (?, ?) "
+                "ON CONFLICT (chat_id) DO UPDATE SET digest = excluded.digest",
+                (chat_id, int(on))
+            )
+            conn.commit()
+
+    def add_chat_filter(self, chat_id: int, kind: str, value: str):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO chat_filters (chat_id, kind, value) VALUES (?, ?, ?)",
+                (chat_id, kind, value)
+            )
+            conn.commit()
+
+    def remove_chat_filters(self, chat_id: int, kind: str = None, value: str = None) -> int:
+        sql, params = "DELETE FROM chat_filters WHERE chat_id = ?", [chat_id]
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        if value:
+            sql += " AND value = ?"
+            params.append(value)
+        with sqlite3.connect(self.db_path) as conn:
+            n = conn.execute(sql, params).rowcount
+            conn.commit()
+            return n
+
+    def get_chat_filters(self, chat_id: int = None) -> dict:
+        """{chat_id: {kind: {values}}}"""
+        sql, params = "SELECT chat_id, kind, value FROM chat_filters", ()
+        if chat_id is not None:
+            sql, params = sql + " WHERE chat_id = ?", (chat_id,)
+        rules = {}
+        with sqlite3.connect(self.db_path) as conn:
+            for cid, kind, value in conn.execute(sql, params):
+                rules.setdefault(cid, {}).setdefault(kind, set()).add(value)
+        return rules
+
+    def get_feeds(self) -> list:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("""
+                SELECT id, url, name, enabled, entry_limit, timeout, scrape, parser FROM feeds ORDER BY id
+            """).fetchall()
+            return [dict(r) for r in rows]
+
+    def seed_feeds(self, feeds: list):
+        """feeds: [(url, name)] — existing URLs are left alone."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("INSERT OR IGNORE INTO feeds (url, name) VALUES (?, ?)", feeds)
+            conn.commit()
+
+    def add_feed(self, url: str, name: str, entry_limit: int = None, timeout: float = None,
+                 scrape: bool = None, parser: str = None):
+        """Insert, or re-enable an existing URL (renamed to name); settings passed as None keep their current value."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO feeds (url, name, entry_limit, timeout, scrape, parser) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    name = excluded.name, enabled = 1,
+                    entry_limit = COALESCE(excluded.entry_limit, entry_limit),
+                    timeout = COALESCE(excluded.timeout, timeout),
+                    scrape = COALESCE(excluded.scrape, scrape),
+                    parser = COALESCE(excluded.parser, parser)
+            """, (url, name, entry_limit, timeout, None if scrape is None else int(scrape), parser))
+            conn.commit()
+
+    def set_feed_enabled(self, feed_id: int, on: bool):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE feeds SET enabled = ? WHERE id = ?", (int(on), feed_id))
             conn.commit()
 
     def get_all_chats(self):
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
-            rows = conn.execute("SELECT * FROM chats WHERE active = 1").fetchall()
+            rows = conn.execute("""
+                SELECT c.*, COALESCE(s.digest, 0) AS digest
+                FROM chats c LEFT JOIN chat_settings s USING (chat_id)
+                WHERE c.active = 1
+            """).fetchall()
             return [dict(r) for r in rows]
 
     def get_post_count(self) -> int:
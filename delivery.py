@@ -0,0 +1,188 @@
+"""
+Sharded delivery (DELIVERY_WORKERS > 0).
+
+Instead of sending from the bot's event loop, deliver() writes one outbox
+row per (message, chat) and DELIVERY_WORKERS processes drain it. Chats are
+partitioned by chat_id % DELIVERY_WORKERS, so each chat is owned by exactly
+one worker and its per-chat pacing (CHAT_MIN_INTERVAL) is tracked locally.
+The bot-wide limit is a token bucket in SQLite (GLOBAL_RATE msg/s) shared by
+every worker; workers take tokens in small batches to keep the database out
+of the hot path.
+
+Claims are atomic UPDATE ... RETURNING, so several instances (see leader.py)
+can run workers against the same outbox without sending twice.
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import time
+from config import (
+    BOT_TOKEN, TELEGRAM_API_BASE, DELIVERY_WORKERS, GLOBAL_RATE, GLOBAL_BURST, CHAT_MIN_INTERVAL, SEND_RETRIES,
+)
+
+logger = logging.getLogger(__name__)
+
+BUCKET = "telegram_global"
+CLAIM_BATCH = 50
+TOKEN_BATCH = 5
+IDLE_SLEEP = 0.5
+CONCURRENCY = 8  # in-flight sends per worker (= its HTTP connection pool size)
+
+
+async def send_one(bot, chat_id: int, text: str, markup=None, edit_id: int = None, reply_to: int = None) -> int:
+    """Send (or edit edit_id in place); returns the id of the message now showing text."""
+    from telegram.error import BadRequest
+    if edit_id:
+        try:
+            await bot.edit_message_text(
+                text=text, chat_id=chat_id, message_id=edit_id, parse_mode="HTML",
+                reply_markup=markup, disable_web_page_preview=True
+            )
+            return edit_id
+        except BadRequest as e:
+            msg = str(e).lower()
+            if "not modified" in msg:
+                return edit_id
+            if "not found" not in msg and "can't be edited" not in msg:
+                raise
+            # Post was deleted (or is too old to edit) — send it fresh instead
+    message = await bot.send_message(
+        chat_id=chat_id, text=text, parse_mode="HTML", reply_markup=markup, disable_web_page_preview=True,
+        reply_to_message_id=reply_to, allow_sending_without_reply=True
+    )
+    return message.message_id
+
+
+class _Worker:
+    def __init__(self, shard: int, shards: int, rate: float, burst: float):
+        from database import Database
+        self.db = Database()
+        self.shard = shard
+        self.shards = shards
+        self.rate = rate
+        self.burst = burst
+        self.tokens = 0
+        self.chat_next = {}  # chat_id -> monotonic time it may be sent to again
+        self.dead = set()    # chats that kicked us; this shard owns them, so the set is complete
+        self.sent = 0
+
+    async def _token(self):
+        while self.tokens <= 0:
+            granted, wait = await asyncio.to_thread(self.db.take_tokens, BUCKET, TOKEN_BATCH, self.rate, self.burst)
+            self.tokens += granted
+            if not granted:
+                await asyncio.sleep(wait)
+        self.tokens -= 1
+
+    async def _send(self, bot, row) -> tuple:
+        """(row id, new status, retry_at, message_id) for one outbox row."""
+        from telegram import InlineKeyboardMarkup
+        from telegram.error import Forbidden, RetryAfter
+        chat_id = row['chat_id']
+        if chat_id in self.dead:
+            return row['id'], 'dead', None, None
+        await self._token()
+        markup = InlineKeyboardMarkup.de_json(json.loads(row['markup']), bot) if row['markup'] else None
+        try:
+            async with self._slots:
+                message_id = await send_one(bot, chat_id, row['text'], markup, row['edit_id'], row['reply_to'])
+            self.sent += 1
+            return row['id'], 'sent', None, message_id
+        except RetryAfter as e:
+            self.chat_next[chat_id] = time.monotonic() + e.retry_after
+            if row['attempts'] <= SEND_RETRIES:
+                return row['id'], 'pending', time.time() + e.retry_after, None
+            return row['id'], 'failed', None, None
+        except Exception as e:
+            logger.warning(f"[shard {self.shard}] Post failed {chat_id}: {e}")
+            msg = str(e).lower()
+            if isinstance(e, Forbidden) or any(x in msg for x in ["kicked", "chat not found", "deactivated", "blocked"]):
+                self.dead.add(chat_id)
+                await asyncio.to_thread(self.db.drop_outbox_chat, chat_id)
+                return row['id'], 'dead', None, None
+            return row['id'], 'failed', None, None
+
+    async def run(self):
+        from telegram import Bot
+        from telegram.request import HTTPXRequest
+        bot = Bot(BOT_TOKEN, base_url=f"{TELEGRAM_API_BASE}/bot",
+                  request=HTTPXRequest(connection_pool_size=CONCURRENCY))
+        self._slots = asyncio.Semaphore(CONCURRENCY)  # created inside the running loop
+        async with bot:
+            logger.info(f"📮 Delivery worker {self.shard}/{self.shards} started")
+            while True:
+                try:
+                    rows = self.db.claim_outbox(self.shard, CLAIM_BATCH)
+                except Exception as e:
+                    logger.warning(f"[shard {self.shard}] claim failed: {e}")
+                    rows = []
+                if not rows:
+                    await asyncio.sleep(IDLE_SLEEP)
+                    continue
+                # Different chats in parallel, one chat's messages in order
+                by_chat = {}
+                for row in rows:
+                    by_chat.setdefault(row['chat_id'], []).append(row)
+                done = await asyncio.gather(*(self._send_chat(bot, chat_rows) for chat_rows in by_chat.values()))
+                results = [r for chat_results in done for r in chat_results]
+                await asyncio.to_thread(self.db.finish_outbox, results)
+
+    async def _send_chat(self, bot, rows) -> list:
+        results = []
+        for row in rows:
+            chat_id = row['chat_id']
+            wait = self.chat_next.get(chat_id, 0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                result = await self._send(bot, row)
+            except Exception as e:
+                logger.error(f"[shard {self.shard}] outbox row {row['id']}: {e}")
+                result = (row['id'], 'failed', None, None)
+            results.append(result)
+            if result[1] != 'pending':
+                self.chat_next[chat_id] = time.monotonic() + CHAT_MIN_INTERVAL
+        return results
+
+
+def worker_main(shard: int, shards: int, rate: float, burst: float):
+    """Process entry point."""
+    # Console only: several processes rotating the same log file would clobber it
+    from logbuffer import LOG_FORMAT
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(_Worker(shard, shards, rate, burst).run())
+
+
+class DeliveryWorkers:
+    """Starts and supervises the worker processes; enqueue() is what deliver() calls."""
+
+    def __init__(self, db, shards: int = DELIVERY_WORKERS, rate: float = GLOBAL_RATE, burst: float = GLOBAL_BURST):
+        self.db = db
+        self.shards = shards
+        self.rate = rate
+        self.burst = burst
+        self._procs = {}
+
+    def start(self):
+        ctx = multiprocessing.get_context("spawn")
+        for shard in range(self.shards):
+            proc = self._procs.get(shard)
+            if proc is None or not proc.is_alive():
+                if proc is not None:
+                    logger.warning(f"📮 Delivery worker {shard} died (exit {proc.exitcode}) — restarting")
+                proc = ctx.Process(target=worker_main, args=(shard, self.shards, self.rate, self.burst),
+                                   daemon=True, name=f"Delivery-{shard}")
+                proc.start()
+                self._procs[shard] = proc
+        return self
+
+    def stop(self):
+        for proc in self._procs.values():
+            proc.terminate()
+
+    def enqueue(self, chat_ids, text: str, buttons=None, job_key: str = None, edit=None, reply_to=None) -> int:
+        from telegram import InlineKeyboardMarkup
+        markup = InlineKeyboardMarkup(buttons).to_json() if buttons else None
+        return self.db.enqueue_outbox(list(chat_ids), text, markup, self.shards, job_key, edit, reply_to)
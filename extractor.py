@@ -0,0 +1,426 @@
+"""
+Pure page cleanup + job detail extraction.
+
+Everything here is a module-level function of plain strings so it can be
+shipped to a ProcessPoolExecutor worker (see EXTRACT_WORKERS in config).
+
+Pages are untrusted input. In guarded mode (EXTRACT_GUARD) each field only
+sees the first EXTRACT_FIELD_WINDOW chars, page cleanup (a linear scan over
+at most MAX_HTML_CHARS) and field extraction each get
+EXTRACT_ITEM_CPU_MS of CPU time; on overrun the remaining fields fall back
+to their defaults instead of stalling the cycle. A single runaway match can
+only be interrupted on a process's main thread, i.e. in pool workers, so
+guarded mode always extracts in the pool — one worker when EXTRACT_WORKERS=0.
+"""
+import logging
+import re
+import signal
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from models import NOT_AVAILABLE, NOT_ANNOUNCED, NOT_RELEASED, NOT_DECLARED
+from config import EXTRACT_WORKERS, EXTRACT_GUARD, EXTRACT_FIELD_WINDOW, EXTRACT_ITEM_CPU_MS
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+
+
+def pool_size() -> int:
+    """Worker processes for extraction; the CPU budget needs at least one to be enforceable."""
+    if EXTRACT_WORKERS > 0:
+        return EXTRACT_WORKERS
+    return 1 if EXTRACT_GUARD else 0
+
+
+def get_pool():
+    """Shared worker pool, or None when extraction runs in-process (EXTRACT_WORKERS=0, unguarded)."""
+    global _pool
+    if pool_size() <= 0:
+        return None
+    if _pool is None:
+        # spawn, not fork: the bot process has live threads + an event loop
+        _pool = ProcessPoolExecutor(
+            max_workers=pool_size(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+# Raw HTML beyond this is never looked at; job details sit near the top of the page
+MAX_HTML_CHARS = 300_000
+_LAYOUT_TAGS = ('script', 'style', 'nav', 'footer', 'header', 'iframe', 'noscript', 'aside')
+_LAYOUT_OPEN = re.compile(r'<(' + '|'.join(_LAYOUT_TAGS) + r')\b', re.IGNORECASE)
+
+
+def _strip_layout(html: str, budget=None) -> str:
+    """Drop <tag>...</tag> layout blocks in one pass over the page.
+
+    Each close tag is found with str.find; a tag whose close never comes is
+    remembered, so later opens of it cost nothing (a regex per open tag made
+    "<script " * n quadratic).
+    """
+    lower = html.lower()
+    out = []
+    pos = 0
+    unclosed = set()
+    while True:
+        if budget:
+            budget.check()
+        m = _LAYOUT_OPEN.search(html, pos)
+        while m and m.group(1).lower() in unclosed:
+            m = _LAYOUT_OPEN.search(html, m.end())
+        if not m:
+            break
+        tag = m.group(1).lower()
+        close = lower.find(f'</{tag}', m.end())
+        if close < 0:
+            # Left in place like any other markup; only the tag itself is stripped later
+            unclosed.add(tag)
+            continue
+        end = lower.find('>', close)
+        out.append(html[pos:m.start()])
+        out.append(' ')
+        pos = len(html) if end < 0 else end + 1
+    out.append(html[pos:])
+    return ''.join(out)
+
+
+# How long to wait for one pool result: cleanup + extraction budgets, plus slack for
+# queueing behind other items and the first worker's start-up
+POOL_RESULT_TIMEOUT = 2 * EXTRACT_ITEM_CPU_MS / 1000 + 10
+
+
+def reset_pool():
+    """Drop a pool whose worker stopped answering; the next get_pool() starts a fresh one."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is None:
+        return
+    # No public API stops a stuck worker, and shutdown() alone would leave it running
+    for proc in list((getattr(pool, '_processes', None) or {}).values()):
+        proc.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+    logger.warning("♻️ Extraction pool reset")
+
+
+def clean_page(html: str, budget=None) -> str:
+    """Strip layout tags and markup, return plain page text."""
+    html = _strip_layout(html[:MAX_HTML_CHARS], budget)
+    # [^<>] rather than [^>]: an unterminated "<" stops at the next one instead of rescanning to the end
+    text = re.sub(r'<[^<>]+>', ' ', html)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n\s*\n+', '\n', text)
+    return text.strip()[:8000]
+
+
+def process_page(html: str, title: str, summary: str, guarded: bool = EXTRACT_GUARD) -> tuple:
+    """Clean + extract in one call. Returns (page_text, details, seconds).
+
+    In guarded mode cleanup gets its own EXTRACT_ITEM_CPU_MS budget; on overrun
+    the item is extracted from title + summary only.
+    """
+    t = time.perf_counter()
+    page_text = ""
+    if html and guarded:
+        try:
+            with _Budget(EXTRACT_ITEM_CPU_MS) as budget:
+                page_text = clean_page(html, budget)
+        except ExtractionOverrun:
+            logger.warning(f"⏱ Page cleanup over {EXTRACT_ITEM_CPU_MS}ms, using title/summary: {title[:60]}")
+    elif html:
+        page_text = clean_page(html)
+    details = extract_details(page_text, title, summary, guarded)
+    return page_text, details, time.perf_counter() - t
+
+
+_FLAGS = re.IGNORECASE | re.DOTALL
+
+# field -> (patterns, default), evaluated in order.
+# A default of None falls back to the extracted qualification.
+FIELD_PATTERNS = {
+    # Vacancies
+    'seats': ([
+        r'(?:total\s+)?(?:vacancies?|posts?|seats?)[:\s–-]+(\d[\d,\s]+)',
+        r'(\d[\d,]+)\s+(?:vacancies?|posts?|seats?)',
+        r'for\s+(\d[\d,]+)\s+(?:posts?|vacancies?)',
+        r'recruitment\s+(?:of\s+)?(\d[\d,]+)\s+',
+        r'(\d+)\s+(?:junior|senior|assistant|officer)',
+    ], NOT_AVAILABLE),
+    # Last Date
+    'form_last_date': ([
+        r'last\s+date(?:\s+(?:to|for|of)\s+(?:apply|submission|application))?[:\s–-]+([^\n\r,]{5,60})',
+        r'apply\s+(?:before|by|till|upto|up\s+to)[:\s–-]+([^\n\r,]{5,50})',
+        r'closing\s+date[:\s–-]+([^\n\r,]{5,50})',
+        r'(?:walk.?in|walkin)\s+(?:date|interview)[:\s–-]+([^\n\r,]{5,50})',
+        r'(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})',
+        r'(\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{4})',
+    ], NOT_AVAILABLE),
+    # Start Date
+    'form_start_date': ([
+        r'(?:start|starting|begin|opening)\s+date[:\s–-]+([^\n\r,]{5,50})',
+        r'application\s+(?:start|from|begin)[:\s–-]+([^\n\r,]{5,50})',
+        r'(?:from|w\.?e\.?f)[:\s–-]+([^\n\r,]{5,50})',
+    ], NOT_AVAILABLE),
+    # Exam Date
+    'exam_date': ([
+        r'exam(?:ination)?\s+date[:\s–-]+([^\n\r,]{5,50})',
+        r'(?:written\s+)?test\s+date[:\s–-]+([^\n\r,]{5,50})',
+        r'interview\s+date[:\s–-]+([^\n\r,]{5,50})',
+        r'(?:cbt|tier|phase)\s+\d+\s+date[:\s–-]+([^\n\r,]{5,50})',
+    ], NOT_ANNOUNCED),
+    # Salary
+    'salary': ([
+        r'(?:pay\s+(?:scale|band|matrix|level)|salary|stipend|remuneration|emoluments?|ctc)[:\s–-]+([^\n\r]{10,150})',
+        r'(?:rs\.?|₹)\s*[\d,]+(?:\s*[-–/]\s*[\d,]+)?(?:[^\n\r]{0,50}(?:month|annum|p\.?m\.?|p\.?a\.?))?',
+        r'level\s*[-:]?\s*(\d+[^\n\r]{5,80})',
+    ], NOT_AVAILABLE),
+    # Qualification
+    'qualification': ([
+        r'(?:essential\s+)?(?:educational\s+)?qualification(?:s)?[:\s–-]+([^\n]{15,300})',
+        r'(?:minimum\s+)?(?:required\s+)?qualification[:\s–-]+([^\n]{15,300})',
+        r'education(?:al)?\s+qualification[:\s–-]+([^\n]{15,300})',
+    ], NOT_AVAILABLE),
+    # Eligibility
+    'eligibility': ([
+        r'eligibility[:\s–-]+([^\n]{15,300})',
+        r'who\s+can\s+apply[:\s–-]+([^\n]{15,200})',
+        r'candidates?\s+(?:must\s+have|with|having)[:\s–-]?\s+([^\n]{15,200})',
+    ], None),
+    # Age
+    'min_age': ([
+        r'(?:minimum|min\.?)\s+age[:\s–-]+(\d+\s*years?)',
+        r'age[:\s–-]+(\d+)\s*[-–to]+\s*\d+',
+        r'not\s+less\s+than\s+(\d+\s*years?)',
+    ], NOT_AVAILABLE),
+    'max_age': ([
+        r'(?:maximum|max\.?|upper)\s+age(?:\s+limit)?[:\s–-]+([^\n]{5,80})',
+        r'age(?:\s+limit)?[:\s–-]+\d+\s*[-–to]+\s*(\d+\s*years?[^\n]{0,50})',
+        r'not\s+(?:more\s+than|exceeding|above)\s+(\d+\s*years?[^\n]{0,50})',
+        r'age\s+(?:limit\s+)?(?:up\s+to|upto)[:\s–-]+(\d+\s*years?[^\n]{0,50})',
+    ], NOT_AVAILABLE),
+    # Fee
+    'fee': ([
+        r'(?:application|exam(?:ination)?|registration)\s+fee[:\s–-]+([^\n]{5,200})',
+        r'fee[:\s–-]+([^\n]{5,150})',
+        r'(no\s+(?:application\s+)?fee[^\n]{0,50})',
+        r'fee\s+(?:is\s+)?(?:nil|waived|exempted?|free)',
+    ], NOT_AVAILABLE),
+    # Selection
+    'selection': ([
+        r'selection\s+(?:process|procedure|criteria|mode)[:\s–-]+([^\n]{10,300})',
+        r'selection\s+(?:will\s+be\s+(?:done|made|based)\s+(?:on|through))[:\s–-]?\s+([^\n]{10,200})',
+    ], NOT_AVAILABLE),
+    # Pattern
+    'pattern': ([
+        r'(?:exam(?:ination)?\s+)?pattern[:\s–-]+([^\n]{10,300})',
+        r'(?:test|paper)\s+pattern[:\s–-]+([^\n]{10,200})',
+    ], NOT_AVAILABLE),
+    # Syllabus
+    'syllabus': ([
+        r'syllabus[:\s–-]+([^\n]{10,300})',
+        r'subjects?[:\s–-]+([^\n]{10,200})',
+    ], NOT_AVAILABLE),
+    # Insights
+    'insights': ([
+        r'(?:previous|last)\s+year[^\n]{0,10}(?:cutoff|cut.?off)[:\s–-]+([^\n]{10,150})',
+        r'cutoff[:\s–-]+([^\n]{10,150})',
+    ], "Prepare well and keep checking official website for updates."),
+    'admit_card_status': ([
+        r'admit\s+card[:\s–-]+([^\n]{5,100})',
+    ], NOT_RELEASED),
+    'result_status': ([
+        r'result[:\s–-]+([^\n]{5,100})',
+    ], NOT_DECLARED),
+}
+
+_COMPILED = {
+    field: [re.compile(p, _FLAGS) for p in patterns]
+    for field, (patterns, _) in FIELD_PATTERNS.items()
+}
+
+# Run length is capped: an unbounded run backtracks quadratically on long
+# capitalised text. The result is cut to 120 chars anyway.
+INSTITUTE_PATTERN = r'([A-Z][A-Za-z\s&\(\)]{0,120}(?:University|College|Hospital|Institute|Board|Commission|Corporation|Department|Ministry|Authority|Council|Bank|Railway|Police|Academy))'
+_INSTITUTE_RE = re.compile(INSTITUTE_PATTERN)
+
+
+class ExtractionOverrun(Exception):
+    """Per-item CPU budget exhausted."""
+
+
+class _Budget:
+    """CPU-time budget for one item.
+
+    Checked between patterns; on a pool worker's main thread a SIGVTALRM
+    timer also interrupts a single runaway search mid-match.
+    """
+
+    def __init__(self, ms: int):
+        self.limit = ms / 1000
+        self.deadline = time.thread_time() + self.limit
+        self.armed = False
+
+    active = False  # a late SIGVTALRM after __exit__ must not raise
+
+    def __enter__(self):
+        if hasattr(signal, 'SIGVTALRM') and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGVTALRM, _on_overrun)
+            signal.setitimer(signal.ITIMER_VIRTUAL, self.limit)
+            self.armed = _Budget.active = True
+        return self
+
+    def __exit__(self, *exc):
+        if self.armed:
+            _Budget.active = False
+            signal.setitimer(signal.ITIMER_VIRTUAL, 0)
+        return False
+
+    def check(self):
+        if time.thread_time() > self.deadline:
+            raise ExtractionOverrun()
+
+
+def _on_overrun(signum, frame):
+    if _Budget.active:
+        raise ExtractionOverrun()
+
+
+def _extract(text: str, patterns: list, default: str = NOT_AVAILABLE, budget: _Budget = None) -> str:
+    for pat in patterns:
+        if budget:
+            budget.check()
+        m = pat.search(text)
+        if m:
+            val = m.group(1).strip() if m.lastindex else m.group(0).strip()
+            val = re.sub(r'\s+', ' ', val)[:250]
+            if val and len(val) > 2:
+                return val
+    return default
+
+
+def extract_details(page: str, title: str, summary: str, guarded: bool = EXTRACT_GUARD) -> dict:
+    """Extract all job details from page text."""
+    text = f"{title}\n{summary}\n{page}"
+    d = {}
+
+    if guarded:
+        window = text[:EXTRACT_FIELD_WINDOW]
+        try:
+            with _Budget(EXTRACT_ITEM_CPU_MS) as budget:
+                for field, (_, default) in FIELD_PATTERNS.items():
+                    if default is None:
+                        default = d.get('qualification', NOT_AVAILABLE)
+                    d[field] = _extract(window, _COMPILED[field], default, budget)
+                d['institute'] = _guess_institute(title, window)
+        except ExtractionOverrun:
+            logger.warning(f"⏱ Extraction over {EXTRACT_ITEM_CPU_MS}ms, using defaults: {title[:60]}")
+            for field, (_, default) in FIELD_PATTERNS.items():
+                if field not in d:
+                    d[field] = default if default is not None else d.get('qualification', NOT_AVAILABLE)
+    else:
+        for field, (_, default) in FIELD_PATTERNS.items():
+            if default is None:
+                default = d.get('qualification', NOT_AVAILABLE)
+            d[field] = _extract(text, _COMPILED[field], default)
+        d['institute'] = _guess_institute(title, text)
+
+    # Authority / Institute
+    d['authority'] = guess_authority(title)
+    if 'institute' not in d:
+        d['institute'] = d['authority']
+
+    # Why exam
+    d['why_exam'] = _get_why(title, text, d)
+
+    # Strategy
+    d['strategy'] = _get_strategy(title, text)
+
+    return d
+
+
+# (substrings in title, short key used by /filter, display name) — first hit wins
+AUTHORITIES = [
+    (('upsc',), 'upsc', 'UPSC (Union Public Service Commission)'),
+    (('ssc',), 'ssc', 'SSC (Staff Selection Commission)'),
+    (('nta',), 'nta', 'NTA (National Testing Agency)'),
+    (('rrb', 'railway', 'rrc'), 'railway', 'Railway Recruitment Board (RRB)'),
+    (('ibps',), 'ibps', 'IBPS (Institute of Banking Personnel Selection)'),
+    (('sbi',), 'sbi', 'SBI (State Bank of India)'),
+    (('rbi',), 'rbi', 'RBI (Reserve Bank of India)'),
+    (('aiims',), 'aiims', 'AIIMS'),
+    (('esic',), 'esic', 'ESIC'),
+    (('drdo',), 'drdo', 'DRDO'),
+    (('isro',), 'isro', 'ISRO'),
+    (('psc',), 'psc', 'Public Service Commission'),
+    (('police',), 'police', 'Police Recruitment Board'),
+    (('army', 'defence', 'military'), 'defence', 'Ministry of Defence'),
+    (('nit', 'iit'), 'education', 'Ministry of Education'),
+    (('hospital', 'medical', 'health'), 'health', 'Ministry of Health'),
+]
+DEFAULT_AUTHORITY = ('govt', 'Government of India')
+AUTHORITY_KEYS = [key for _, key, _ in AUTHORITIES] + [DEFAULT_AUTHORITY[0]]
+
+
+def _authority(title: str) -> tuple:
+    t = title.lower()
+    for needles, key, name in AUTHORITIES:
+        if any(n in t for n in needles):
+            return key, name
+    return DEFAULT_AUTHORITY
+
+
+def guess_authority(title: str) -> str:
+    return _authority(title)[1]
+
+
+def guess_authority_key(title: str) -> str:
+    """Short authority code ('ssc', 'railway', ...) for routing filters."""
+    return _authority(title)[0]
+
+
+def _guess_institute(title: str, text: str) -> str:
+    m = _INSTITUTE_RE.search(title + ' ' + text[:500])
+    if m:
+        return m.group(1).strip()[:120]
+    return guess_authority(title)
+
+
+def _get_why(title: str, text: str, d: dict) -> str:
+    t = title.lower()
+    if 'walk' in t or 'walkin' in t:
+        return "Direct Walk-in — no written exam! Immediate opportunity for eligible candidates with government benefits."
+    if d.get('salary', NOT_AVAILABLE) != NOT_AVAILABLE:
+        sal = d['salary'][:80]
+        return f"Attractive pay: {sal}. Permanent govt job with pension, allowances and job security."
+    if 'upsc' in t:
+        return "Most prestigious govt exam in India. Leads to IAS/IPS/IFS — top administrative positions with high salary and authority."
+    if 'ssc' in t:
+        return "Central govt job with Grade Pay benefits, job security and career growth across India."
+    if 'bank' in t or 'ibps' in t or 'sbi' in t:
+        return "Banking job with excellent salary, perks, housing loan benefits and career advancement opportunities."
+    if 'railway' in t or 'rrb' in t:
+        return "Railway job with free travel pass, housing, medical benefits and lifetime job security."
+    return "Permanent government job with job security, pension benefits and career growth opportunities."
+
+
+def _get_strategy(title: str, text: str) -> str:
+    t = (title + text[:200]).lower()
+    if 'doctor' in t or 'mbbs' in t or 'medical' in t or 'hospital' in t:
+        return "1. Prepare for clinical/technical interview. 2. Keep all original certificates & documents ready. 3. Arrive 30 min early for walk-in."
+    if 'engineer' in t:
+        return "1. Revise core engineering concepts. 2. Practice technical MCQs from previous papers. 3. Keep degree & experience certificates ready."
+    if 'teacher' in t or 'lecturer' in t or 'professor' in t:
+        return "1. Master your subject thoroughly. 2. Prepare a demo lesson. 3. Keep all academic certificates organized."
+    if 'bank' in t or 'ibps' in t or 'sbi' in t:
+        return "1. Practice Quantitative Aptitude & Reasoning daily. 2. Focus on English & Computer Knowledge. 3. Stay updated on banking/finance news."
+    if 'upsc' in t:
+        return "1. Study NCERT books thoroughly. 2. Read The Hindu daily for current affairs. 3. Practice answer writing regularly."
+    if 'ssc' in t:
+        return "1. Focus on Maths, English & GK. 2. Practice Tier-1 speed & accuracy. 3. Solve last 5 years papers."
+    if 'railway' in t or 'rrb' in t:
+        return "1. Focus on Maths, GK & Reasoning. 2. Practice RRB previous year papers. 3. Be physically fit for medical test."
+    if 'police' in t:
+        return "1. Build physical fitness daily. 2. Study GK & Current Affairs. 3. Practice Reasoning and Maths."
+    return "1. Read official notification carefully. 2. Practice previous year question papers. 3. Stay updated on official website."
@@ -0,0 +1,110 @@
+"""
+Feed sources, stored in the feeds table and served from an in-memory snapshot.
+
+The table is seeded from DEFAULT_FEEDS the first time it is empty; after
+that /feeds add|enable|disable edit it and reload the snapshot, no restart
+needed. Per-feed settings left empty (NULL) fall back to the global config:
+entry_limit → FEED_ENTRY_LIMIT, parser → FEED_PARSER, timeout → 15 s,
+scrape → on.
+
+The fetcher reloads at the start of every cycle, so a change made on one
+instance is picked up by whichever instance holds the fetch lease.
+"""
+import logging
+import threading
+from collections import namedtuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEEDS = [
+    ("https://sarkarinaukriblog.com/feed/", "SarkariNaukri"),
+    ("https://aglasem.com/feed/", "AglaSem"),
+    ("https://testbook.com/blog/feed/", "Testbook"),
+    ("https://currentaffairs.adda247.com/feed/", "Adda247"),
+    ("https://www.bankersadda.com/feeds/posts/default?alt=rss", "BankersAdda"),
+    ("https://www.sscadda.com/feeds/posts/default?alt=rss", "SSCAdda"),
+    ("https://www.ibps.in/feed/", "IBPS"),
+    ("https://www.jagranjosh.com/feed", "Jagran Josh"),
+    ("https://www.employmentnews.gov.in/RSS/CurrentIssue.aspx", "Employment News"),
+    ("https://www.exampundit.in/feed/", "ExamPundit"),
+    ("https://www.oliveboard.in/blog/feed/", "OliveBoard"),
+    ("https://sarkarijobfind.com/feed/", "SarkariJobFind"),
+    ("https://www.freejobalert.com/feed/", "FreeJobAlert"),
+    ("https://www.sarkariresult.com/rss.xml", "SarkariResult"),
+]
+
+DEFAULT_TIMEOUT = 15
+PARSERS = ("stream", "feedparser")
+
+Feed = namedtuple("Feed", ("id", "url", "name", "enabled", "entry_limit", "timeout", "scrape", "parser"))
+
+
+def describe(feed: Feed) -> str:
+    """One line for /feeds: only the settings that differ from the defaults."""
+    opts = []
+    if feed.entry_limit is not None:
+        opts.append(f"limit={feed.entry_limit}")
+    if feed.timeout is not None:
+        opts.append(f"timeout={feed.timeout:g}")
+    if feed.scrape is not None and not feed.scrape:
+        opts.append("scrape=off")
+    if feed.parser:
+        opts.append(f"parser={feed.parser}")
+    state = "✅" if feed.enabled else "⛔"
+    return f"{state} #{feed.id} {feed.name}" + (f" ({', '.join(opts)})" if opts else "")
+
+
+class FeedRegistry:
+    def __init__(self, db):
+        self.db = db
+        self._all = ()
+        self._enabled = ()
+        self._lock = threading.Lock()
+
+    def load(self) -> tuple:
+        """Re-read the table (seeding it if empty); returns the enabled feeds."""
+        rows = self.db.get_feeds()
+        if not rows:
+            self.db.seed_feeds(DEFAULT_FEEDS)
+            logger.info(f"📡 Seeded feeds table with {len(DEFAULT_FEEDS)} default sources")
+            rows = self.db.get_feeds()
+        feeds = tuple(Feed(**row) for row in rows)
+        with self._lock:
+            self._all = feeds
+            self._enabled = tuple(f for f in feeds if f.enabled)
+        return self._enabled
+
+    @property
+    def feeds(self) -> tuple:
+        """Enabled feeds — immutable snapshot, safe to iterate while /feeds edits the table."""
+        return self._enabled
+
+    @property
+    def all(self) -> tuple:
+        return self._all
+
+    def find(self, key: str):
+        """Feed by #id / id, exact URL or case-insensitive name."""
+        key = key.strip()
+        for feed in self._all:
+            if key.lstrip('#') == str(feed.id) or key == feed.url or key.lower() == feed.name.lower():
+                return feed
+        return None
+
+    def add(self, url: str, name: str = None, **settings) -> Feed:
+        """Add a feed, or re-enable an existing URL and update the settings given.
+
+        Without a name an existing feed keeps its own; a new one is named after the host.
+        """
+        self.load()
+        existing = self.find(url)
+        if not name:
+            name = existing.name if existing else (urlparse(url).hostname or url)
+        self.db.add_feed(url, name, **settings)
+        self.load()
+        return self.find(url)
+
+    def set_enabled(self, feed: Feed, on: bool):
+        self.db.set_feed_enabled(feed.id, on)
+        self.load()
@@ -0,0 +1,93 @@
+"""
+Lease-based leader election for running more than one instance.
+
+Every instance sharing DATABASE_PATH (e.g. replicas on one volume) runs a
+LeaderLease. A background thread takes or renews the "fetch" lease every
+LEADER_TTL / 3 seconds; only the holder runs fetch cycles. If the leader
+dies, its lease expires and a standby takes over within about LEADER_TTL
+seconds. The time of the last finished cycle is stored with the lease, so a
+new leader continues the schedule instead of fetching again right away.
+"""
+import logging
+import threading
+import time
+from config import INSTANCE_ID, LEADER_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLease:
+    def __init__(self, db, name: str = "fetch", holder: str = INSTANCE_ID, ttl: float = LEADER_TTL):
+        self.db = db
+        self.name = name
+        self.holder = holder
+        self.ttl = ttl
+        self.renew_every = max(ttl / 3, 0.5)
+        self._valid_until = 0.0  # monotonic; leadership is assumed only until then
+        self.led_from_start = False  # won the lease at start() and never lost it since
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def is_leader(self) -> bool:
+        return time.monotonic() < self._valid_until
+
+    def renew(self) -> bool:
+        started = time.monotonic()
+        was_leader = self.is_leader
+        try:
+            ok = self.db.acquire_lease(self.name, self.holder, self.ttl)
+        except Exception as e:
+            logger.warning(f"Lease renew failed: {e}")
+            ok = False
+        # Count from before the call, with a margin, so we stop before anyone else may start
+        self._valid_until = started + self.ttl * 0.9 if ok else 0.0
+        if not ok:
+            self.led_from_start = False
+        if ok and not was_leader:
+            logger.info(f"👑 {self.holder} is now leader for '{self.name}'")
+        elif was_leader and not ok:
+            logger.warning(f"⚠️ {self.holder} lost the '{self.name}' lease")
+        return ok
+
+    def _run(self):
+        while not self._stop.wait(self.renew_every):
+            self.renew()
+
+    def start(self):
+        # First attempt inline, so a lone instance leads from the start
+        self.led_from_start = self.renew()
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"Lease-{self.name}")
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop renewing and hand the lease over immediately."""
+        self._stop.set()
+        if self.is_leader:
+            self._valid_until = 0.0
+            self.db.release_lease(self.name, self.holder)
+
+    def last_cycle_at(self):
+        lease = self.db.get_lease(self.name)
+        return lease['last_cycle_at'] if lease else None
+
+    def cycle_due_in(self, interval: float, first: bool = False) -> float:
+        """Seconds until the next cycle is due (<= 0: now).
+
+        first: this process hasn't run a cycle yet and may start right away — but
+        only if it has led since start; a standby taking over continues the schedule.
+        """
+        last = None if first and self.led_from_start else self.last_cycle_at()
+        return last + interval - time.time() if last else 0
+
+    def mark_cycle(self) -> bool:
+        """False if the lease moved on meanwhile (the new holder's schedule stands)."""
+        return self.db.set_lease_cycle(self.name, self.holder)
+
+    def status(self) -> str:
+        lease = self.db.get_lease(self.name)
+        if not lease:
+            return "no leader"
+        role = "leader" if lease['holder'] == self.holder and self.is_leader else "standby"
+        return f"{role} ({self.holder}); lease held by {lease['holder']}"
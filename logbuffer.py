@@ -0,0 +1,66 @@
+"""
+Logging setup: records go through a QueueHandler so console and file I/O
+happen on a listener thread, never on the event loop. The file is size-capped
+with rotation, and the last LOG_BUFFER records are kept in memory so /logs
+can answer without touching the disk.
+"""
+import atexit
+import logging
+import queue
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from config import LOG_FILE, LOG_MAX_BYTES, LOG_BACKUPS, LOG_BUFFER
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the newest `capacity` formatted records in a deque."""
+
+    def __init__(self, capacity: int = LOG_BUFFER):
+        super().__init__()
+        self.records = deque(maxlen=capacity)  # (levelno, logger name, formatted line)
+
+    def emit(self, record):
+        try:
+            self.records.append((record.levelno, record.name, self.format(record)))
+        except Exception:
+            self.handleError(record)
+
+    def tail(self, n: int = 40, level: int = logging.NOTSET, module: str = None) -> list:
+        """Last n lines at or above level, optionally only from loggers containing `module`."""
+        out = []
+        for levelno, name, line in reversed(self.records):
+            if levelno < level or (module and module not in name):
+                continue
+            out.append(line)
+            if len(out) >= n:
+                break
+        out.reverse()
+        return out
+
+
+ring = RingBufferHandler()
+_listener = None
+
+
+def setup_logging(level=logging.INFO):
+    """Install queue-based console + rotating file logging and the ring buffer on the root logger."""
+    global _listener
+    if _listener:
+        return ring
+    formatter = logging.Formatter(LOG_FORMAT)
+    outputs = [logging.StreamHandler(), RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS)]
+    for h in outputs:
+        h.setFormatter(formatter)
+    ring.setFormatter(formatter)
+
+    q = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(q))
+    root.addHandler(ring)
+    _listener = QueueListener(q, *outputs, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return ring
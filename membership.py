@@ -0,0 +1,105 @@
+"""
+Channel-membership cache for /start and the Verify button.
+
+Results of get_chat_member are kept in a bounded LRU with separate TTLs:
+members are trusted for MEMBER_CACHE_TTL, non-members only for the short
+MEMBER_CACHE_NEG_TTL (they are about to join). Concurrent lookups for the
+same user share one API call, and members whose entry is close to expiry
+are refreshed in the background while the cached answer is returned.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from config import (
+    CHANNEL_USERNAME, MEMBER_CACHE_SIZE, MEMBER_CACHE_TTL, MEMBER_CACHE_NEG_TTL, MEMBER_CACHE_REFRESH,
+)
+
+logger = logging.getLogger(__name__)
+
+MEMBER_STATUSES = ("member", "administrator", "creator")
+# Refresh in the background once this fraction of a positive TTL has passed
+REFRESH_AFTER = 0.8
+
+
+class MembershipCache:
+    def __init__(self, channel: str = CHANNEL_USERNAME, maxsize: int = MEMBER_CACHE_SIZE,
+                 ttl: float = MEMBER_CACHE_TTL, negative_ttl: float = MEMBER_CACHE_NEG_TTL,
+                 refresh: bool = MEMBER_CACHE_REFRESH):
+        self.channel = channel
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.refresh = refresh
+        self._entries = OrderedDict()   # uid -> (is_member, checked_at)
+        self._inflight = {}             # uid -> Future shared by concurrent callers
+        self._refreshes = set()         # background refresh tasks; the loop only keeps weak refs
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, uid, now: float):
+        entry = self._entries.get(uid)
+        if entry is None:
+            return None
+        is_member, checked_at = entry
+        if now - checked_at >= (self.ttl if is_member else self.negative_ttl):
+            del self._entries[uid]
+            return None
+        self._entries.move_to_end(uid)
+        return entry
+
+    def _put(self, uid, is_member: bool):
+        if self.maxsize <= 0:
+            return
+        self._entries[uid] = (is_member, time.monotonic())
+        self._entries.move_to_end(uid)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, uid):
+        self._entries.pop(uid, None)
+
+    async def _lookup(self, bot, uid) -> bool:
+        fut = self._inflight.get(uid)
+        if fut:
+            return await asyncio.shield(fut)
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[uid] = fut
+        try:
+            try:
+                m = await bot.get_chat_member(self.channel, uid)
+                is_member = m.status in MEMBER_STATUSES
+                self._put(uid, is_member)
+            except Exception as e:
+                # Not cached — an API hiccup shouldn't lock anyone out for a TTL
+                logger.warning(f"Membership check failed for {uid}: {e}")
+                is_member = False
+            fut.set_result(is_member)
+            return is_member
+        finally:
+            self._inflight.pop(uid, None)
+            if not fut.done():
+                fut.cancel()
+
+    def _refresh_done(self, task):
+        self._refreshes.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning(f"Membership refresh failed: {task.exception()}")
+
+    async def check(self, bot, uid, fresh: bool = False) -> bool:
+        """Is uid in the channel? fresh=True ignores a cached "no" (Verify button)."""
+        now = time.monotonic()
+        entry = self._get(uid, now)
+        if entry and (entry[0] or not fresh):
+            self.hits += 1
+            if entry[0] and self.refresh and now - entry[1] >= self.ttl * REFRESH_AFTER \
+                    and uid not in self._inflight:
+                task = asyncio.create_task(self._lookup(bot, uid))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refresh_done)
+            return entry[0]
+        self.misses += 1
+        return await self._lookup(bot, uid)
@@ -0,0 +1,69 @@
+"""
+Compact job record shared by the fetcher, /test and the templates.
+"""
+import sys
+
+# Interned so every item defaulting a field shares one string object
+NOT_AVAILABLE = sys.intern("Not Available")
+NOT_ANNOUNCED = sys.intern("Not Announced Yet")
+NOT_RELEASED = sys.intern("Not Released Yet")
+NOT_DECLARED = sys.intern("Not Declared Yet")
+# Values that arrive as equal copies (e.g. unpickled from the extraction pool) map back to these
+_SHARED = {s: s for s in (NOT_AVAILABLE, NOT_ANNOUNCED, NOT_RELEASED, NOT_DECLARED)}
+
+# Extracted fields and their defaults, in template order
+DETAIL_DEFAULTS = {
+    'exam_date': NOT_ANNOUNCED,
+    'form_start_date': NOT_AVAILABLE,
+    'form_last_date': NOT_AVAILABLE,
+    'authority': None,   # None = fall back to the source name
+    'institute': None,
+    'eligibility': NOT_AVAILABLE,
+    'pattern': NOT_AVAILABLE,
+    'syllabus': NOT_AVAILABLE,
+    'strategy': NOT_AVAILABLE,
+    'insights': NOT_AVAILABLE,
+    'selection': NOT_AVAILABLE,
+    'seats': NOT_AVAILABLE,
+    'salary': NOT_AVAILABLE,
+    'why_exam': NOT_AVAILABLE,
+    'admit_card_status': NOT_RELEASED,
+    'result_status': NOT_DECLARED,
+    'min_age': NOT_AVAILABLE,
+    'max_age': NOT_AVAILABLE,
+    'fee': NOT_AVAILABLE,
+    'qualification': NOT_AVAILABLE,
+}
+
+
+class JobItem:
+    __slots__ = ('id', 'title', 'link', 'summary', 'published', 'source') + tuple(DETAIL_DEFAULTS)
+
+    def __init__(self, id: str, title: str, link: str, summary: str = "",
+                 published=None, source: str = "", **details):
+        self.id = id
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.published = published
+        self.source = source
+        for key, default in DETAIL_DEFAULTS.items():
+            val = details.get(key) or default
+            if isinstance(val, str):
+                val = _SHARED.get(val, val)
+            setattr(self, key, source if val is None else val)
+
+    @classmethod
+    def from_entry(cls, entry: dict, details: dict) -> "JobItem":
+        """Build from a feed entry (id/title/link/summary/published/source) + extract_details output."""
+        return cls(
+            entry['id'], entry['title'], entry['link'], entry.get('summary', ''),
+            entry.get('published'), entry.get('source', ''), **details,
+        )
+
+    @property
+    def form_dates(self) -> str:
+        return f"Start: {self.form_start_date} | Last: {self.form_last_date}"
+
+    def __repr__(self):
+        return f"JobItem({self.id!r}, {self.title[:40]!r})"
@@ -0,0 +1,125 @@
+"""
+Turn extracted free-text fields into typed values for the jobs table.
+"""
+import re
+from datetime import date
+
+_MONTHS = {
+    m: i for i, m in enumerate(
+        ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)
+}
+
+_ISO = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b')
+# Indian notices are day-first: 04/07/2025, 4-7-25, 22.10.2025
+_NUMERIC = re.compile(r'\b(\d{1,2})[/\-.](\d{1,2})[/\-.](\d{4}|\d{2})\b')
+_DAY_MONTH = re.compile(r'\b(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?([a-z]{3,9})\.?,?\s+(\d{4})\b', re.I)
+_MONTH_DAY = re.compile(r'\b([a-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b', re.I)
+_SEATS = re.compile(r'\d[\d,]*')
+
+
+def _make(y: int, m: int, d: int):
+    if y < 100:
+        y += 2000
+    try:
+        return date(y, m, d)
+    except ValueError:
+        return None
+
+
+def _month(name: str):
+    return _MONTHS.get(name[:3].lower())
+
+
+def parse_dates(text: str) -> list:
+    """All dates found in text, in order of appearance."""
+    if not text:
+        return []
+    found = []
+    for m in _ISO.finditer(text):
+        found.append((m.start(), _make(int(m.group(1)), int(m.group(2)), int(m.group(3)))))
+    for m in _NUMERIC.finditer(text):
+        found.append((m.start(), _make(int(m.group(3)), int(m.group(2)), int(m.group(1)))))
+    for m in _DAY_MONTH.finditer(text):
+        mon = _month(m.group(2))
+        if mon:
+            found.append((m.start(), _make(int(m.group(3)), mon, int(m.group(1)))))
+    for m in _MONTH_DAY.finditer(text):
+        mon = _month(m.group(1))
+        if mon:
+            found.append((m.start(), _make(int(m.group(3)), mon, int(m.group(2)))))
+    found.sort(key=lambda x: x[0])
+    return [d for _, d in found if d]
+
+
+def parse_date(text: str, latest: bool = False):
+    """First date in text (or the latest one, e.g. for extended last dates). None if none."""
+    dates = parse_dates(text)
+    if not dates:
+        return None
+    return max(dates) if latest else dates[0]
+
+
+def parse_seats(text: str):
+    """'14,582 posts' -> 14582. None when there is no number."""
+    if not text:
+        return None
+    m = _SEATS.search(text)
+    if not m:
+        return None
+    try:
+        n = int(m.group(0).replace(',', ''))
+    except ValueError:
+        return None
+    return n if 0 < n < 10_000_000 else None
+
+
+# Words that describe the stage of a notification rather than which exam it is.
+# The subject part of the job key ends at the first of these.
+_STATUS_WORDS = {
+    'notification', 'notice', 'recruitment', 'vacancy', 'vacancies', 'admit', 'hall', 'result', 'results',
+    'answer', 'cut', 'cutoff', 'merit', 'score', 'scorecard', 'last', 'date', 'dates', 'schedule',
+    'apply', 'online', 'form', 'application', 'registration', 'syllabus', 'exam', 'city', 'slip',
+    'out', 'released', 'declared', 'extended', 'revised', 'correction', 'for', 'posts', 'post', 'link',
+    'card', 'ticket', 'key', 'off', 'list',
+}
+_WORD = re.compile(r'[a-z0-9]+')
+_YEAR = re.compile(r'(?:19|20)\d\d')
+
+
+def _is_year(word: str) -> bool:
+    return bool(_YEAR.fullmatch(word))
+
+
+def job_key(title: str):
+    """Canonical identity of a notification across its updates, or None if the title is too vague.
+
+    "SSC CGL 2025 Notification Out for 14582 Posts" and "SSC CGL Admit Card 2025 Released"
+    both map to "ssc cgl 2025": the subject runs up to the first status word (numbers in it,
+    like "tier 2", included) and the years anywhere in the title are appended. Without a year
+    the title can't tell this year's intake from the last one, so there is no key.
+    """
+    words = _WORD.findall((title or '').lower())
+    subject = []
+    for word in words:
+        if word in _STATUS_WORDS:
+            break
+        if not _is_year(word):
+            subject.append(word)
+    years = sorted({w for w in words if _is_year(w)})
+    if len(subject) < 2 or not years:
+        return None
+    return " ".join(subject + years)
+
+
+def _identity_words(title: str) -> set:
+    """Words that say which job a title is about: no status words, no counts other than years."""
+    return {w for w in _WORD.findall((title or '').lower())
+            if w not in _STATUS_WORDS and (not w.isdigit() or len(w) <= 2 or _is_year(w))}
+
+
+def title_similarity(a: str, b: str) -> float:
+    """Jaccard overlap (0..1) of the identity words of two titles."""
+    wa, wb = _identity_words(a), _identity_words(b)
+    if not wa or not wb:
+        return 0.0
+    return len(wa & wb) / len(wa | wb)
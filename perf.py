@@ -0,0 +1,192 @@
+"""
+Per-cycle stage timing with a ring buffer of recent cycles.
+
+Stages are keyed (stage, label) — e.g. ("feed_fetch", "SSCAdda") or
+("scrape", "SSCAdda"). Labels are feed names or empty, never URLs or chat
+ids, so the label set (and the Prometheus series count) stays bounded by the
+feeds table. Percentiles are computed over every sample still in the ring
+buffer. Optional Prometheus text export on PERF_PORT.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from config import PERF_HISTORY, PERF_PORT
+
+logger = logging.getLogger(__name__)
+
+# Order used by /perf and the exporter
+STAGES = ["feed_fetch", "dedup", "scrape", "extract", "classify", "format", "send"]
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class CycleTimer:
+    """Timings for a single fetch cycle."""
+
+    def __init__(self, number: int = 0):
+        self.number = number
+        self.started_at = time.time()
+        self.total = 0.0
+        self.items = 0
+        self.messages = 0
+        self.samples = defaultdict(list)  # (stage, label) -> [seconds]
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+
+    def add(self, stage: str, seconds: float, label: str = ""):
+        with self._lock:
+            self.samples[(stage, label)].append(seconds)
+
+    @contextmanager
+    def stage(self, stage: str, label: str = ""):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - t, label)
+
+    def finish(self):
+        self.total = time.perf_counter() - self._t0
+
+    def stage_totals(self) -> dict:
+        totals = defaultdict(float)
+        for (stage, _), vals in self.samples.items():
+            totals[stage] += sum(vals)
+        return totals
+
+
+def _quantile(sorted_vals: list, q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    idx = min(len(sorted_vals) - 1, int(round(q * (len(sorted_vals) - 1))))
+    return sorted_vals[idx]
+
+
+class PerfRecorder:
+    def __init__(self, history: int = PERF_HISTORY):
+        self.cycles = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def start_cycle(self) -> CycleTimer:
+        with self._lock:
+            self._count += 1
+            return CycleTimer(self._count)
+
+    def finish_cycle(self, timer: CycleTimer):
+        timer.finish()
+        with self._lock:
+            self.cycles.append(timer)
+
+    def percentiles(self, by_label: bool = False) -> dict:
+        """{stage or (stage, label): {q: seconds, 'count': n}} over the ring buffer."""
+        merged = defaultdict(list)
+        with self._lock:
+            cycles = list(self.cycles)
+        for c in cycles:
+            for (stage, label), vals in c.samples.items():
+                merged[(stage, label) if by_label else stage].extend(vals)
+        out = {}
+        for key, vals in merged.items():
+            vals.sort()
+            out[key] = {q: _quantile(vals, q) for q in QUANTILES}
+            out[key]['count'] = len(vals)
+        return out
+
+    def summary(self, last_n: int = 5) -> str:
+        """Plain-text breakdown for the /perf command."""
+        with self._lock:
+            cycles = list(self.cycles)[-last_n:]
+        if not cycles:
+            return "No cycles recorded yet."
+        lines = []
+        for c in reversed(cycles):
+            when = time.strftime('%d %b %H:%M', time.localtime(c.started_at))
+            lines.append(f"#{c.number} {when} — {c.total:.1f}s | {c.items} items | {c.messages} msgs")
+            totals = c.stage_totals()
+            parts = [f"{s} {totals[s]:.1f}s" for s in STAGES if s in totals]
+            if parts:
+                lines.append("   " + " · ".join(parts))
+        pct = self.percentiles()
+        if pct:
+            lines.append("")
+            lines.append("p50 / p90 / p99 (ms):")
+            for s in STAGES:
+                if s in pct:
+                    p = pct[s]
+                    lines.append(f"{s:<10} {p[0.5]*1000:7.0f} {p[0.9]*1000:7.0f} {p[0.99]*1000:7.0f}  n={p['count']}")
+        return "\n".join(lines)
+
+    def prometheus_text(self) -> str:
+        lines = [
+            "# TYPE govtbot_stage_seconds summary",
+        ]
+        for (stage, label), p in sorted(self.percentiles(by_label=True).items()):
+            label = label.replace('\\', '\\\\').replace('"', '\\"')
+            labels = f'stage="{stage}",label="{label}"'
+            for q in QUANTILES:
+                lines.append(f'govtbot_stage_seconds{{{labels},quantile="{q}"}} {p[q]:.6f}')
+            lines.append(f'govtbot_stage_seconds_count{{{labels}}} {p["count"]}')
+        with self._lock:
+            last = self.cycles[-1] if self.cycles else None
+            count = self._count
+        lines.append("# TYPE govtbot_cycles_total counter")
+        lines.append(f"govtbot_cycles_total {count}")
+        if last:
+            lines.append("# TYPE govtbot_last_cycle_seconds gauge")
+            lines.append(f"govtbot_last_cycle_seconds {last.total:.6f}")
+            lines.append(f"govtbot_last_cycle_items {last.items}")
+            lines.append(f"govtbot_last_cycle_messages {last.messages}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = PERF_PORT):
+        """Expose /metrics on 127.0.0.1:port in a daemon thread (0 = disabled)."""
+        if not port:
+            return None
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # only when exporting
+        recorder = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') != '/metrics':
+                    self.send_error(404)
+                    return
+                body = recorder.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True, name="PerfExporter").start()
+        logger.info(f"📈 Perf metrics on http://127.0.0.1:{port}/metrics")
+        return server
+
+
+class StartupTimer:
+    """Wall-clock phases from import of this module to the first finished fetch cycle."""
+
+    def __init__(self):
+        self.t0 = self._last = time.perf_counter()
+        self.phases = []  # (name, seconds since previous mark)
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+        logger.info(f"⚡ Startup: {phase} +{self.phases[-1][1]:.2f}s (total {now - self.t0:.2f}s)")
+
+    def summary(self) -> str:
+        if not self.phases:
+            return ""
+        parts = " | ".join(f"{name} {secs:.2f}s" for name, secs in self.phases)
+        return f"Startup: {parts} | total {self._last - self.t0:.2f}s"
+
+
+perf = PerfRecorder()
+startup = StartupTimer()
@@ -0,0 +1,85 @@
+"""
+Last-date reminders.
+
+save_jobs() writes one row per job with a parsed last date into the
+deadlines table (remind_at = last date - REMINDER_DAYS_BEFORE days, at
+REMINDER_HOUR). DeadlineQueue keeps only reminders due within the next
+REMINDER_HORIZON_HOURS in a min-heap and sleeps until the earliest one,
+so nothing scans the whole job history on a timer.
+"""
+import heapq
+import logging
+import threading
+from datetime import datetime, date, time as dtime, timedelta
+from config import REMINDER_DAYS_BEFORE, REMINDER_HOUR, REMINDER_HORIZON_HOURS
+
+logger = logging.getLogger(__name__)
+
+
+def reminder_time(last_date: date, now: datetime = None):
+    """When to remind for a last date, or None if that moment has already passed."""
+    if not last_date:
+        return None
+    now = now or datetime.now()
+    at = datetime.combine(last_date - timedelta(days=REMINDER_DAYS_BEFORE), dtime(REMINDER_HOUR))
+    return at if at > now else None
+
+
+class DeadlineQueue:
+    def __init__(self, db, horizon_hours: int = REMINDER_HORIZON_HOURS):
+        self.db = db
+        self.horizon = timedelta(hours=horizon_hours)
+        self._heap = []      # (remind_at, job_id)
+        self._queued = set()
+        self._cond = threading.Condition()
+        self._loaded_until = datetime.min
+
+    def __len__(self):
+        return len(self._heap)
+
+    def refill(self):
+        """Load pending reminders up to now + horizon via the remind_at index."""
+        until = datetime.now() + self.horizon
+        rows = self.db.get_pending_deadlines(until)
+        with self._cond:
+            self._loaded_until = until
+            for job_id, remind_at in rows:
+                self._push_locked(job_id, remind_at)
+            self._cond.notify()
+        logger.info(f"⏳ Reminder queue: {len(self._heap)} pending until {until:%d %b %H:%M}")
+
+    def push(self, job_id: str, remind_at: datetime):
+        """Schedule a newly saved deadline (ignored if beyond the loaded horizon)."""
+        with self._cond:
+            if remind_at <= self._loaded_until:
+                self._push_locked(job_id, remind_at)
+                self._cond.notify()
+
+    def _push_locked(self, job_id, remind_at):
+        key = (remind_at, job_id)
+        if key not in self._queued:
+            self._queued.add(key)
+            heapq.heappush(self._heap, key)
+
+    def wait_due(self, max_wait: float = 3600) -> list:
+        """Block until at least one reminder is due (or a refill is needed); return due job ids."""
+        with self._cond:
+            while True:
+                now = datetime.now()
+                if now + self.horizon / 2 > self._loaded_until:
+                    break  # caller refills
+                if self._heap and self._heap[0][0] <= now:
+                    break
+                wake = self._loaded_until - self.horizon / 2
+                if self._heap:
+                    wake = min(wake, self._heap[0][0])
+                self._cond.wait(timeout=min(max_wait, max(0.0, (wake - now).total_seconds())))
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                key = heapq.heappop(self._heap)
+                self._queued.discard(key)
+                due.append(key)
+            return due
+
+    def needs_refill(self) -> bool:
+        return datetime.now() + self.horizon / 2 > self._loaded_until
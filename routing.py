@@ -0,0 +1,120 @@
+"""
+Per-chat subscription filters compiled into an inverted index.
+
+A chat's rules are grouped by kind (category, authority, keyword, state).
+Values within a kind are OR-ed, kinds are AND-ed: a chat with
+category=result + state=bihar only gets Bihar results. Chats without any
+rule get everything.
+
+Routing looks up the item's own keys (its category, authority code and
+the 1-4 word phrases of its title + summary) in the index and counts
+matched kinds per chat, so the cost grows with the matches rather than
+with chats x rules.
+"""
+import re
+from collections import defaultdict
+from classifier import CATEGORY_ORDER
+from extractor import AUTHORITY_KEYS, guess_authority_key
+
+KINDS = ('category', 'authority', 'keyword', 'state')
+CATEGORIES = CATEGORY_ORDER + ['general']
+
+STATES = [
+    'andhra pradesh', 'arunachal pradesh', 'assam', 'bihar', 'chhattisgarh', 'goa', 'gujarat',
+    'haryana', 'himachal pradesh', 'jharkhand', 'karnataka', 'kerala', 'madhya pradesh',
+    'maharashtra', 'manipur', 'meghalaya', 'mizoram', 'nagaland', 'odisha', 'punjab', 'rajasthan',
+    'sikkim', 'tamil nadu', 'telangana', 'tripura', 'uttar pradesh', 'uttarakhand', 'west bengal',
+    'andaman and nicobar', 'chandigarh', 'dadra and nagar haveli', 'daman and diu', 'delhi',
+    'jammu and kashmir', 'ladakh', 'lakshadweep', 'puducherry',
+]
+MAX_KEYWORD_WORDS = 3
+# Title phrases looked up in the index must cover the longest filter value
+# ("dadra and nagar haveli"), or that filter could never match
+MAX_PHRASE_WORDS = max(MAX_KEYWORD_WORDS, *(len(s.split()) for s in STATES))
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def normalize_phrase(text: str) -> str:
+    return " ".join(_WORD.findall(text.lower()))
+
+
+def validate(kind: str, value: str):
+    """Normalized filter value, or None if it isn't valid for the kind."""
+    value = normalize_phrase(value)
+    if not value:
+        return None
+    if kind == 'category':
+        value = value.replace(' ', '_')
+        return value if value in CATEGORIES else None
+    if kind == 'authority':
+        return value if value in AUTHORITY_KEYS else None
+    if kind == 'state':
+        return value if value in STATES else None
+    if kind == 'keyword':
+        return value if len(value.split()) <= MAX_KEYWORD_WORDS else None
+    return None
+
+
+def _phrases(text: str) -> set:
+    words = _WORD.findall(text.lower())
+    out = set()
+    for n in range(1, MAX_PHRASE_WORDS + 1):
+        for i in range(len(words) - n + 1):
+            out.add(" ".join(words[i:i + n]))
+    return out
+
+
+class Router:
+    def __init__(self, rules: dict = None):
+        """rules: {chat_id: {kind: {values}}} as returned by Database.get_chat_filters()."""
+        self._index = {kind: defaultdict(set) for kind in KINDS}
+        self._need = {}  # chat_id -> number of kinds it filters on
+        for chat_id, by_kind in (rules or {}).items():
+            kinds = [k for k in KINDS if by_kind.get(k)]
+            if not kinds:
+                continue
+            self._need[chat_id] = len(kinds)
+            for kind in kinds:
+                for value in by_kind[kind]:
+                    self._index[kind][value].add(chat_id)
+
+    @property
+    def filtered_chats(self) -> set:
+        return set(self._need)
+
+    def _item_keys(self, title: str, summary: str, category: str) -> dict:
+        keys = {
+            'category': (category,),
+            'authority': (guess_authority_key(title),),
+        }
+        if self._index['keyword'] or self._index['state']:
+            phrases = _phrases(f"{title} {summary}")
+            keys['keyword'] = phrases
+            keys['state'] = phrases
+        return keys
+
+    def matching(self, title: str, summary: str, category: str) -> set:
+        """Filtered chats whose rules all match this item."""
+        if not self._need:
+            return set()
+        counts = defaultdict(int)
+        for kind, values in self._item_keys(title, summary, category).items():
+            index = self._index[kind]
+            if not index:
+                continue
+            matched = set()
+            for v in values:
+                hit = index.get(v)
+                if hit:
+                    matched |= hit
+            for chat_id in matched:
+                counts[chat_id] += 1
+        return {c for c, n in counts.items() if n == self._need[c]}
+
+    def route(self, chats: list, title: str, summary: str, category: str) -> list:
+        """Subset of chats (registry Chat tuples) that should receive this item."""
+        if not self._need:
+            return chats
+        wanted = self.matching(title, summary, category)
+        return [c for c in chats if c.chat_id not in self._need or c.chat_id in wanted]
@@ -0,0 +1,36 @@
+"""
+Turn a user's /search text into an FTS5 MATCH expression + time window.
+
+"any SSC jobs this week?" -> ('"ssc"*', 7)
+"""
+import re
+
+# Filler words people type around the actual exam / org name
+STOPWORDS = {
+    'a', 'an', 'and', 'any', 'are', 'for', 'from', 'give', 'govt', 'government', 'in', 'is',
+    'job', 'jobs', 'kya', 'koi', 'latest', 'list', 'me', 'new', 'of', 'on', 'please', 'sarkari',
+    'show', 'the', 'there', 'this', 'to', 'update', 'updates', 'vacancy', 'vacancies', 'wala', 'with',
+    'naukri', 'hai', 'today', 'week', 'month', 'last', 'past',
+}
+
+_WINDOWS = [
+    (re.compile(r'\btoday\b', re.I), 1),
+    (re.compile(r'\b(?:this|last|past)\s+week\b', re.I), 7),
+    (re.compile(r'\b(?:this|last|past)\s+month\b', re.I), 31),
+]
+
+PAGE_SIZE = 5
+
+
+def parse_query(text: str) -> tuple:
+    """(match_expr or None, since_days or None). None match = newest jobs only."""
+    since = None
+    for pat, days in _WINDOWS:
+        if pat.search(text):
+            since = days
+            break
+    terms = [t for t in re.findall(r'\w+', text.lower()) if t not in STOPWORDS]
+    if not terms:
+        return None, since
+    # Quoted so FTS5 operators in user input are plain text; * = prefix match
+    return " ".join(f'"{t}"*' for t in terms[:8]), since
@@ -4,6 +4,7 @@ Returns (text, buttons) tuple.
 """
 from datetime import datetime
 from telegram import InlineKeyboardButton
+from models import JobItem, NOT_AVAILABLE
 
 
 def _escape(text: str) -> str:
@@ -11,19 +12,19 @@ def _escape(text: str) -> str:
     return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
-def _get(item: dict, key: str, fallback: str = "Not Available") -> str:
-    val = item.get(key, "")
+def _get(item: JobItem, key: str, fallback: str = NOT_AVAILABLE) -> str:
+    val = getattr(item, key, "")
     if val and str(val).strip():
         return _escape(str(val).strip())
     return fallback
 
 
-def _source_line(item: dict) -> str:
-    return _escape(item.get('source', 'Govt Update'))
+def _source_line(item: JobItem) -> str:
+    return _escape(item.source or 'Govt Update')
 
 
-def _date_line(item: dict) -> str:
-    pub = item.get('published')
+def _date_line(item: JobItem) -> str:
+    pub = item.published
     if pub:
         return pub.strftime('%d %b %Y')
     return datetime.now().strftime('%d %b %Y')
@@ -32,10 +33,10 @@ def _date_line(item: dict) -> str:
 # ─────────────────────────────────────────
 # TEMPLATE 1 — FULL EXAM UPDATE
 # ─────────────────────────────────────────
-def template_exam_update(item: dict) -> tuple:
+def template_exam_update(item: JobItem) -> tuple:
     title    = _get(item, 'title', 'New Exam Notification')
-    link     = item.get('link', '#')
-    summary  = _escape(item.get('summary', ''))[:200]
+    link     = item.link or '#'
+    summary  = _escape(item.summary)[:200]
 
     # Try to extract fields — RSS usually won't have all, so fallback gracefully
     exam_date   = _get(item, 'exam_date')
@@ -97,10 +98,10 @@ def template_exam_update(item: dict) -> tuple:
 # ─────────────────────────────────────────
 # TEMPLATE 2 — IMPORTANT ALERT
 # ─────────────────────────────────────────
-def template_alert(item: dict) -> tuple:
+def template_alert(item: JobItem) -> tuple:
     title   = _get(item, 'title', 'Important Alert')
-    summary = _escape(item.get('summary', ''))[:250]
-    link    = item.get('link', '#')
+    summary = _escape(item.summary)[:250]
+    link    = item.link or '#'
 
     text = (
         "⚠️━━━━━━━━━━━━━━━━━━━━━━━━⚠️\n"
@@ -127,10 +128,10 @@ def template_alert(item: dict) -> tuple:
 # ─────────────────────────────────────────
 # TEMPLATE 3 — RESULT OUT
 # ─────────────────────────────────────────
-def template_result(item: dict) -> tuple:
+def template_result(item: JobItem) -> tuple:
     title   = _get(item, 'title', 'Result Declared')
-    summary = _escape(item.get('summary', ''))[:250]
-    link    = item.get('link', '#')
+    summary = _escape(item.summary)[:250]
+    link    = item.link or '#'
 
     text = (
         "🎉━━━━━━━━━━━━━━━━━━━━━━━━🎉\n"
@@ -155,10 +156,10 @@ def template_result(item: dict) -> tuple:
 # ─────────────────────────────────────────
 # TEMPLATE 4 — ADMIT CARD
 # ─────────────────────────────────────────
-def template_admit_card(item: dict) -> tuple:
+def template_admit_card(item: JobItem) -> tuple:
     title   = _get(item, 'title', 'Admit Card Available')
-    summary = _escape(item.get('summary', ''))[:250]
-    link    = item.get('link', '#')
+    summary = _escape(item.summary)[:250]
+    link    = item.link or '#'
 
     text = (
         "🪪━━━━━━━━━━━━━━━━━━━━━━━━🪪\n"
@@ -186,10 +187,10 @@ def template_admit_card(item: dict) -> tuple:
 # ─────────────────────────────────────────
 # TEMPLATE 5 — GENERAL UPDATE
 # ─────────────────────────────────────────
-def template_general(item: dict) -> tuple:
+def template_general(item: JobItem) -> tuple:
     title   = _get(item, 'title', 'New Update')
-    summary = _escape(item.get('summary', ''))[:300]
-    link    = item.get('link', '#')
+    summary = _escape(item.summary)[:300]
+    link    = item.link or '#'
 
     text = (
         "📢━━━━━━━━━━━━━━━━━━━━━━━━📢\n"
@@ -212,10 +213,95 @@ def template_general(item: dict) -> tuple:
     return text, buttons
 
 
+# ─────────────────────────────────────────
+# TEMPLATE 6 — LAST DATE REMINDER
+# ─────────────────────────────────────────
+def template_reminder(job: dict, days_left: int) -> tuple:
+    """job is a row from the jobs table (see Database.claim_reminder)."""
+    title    = _escape(job.get('title') or 'Last Date Reminder')
+    link     = job.get('link') or '#'
+    deadline = datetime.strptime(job['deadline'], '%Y-%m-%d').strftime('%d %b %Y')
+    left     = "Aaj last date hai!" if days_left <= 0 else f"{days_left} day{'s' if days_left > 1 else ''} left"
+
+    text = (
+        "⏰━━━━━━━━━━━━━━━━━━━━━━━━⏰\n"
+        f"      ⏳ <b>{left.upper()}</b> ⏳\n"
+        "⏰━━━━━━━━━━━━━━━━━━━━━━━━⏰\n\n"
+        f"📋 <b>{title}</b>\n\n"
+        f"🏛️ <b>Authority:</b> {_escape(job.get('authority') or job.get('source') or 'Govt Update')}\n"
+        f"📅 <b>Last Date:</b> {deadline}\n\n"
+        "⚠️ Form abhi tak nahi bhara? Aaj hi apply karo!\n\n"
+        "💪 <i>Don't miss this opportunity!</i>"
+    )
+
+    buttons = [
+        [InlineKeyboardButton("🚀 Apply Now", url=link)]
+    ]
+    return text, buttons
+
+
+# ─────────────────────────────────────────
+# UPDATES TO AN EARLIER POST (UPDATE_MODE)
+# ─────────────────────────────────────────
+def mark_updated(text: str) -> str:
+    """UPDATE_MODE=edit: the new post replaces the old one in place, with a banner."""
+    return f"🔄 <b>UPDATED</b> — {datetime.now().strftime('%d %b %Y')}\n\n{text}"
+
+
+def template_update(item: JobItem) -> tuple:
+    """UPDATE_MODE=reply: short note threaded under the earlier post."""
+    title = _get(item, 'title', 'Update')
+    text = (
+        "🔄 <b>UPDATE</b>\n\n"
+        f"📋 <b>{title}</b>\n\n"
+        f"🏛️ {_source_line(item)} | 📅 {_date_line(item)}"
+    )
+    buttons = [
+        [InlineKeyboardButton("📖 Full Details 🔍", url=item.link or '#')]
+    ]
+    return text, buttons
+
+
+# ─────────────────────────────────────────
+# TEMPLATE 7 — DIGEST (many items, one category)
+# ─────────────────────────────────────────
+DIGEST_MAX_ITEMS = 10  # per message: keeps text under 4096 chars and the keyboard short
+
+DIGEST_HEADERS = {
+    "result":      "🎉 <b>RESULTS DECLARED</b>",
+    "admit_card":  "🎫 <b>ADMIT CARDS RELEASED</b>",
+    "last_date":   "⏳ <b>LAST DATE ALERTS</b>",
+    "exam_update": "📚 <b>EXAM UPDATES</b>",
+}
+
+
+def format_digest(items: list, category: str) -> tuple:
+    """Compact list of up to DIGEST_MAX_ITEMS items of one category, one button each."""
+    header = DIGEST_HEADERS.get(category, "📌 <b>NEW UPDATES</b>")
+    lines = [f"{header} — {len(items)} new\n"]
+    buttons = []
+    for n, item in enumerate(items, 1):
+        title = _get(item, 'title', 'New Update')
+        extra = []
+        last_date = _get(item, 'form_last_date')
+        if last_date != NOT_AVAILABLE:
+            extra.append(f"Last date: {last_date}")
+        seats = _get(item, 'seats')
+        if seats != NOT_AVAILABLE:
+            extra.append(f"Seats: {seats}")
+        lines.append(f"<b>{n}.</b> {title}")
+        lines.append(f"    🏛️ {_source_line(item)}" + (" | " + " | ".join(extra) if extra else ""))
+        label = item.title.strip()
+        buttons.append([InlineKeyboardButton(f"{n}. {label[:40]}{'…' if len(label) > 40 else ''}",
+                                             url=item.link or '#')])
+    lines.append("\n👇 <b>Details ke liye button dabao</b>")
+    return "\n".join(lines), buttons
+
+
 # ─────────────────────────────────────────
 # DISPATCHER
 # ─────────────────────────────────────────
-def format_message(item: dict, category: str) -> tuple:
+def format_message(item: JobItem, category: str) -> tuple:
     if category == "result":
         return template_result(item)
     elif category == "admit_card":
@@ -0,0 +1,58 @@
+import pytest
+
+from chat_registry import ChatRegistry
+from database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database()
+    db.db_path = str(tmp_path / "test.db")
+    db.init_db()
+    return db
+
+
+def test_writes_through_and_reloads(db):
+    registry = ChatRegistry(db)
+    registry.load()
+    registry.add(-1001, "Jobs", "channel")
+    registry.add(-1002, "Group", "supergroup")
+    registry.set_digest(-1002, True)
+    registry.remove(-1001)
+    assert [c.chat_id for c in registry.chats] == [-1002]
+
+    fresh = ChatRegistry(db)
+    fresh.load()
+    assert fresh.chats == registry.chats
+    assert fresh.chats[0].digest
+
+
+def test_snapshot_is_stable_while_chats_change(db):
+    registry = ChatRegistry(db)
+    registry.load()
+    registry.add(1, "a", "group")
+    snapshot = registry.chats
+    registry.add(2, "b", "group")
+    registry.remove(1)
+    assert [c.chat_id for c in snapshot] == [1]
+    assert 2 in registry and 1 not in registry
+    assert len(registry) == 1
+
+
+def test_re_adding_keeps_digest(db):
+    registry = ChatRegistry(db)
+    registry.load()
+    registry.add(1, "a", "group")
+    registry.set_digest(1, True)
+    registry.add(1, "renamed", "group")
+    assert registry.chats[0].digest and registry.chats[0].title == "renamed"
+
+
+def test_load_picks_up_changes_from_another_instance(db):
+    ours, theirs = ChatRegistry(db), ChatRegistry(db)
+    ours.load()
+    theirs.load()
+    theirs.add(5, "added elsewhere", "group")
+    assert 5 not in ours
+    ours.load()
+    assert 5 in ours
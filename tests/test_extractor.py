@@ -0,0 +1,28 @@
+import time
+
+import pytest
+
+from extractor import clean_page, process_page
+
+
+def test_clean_page_strips_layout_blocks_and_markup():
+    html = ("<HEADER>site</header><nav class='top'>menu</NAV><p>Total <b>600</b> posts</p>"
+            "<script>var x = '<p>';</script><navbar>kept</navbar>")
+    assert clean_page(html) == "Total 600 posts kept"
+
+
+def test_clean_page_keeps_text_after_an_unclosed_block():
+    assert clean_page("<header>a</header>b<script>never closed c <style>s</style>d") == "b never closed c d"
+
+
+@pytest.mark.parametrize("hostile", ["<script " * 40000, "<" * 300000, "<style" * 50000, "<a " * 100000])
+def test_clean_page_is_linear_on_hostile_input(hostile):
+    started = time.process_time()
+    clean_page(hostile)
+    assert time.process_time() - started < 1
+
+
+def test_process_page_caps_cleanup():
+    page = "<p>Total Vacancies: 1200</p>" + "<script " * 200000
+    _, details, _ = process_page(page, "SSC CGL 2025", "", guarded=True)
+    assert details['seats'].startswith("1200")
@@ -0,0 +1,21 @@
+import pytest
+
+from feed_stream import _parse_time
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Mon, 07 Jul 2025 10:30:00 +0000", (2025, 7, 7, 10, 30, 0)),
+    ("Mon, 07 Jul 2025 16:00:00 +0530", (2025, 7, 7, 10, 30, 0)),   # converted to UTC
+    ("Mon, 07 Jul 2025 10:30:00 GMT", (2025, 7, 7, 10, 30, 0)),
+    ("2025-07-07T10:30:00Z", (2025, 7, 7, 10, 30, 0)),
+    ("2025-07-07T16:00:00+05:30", (2025, 7, 7, 10, 30, 0)),
+    ("2025-07-07T10:30:00", (2025, 7, 7, 10, 30, 0)),               # naive: taken as is
+    ("  2025-07-07  ", (2025, 7, 7, 0, 0, 0)),
+])
+def test_parse_time(text, expected):
+    assert tuple(_parse_time(text)[:6]) == expected
+
+
+@pytest.mark.parametrize("text", ["", None, "yesterday", "32 Jul 2025"])
+def test_parse_time_invalid(text):
+    assert _parse_time(text) is None
@@ -0,0 +1,63 @@
+import pytest
+
+from database import Database
+from leader import LeaderLease
+
+INTERVAL = 900
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database()
+    db.db_path = str(tmp_path / "test.db")
+    db.init_db()
+    return db
+
+
+@pytest.fixture
+def leases():
+    started = []
+
+    def make(db, holder):
+        lease = LeaderLease(db, holder=holder, ttl=30).start()
+        started.append(lease)
+        return lease
+
+    yield make
+    for lease in started:
+        lease.stop()
+
+
+def test_fresh_leader_may_fetch_right_away(db, leases):
+    old = leases(db, "old")
+    old.mark_cycle()
+    old.stop()  # graceful restart: the lease is released, the schedule stays
+
+    new = leases(db, "new")
+    assert new.is_leader and new.led_from_start
+    assert new.cycle_due_in(INTERVAL, first=True) <= 0
+    assert new.cycle_due_in(INTERVAL) > INTERVAL - 5
+
+
+def test_takeover_continues_the_stored_schedule(db, leases):
+    leader = leases(db, "a")
+    standby = leases(db, "b")
+    assert leader.is_leader and not standby.is_leader
+    leader.mark_cycle()
+
+    leader.stop()
+    assert standby.renew()
+    assert standby.is_leader and not standby.led_from_start
+    # Its first cycle still waits for the interval the old leader started
+    assert standby.cycle_due_in(INTERVAL, first=True) > INTERVAL - 5
+
+
+def test_no_stored_cycle_is_due_now(db, leases):
+    assert leases(db, "a").cycle_due_in(INTERVAL) <= 0
+
+
+def test_mark_cycle_only_while_holding_the_lease(db, leases):
+    leader = leases(db, "a")
+    standby = leases(db, "b")
+    assert leader.mark_cycle()
+    assert not standby.mark_cycle()
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+import membership
+from membership import MembershipCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class _Member:
+    def __init__(self, status):
+        self.status = status
+
+
+class _Bot:
+    def __init__(self, members=(), delay=0.0):
+        self.members = set(members)
+        self.delay = delay
+        self.calls = 0
+
+    async def get_chat_member(self, channel, uid):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return _Member("member" if uid in self.members else "left")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(membership, "time", clock)
+    return clock
+
+
+def _cache(**kw):
+    kw.setdefault("refresh", False)
+    return MembershipCache("@chan", **kw)
+
+
+def test_member_cached_until_ttl(clock):
+    cache, bot = _cache(ttl=60, negative_ttl=5), _Bot({1})
+
+    async def run():
+        assert await cache.check(bot, 1)
+        clock.now += 59
+        assert await cache.check(bot, 1)
+        assert bot.calls == 1
+        clock.now += 1
+        assert await cache.check(bot, 1)
+        assert bot.calls == 2
+
+    asyncio.run(run())
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_non_member_uses_short_ttl_and_fresh_bypasses_it(clock):
+    cache, bot = _cache(ttl=60, negative_ttl=5), _Bot()
+
+    async def run():
+        assert not await cache.check(bot, 1)
+        assert not await cache.check(bot, 1)
+        assert bot.calls == 1
+        bot.members.add(1)  # joined, then pressed Verify
+        assert await cache.check(bot, 1, fresh=True)
+        assert bot.calls == 2
+        # A cached "yes" is trusted even with fresh=True
+        assert await cache.check(bot, 1, fresh=True)
+        assert bot.calls == 2
+
+    asyncio.run(run())
+
+
+def test_lru_evicts_least_recently_used(clock):
+    cache, bot = _cache(maxsize=2), _Bot({1, 2, 3})
+
+    async def run():
+        await cache.check(bot, 1)
+        await cache.check(bot, 2)
+        await cache.check(bot, 1)  # 2 is now the oldest
+        await cache.check(bot, 3)
+        assert len(cache) == 2
+        calls = bot.calls
+        await cache.check(bot, 1)
+        assert bot.calls == calls
+        await cache.check(bot, 2)
+        assert bot.calls == calls + 1
+
+    asyncio.run(run())
+
+
+def test_concurrent_lookups_share_one_call(clock):
+    cache, bot = _cache(), _Bot({7}, delay=0.05)
+
+    async def run():
+        return await asyncio.gather(*(cache.check(bot, 7) for _ in range(10)))
+
+    assert asyncio.run(run()) == [True] * 10
+    assert bot.calls == 1
+
+
+def test_api_error_is_not_cached(clock):
+    cache = _cache()
+
+    class _Down:
+        calls = 0
+
+        async def get_chat_member(self, channel, uid):
+            self.calls += 1
+            raise RuntimeError("timeout")
+
+    bot = _Down()
+
+    async def run():
+        assert not await cache.check(bot, 1)
+        assert not await cache.check(bot, 1)
+
+    asyncio.run(run())
+    assert bot.calls == 2
+    assert len(cache) == 0
+
+
+def test_invalidate(clock):
+    cache, bot = _cache(), _Bot({1})
+
+    async def run():
+        await cache.check(bot, 1)
+        cache.invalidate(1)
+        await cache.check(bot, 1)
+
+    asyncio.run(run())
+    assert bot.calls == 2
+
+
+def test_member_refreshed_in_background_near_expiry(clock):
+    cache, bot = _cache(ttl=100, refresh=True), _Bot({1})
+
+    async def run():
+        await cache.check(bot, 1)
+        clock.now += 85
+        assert await cache.check(bot, 1)  # answered from cache...
+        assert len(cache._refreshes) == 1  # ...with the refresh task referenced...
+        await asyncio.sleep(0)            # ...while it runs
+        assert bot.calls == 2
+        await asyncio.sleep(0)            # done callbacks run on the next loop pass
+        assert not cache._refreshes
+        clock.now += 50  # past the original TTL, inside the refreshed one
+        assert await cache.check(bot, 1)
+        assert bot.calls == 2
+
+    asyncio.run(run())
@@ -0,0 +1,25 @@
+import pickle
+
+from models import JobItem, NOT_AVAILABLE, NOT_RELEASED
+
+
+def test_defaults_are_shared_objects():
+    item = JobItem("1", "t", "https://x")
+    assert item.fee is NOT_AVAILABLE
+    assert item.admit_card_status is NOT_RELEASED
+    assert item.authority == ""  # falls back to the source
+
+
+def test_unpickled_defaults_map_back_to_the_shared_constants():
+    # What comes back from a spawn-pool worker: equal strings, not the same objects
+    details = pickle.loads(pickle.dumps({'fee': "Not Available", 'admit_card_status': "Not Released Yet"}, 0))
+    assert details['fee'] == NOT_AVAILABLE and details['fee'] is not NOT_AVAILABLE
+    item = JobItem("1", "t", "https://x", source="SSC", **details)
+    assert item.fee is NOT_AVAILABLE
+    assert item.admit_card_status is NOT_RELEASED
+    assert item.authority == "SSC"
+
+
+def test_extracted_values_are_kept():
+    item = JobItem("1", "t", "https://x", fee="₹100", seats="600")
+    assert (item.fee, item.seats) == ("₹100", "600")
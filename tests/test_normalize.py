@@ -0,0 +1,86 @@
+from datetime import date
+
+import pytest
+
+from normalize import job_key, parse_date, parse_dates, parse_seats, title_similarity
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Last date: 2025-07-04", date(2025, 7, 4)),
+    ("Apply by 04/07/2025", date(2025, 7, 4)),     # day-first
+    ("till 4-7-25", date(2025, 7, 4)),
+    ("22.10.2025 (till 6 PM)", date(2025, 10, 22)),
+    ("4th July, 2025", date(2025, 7, 4)),
+    ("July 4, 2025", date(2025, 7, 4)),
+    ("15 Sept 2025", date(2025, 9, 15)),
+    ("31/02/2025", None),                          # not a real day
+    ("Not Available", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_date(text, expected):
+    assert parse_date(text) == expected
+
+
+def test_parse_date_latest_for_extended_dates():
+    text = "Last date 10/03/2025, extended to 24 March 2025"
+    assert parse_dates(text) == [date(2025, 3, 10), date(2025, 3, 24)]
+    assert parse_date(text) == date(2025, 3, 10)
+    assert parse_date(text, latest=True) == date(2025, 3, 24)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("14,582 posts", 14582),
+    ("Total: 600 Vacancies", 600),
+    ("1 post", 1),
+    ("0", None),
+    ("Not Available", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_seats(text, expected):
+    assert parse_seats(text) == expected
+
+
+@pytest.mark.parametrize("a, b", [
+    ("SSC CGL 2025 Notification Out for 14582 Posts", "SSC CGL Admit Card 2025 Released"),
+    ("IBPS PO 2025 Last Date Extended", "IBPS PO Result 2025 Declared"),
+])
+def test_job_key_same_job_across_updates(a, b):
+    assert job_key(a) == job_key(b) is not None
+
+
+@pytest.mark.parametrize("a, b", [
+    # Used to collide on "aiims delhi walk in" (subject cut at 4 words)
+    ("AIIMS Delhi Walk In Senior Resident 2025", "AIIMS Delhi Walk In Junior Resident 2025"),
+    # Used to collide on "sbi clerk" (years dropped)
+    ("SBI Clerk 2025 Notification", "SBI Clerk 2026 Notification"),
+    ("Indian Army Agniveer Recruitment 2025", "Indian Army Agniveer Result 2024"),
+    ("SSC CGL Tier 2 Result 2025", "SSC CGL Tier 1 Result 2025"),
+])
+def test_job_key_different_jobs(a, b):
+    assert job_key(a) != job_key(b)
+
+
+def test_job_key_keeps_years_and_subject_numbers():
+    assert job_key("SSC CGL Tier 2 Answer Key 2025") == "ssc cgl tier 2 2025"
+    assert job_key("SBI PO 2025 Notification for 600 Posts") == "sbi po 2025"
+
+
+@pytest.mark.parametrize("title", [
+    "Indian Army Agniveer Recruitment",  # no year: can't tell one intake from the next
+    "Result 2025 Declared",              # no subject
+    "UPSC 2025 Notification",            # one-word subject
+    "",
+    None,
+])
+def test_job_key_too_vague(title):
+    assert job_key(title) is None
+
+
+def test_title_similarity():
+    assert title_similarity("SSC CGL 2025 Notification Out", "SSC CGL Admit Card 2025 Released") == 1.0
+    # Seat counts don't count against an update
+    assert title_similarity("SBI PO 2025 for 600 Posts", "SBI PO 2025 Result") == 1.0
+    assert title_similarity("SBI Clerk 2025", "SBI Clerk 2026") == 0.5
+    assert title_similarity("", "SBI Clerk 2025") == 0.0
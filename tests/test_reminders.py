@@ -0,0 +1,70 @@
+import threading
+import time
+from datetime import datetime, date, timedelta
+
+from config import REMINDER_DAYS_BEFORE, REMINDER_HOUR
+from reminders import DeadlineQueue, reminder_time
+
+
+class _DeadlinesDB:
+    def __init__(self, rows):
+        self.rows = rows  # [(job_id, remind_at)]
+        self.asked_until = None
+
+    def get_pending_deadlines(self, until):
+        self.asked_until = until
+        return [r for r in self.rows if r[1] <= until]
+
+
+def test_reminder_time():
+    now = datetime(2025, 7, 1, 12)
+    at = reminder_time(date(2025, 7, 10), now)
+    assert at == datetime(2025, 7, 10, REMINDER_HOUR) - timedelta(days=REMINDER_DAYS_BEFORE)
+    assert reminder_time(date(2025, 7, 1), now) is None
+    assert reminder_time(None, now) is None
+
+
+def test_refill_loads_only_the_horizon_and_pops_due_in_order():
+    now = datetime.now()
+    db = _DeadlinesDB([
+        ("b", now - timedelta(minutes=1)),
+        ("a", now - timedelta(minutes=5)),
+        ("later", now + timedelta(hours=2)),
+        ("next_week", now + timedelta(days=7)),
+    ])
+    queue = DeadlineQueue(db, horizon_hours=24)
+    queue.refill()
+    assert len(queue) == 3
+    assert not queue.needs_refill()
+    due = queue.wait_due(max_wait=0)
+    assert [job_id for _, job_id in due] == ["a", "b"]
+    assert len(queue) == 1
+
+
+def test_push_dedups_and_ignores_beyond_horizon():
+    now = datetime.now()
+    queue = DeadlineQueue(_DeadlinesDB([]), horizon_hours=24)
+    queue.refill()
+    soon = now + timedelta(hours=1)
+    queue.push("x", soon)
+    queue.push("x", soon)
+    queue.push("far", now + timedelta(days=3))  # the refill that covers it loads it from the DB
+    assert len(queue) == 1
+
+
+def test_needs_refill_before_first_load():
+    assert DeadlineQueue(_DeadlinesDB([])).needs_refill()
+
+
+def test_wait_due_wakes_on_push():
+    queue = DeadlineQueue(_DeadlinesDB([]), horizon_hours=24)
+    queue.refill()
+    got = []
+    waiter = threading.Thread(target=lambda: got.extend(queue.wait_due(max_wait=5)))
+    started = time.monotonic()
+    waiter.start()
+    time.sleep(0.05)
+    queue.push("now", datetime.now())
+    waiter.join(2)
+    assert [job_id for _, job_id in got] == ["now"]
+    assert time.monotonic() - started < 2
@@ -0,0 +1,63 @@
+from chat_registry import Chat
+from routing import Router, validate
+
+CHATS = [Chat(1, "all", "group", False), Chat(2, "bihar results", "group", False),
+         Chat(3, "ssc", "channel", False), Chat(4, "bank po", "group", False)]
+
+RULES = {
+    2: {'category': {'result'}, 'state': {'bihar'}},
+    3: {'authority': {'ssc', 'railway'}},
+    4: {'keyword': {'bank po'}},
+}
+
+
+def _ids(chats):
+    return [c.chat_id for c in chats]
+
+
+def test_no_rules_routes_to_everyone():
+    assert Router().route(CHATS, "SSC CGL 2025 Notification", "", "exam_update") == CHATS
+
+
+def test_kinds_are_anded():
+    router = Router(RULES)
+    assert _ids(router.route(CHATS, "Bihar Police Constable Result 2025", "", "result")) == [1, 2]
+    # Right state, wrong category
+    assert _ids(router.route(CHATS, "Bihar Police Constable Admit Card 2025", "", "admit_card")) == [1]
+
+
+def test_values_within_a_kind_are_ored():
+    router = Router(RULES)
+    assert _ids(router.route(CHATS, "SSC CGL 2025 Notification", "", "exam_update")) == [1, 3]
+    assert _ids(router.route(CHATS, "RRB NTPC 2025 Notification", "", "exam_update")) == [1, 3]
+
+
+def test_keyword_matches_phrase_in_summary():
+    router = Router(RULES)
+    routed = router.route(CHATS, "IBPS 2025 Notification", "Apply for Bank PO and Clerk posts", "exam_update")
+    assert _ids(routed) == [1, 4]
+    # Both words, but not as a phrase
+    routed = router.route(CHATS, "IBPS 2025 Notification", "Bank of Baroda PO", "exam_update")
+    assert _ids(routed) == [1]
+
+
+def test_chats_with_empty_rules_get_everything():
+    router = Router({5: {'category': set()}})
+    assert router.filtered_chats == set()
+    assert router.route(CHATS, "Anything", "", "general") == CHATS
+
+
+def test_validate():
+    assert validate('category', 'Admit Card') == 'admit_card'
+    assert validate('category', 'nonsense') is None
+    assert validate('state', 'Uttar  Pradesh') == 'uttar pradesh'
+    assert validate('authority', 'SSC') == 'ssc'
+    assert validate('keyword', 'one two three four') is None
+
+
+def test_multi_word_state_routes():
+    rules = {6: {'state': {validate('state', 'Dadra and Nagar Haveli')}}, 7: {'state': {'uttar pradesh'}}}
+    router = Router(rules)
+    chats = [Chat(6, "dnh", "group", False), Chat(7, "up", "group", False)]
+    assert _ids(router.route(chats, "Dadra and Nagar Haveli Teacher Recruitment 2025", "", "exam_update")) == [6]
+    assert _ids(router.route(chats, "UPSSSC PET 2025", "Uttar Pradesh candidates", "exam_update")) == [7]
@@ -0,0 +1,91 @@
+import threading
+import time
+
+from perf import CycleTimer
+from rss_fetcher import RSSFetcher, SingleFlight
+
+
+def _rss(titles) -> str:
+    items = "".join(
+        f"<item><title>{t}</title><link>https://example.org/{i}</link><description>d</description></item>"
+        for i, t in enumerate(titles)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'
+
+
+class _PostedDB:
+    def __init__(self, posted=()):
+        self.posted = set(posted)
+
+    def is_posted(self, item_id):
+        return item_id in self.posted
+
+
+def test_stream_feed_skips_posted_entries_up_to_limit(tmp_path):
+    feed = tmp_path / "feed.xml"
+    feed.write_text(_rss(["A", "B", "C", "D", "E"]))
+    fetcher = RSSFetcher()
+    # B went out last cycle; C and D behind it are still unposted and must be read
+    posted_b = fetcher._generate_id({'link': "https://example.org/1", 'title': "B"})
+    fetcher.db = _PostedDB({posted_b})
+    read, fresh = fetcher._stream_feed(feed.as_uri(), "Test", CycleTimer(), limit=4, timeout=5)
+    assert read == 4
+    assert [entry.get('title') for _, entry in fresh] == ["A", "C", "D"]
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def slow(key):
+        calls.append(key)
+        started.set()
+        time.sleep(0.1)
+        return key.upper()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("a", slow, "a"))) for _ in range(5)]
+    threads[0].start()
+    started.wait(1)
+    for t in threads[1:]:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == ["a"]
+    assert results == ["A"] * 5
+
+
+def test_single_flight_runs_again_after_completion():
+    flight = SingleFlight()
+    calls = []
+    assert flight.do("k", lambda: calls.append(1) or len(calls)) == 1
+    assert flight.do("k", lambda: calls.append(1) or len(calls)) == 2
+
+
+def test_single_flight_shares_the_exception():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def boom():
+        started.set()
+        release.wait(1)
+        raise ValueError("down")
+
+    def call():
+        try:
+            flight.do("x", boom)
+        except ValueError as e:
+            errors.append(str(e))
+
+    first = threading.Thread(target=call)
+    first.start()
+    started.wait(1)
+    second = threading.Thread(target=call)
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join()
+    second.join()
+    assert errors == ["down", "down"]
@@ -0,0 +1,77 @@
+"""
+Webhook mode (BOT_MODE=webhook): an embedded aiohttp server receives updates
+instead of long-polling getUpdates.
+
+    POST /telegram   Telegram → bot updates (checked against WEBHOOK_SECRET)
+    GET  /health     200 + JSON once the bot is running (Railway healthcheck)
+
+The bot registers <WEBHOOK_URL>/telegram with setWebhook on start and only
+subscribes to the update types it has handlers for.
+"""
+import hashlib
+import logging
+import time
+from aiohttp import web
+from telegram import Update
+from config import BOT_TOKEN, WEBHOOK_URL, WEBHOOK_SECRET, PORT
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = "/telegram"
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def webhook_secret() -> str:
+    # Telegram allows A-Z a-z 0-9 _ - ; derive a stable one if none is configured
+    return WEBHOOK_SECRET or hashlib.sha256(BOT_TOKEN.encode()).hexdigest()[:32]
+
+
+def build_web_app(application, secret: str) -> web.Application:
+    started = time.monotonic()
+
+    async def telegram(request: web.Request) -> web.Response:
+        if request.headers.get(SECRET_HEADER) != secret:
+            return web.Response(status=403)
+        try:
+            update = Update.de_json(await request.json(), application.bot)
+        except Exception as e:
+            logger.warning(f"Bad webhook payload: {e}")
+            return web.Response(status=400)
+        await application.update_queue.put(update)
+        return web.Response()
+
+    async def health(request: web.Request) -> web.Response:
+        ok = application.running
+        return web.json_response(
+            {"ok": ok, "uptime_sec": int(time.monotonic() - started), "pending_updates": application.update_queue.qsize()},
+            status=200 if ok else 503,
+        )
+
+    app = web.Application()
+    app.router.add_post(WEBHOOK_PATH, telegram)
+    app.router.add_get("/health", health)
+    return app
+
+
+async def run_webhook(application, allowed_updates: list, stop_event):
+    """Serve until stop_event is set; the Application must be built with updater(None)."""
+    if not WEBHOOK_URL:
+        raise RuntimeError("BOT_MODE=webhook needs WEBHOOK_URL (public https base URL)")
+    secret = webhook_secret()
+    runner = web.AppRunner(build_web_app(application, secret), access_log=None)
+    async with application:
+        if application.post_init:
+            await application.post_init(application)
+        await application.start()
+        await runner.setup()
+        await web.TCPSite(runner, "0.0.0.0", PORT).start()
+        url = WEBHOOK_URL.rstrip("/") + WEBHOOK_PATH
+        await application.bot.set_webhook(
+            url=url, allowed_updates=allowed_updates, secret_token=secret, drop_pending_updates=False,
+        )
+        logger.info(f"🌐 Webhook listening on :{PORT}{WEBHOOK_PATH} → {url}")
+        try:
+            await stop_event.wait()
+        finally:
+            await runner.cleanup()
+            await application.stop()